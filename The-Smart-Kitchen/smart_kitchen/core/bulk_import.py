@@ -0,0 +1,378 @@
+"""
+Bulk input files for the algorithm demonstrations: CSV, JSON and whitespace-delimited text
+"""
+import json
+import os
+import sys
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.scheduling import check_job
+
+# File types offered by the import dialog
+IMPORT_FILETYPES = [
+    ("Workload files", "*.json *.csv *.txt *.dat"),
+    ("JSON Files", "*.json"),
+    ("CSV Files", "*.csv"),
+    ("Text Files", "*.txt *.dat"),
+]
+
+
+def is_json_file(path):
+    """Return True if the file is JSON, judged by its extension."""
+    return os.path.splitext(path)[1].lower() == ".json"
+
+
+def read_text(path):
+    """
+    Read a text or CSV file with commas turned into spaces and comments removed.
+
+    The comma replacement is a single pass over the whole file, so CSV and
+    whitespace-delimited files parse the same way. Lines starting with
+    ``#`` are comments; they become blank so line numbers are kept.
+    """
+    with open(path, "r") as f:
+        text = f.read().replace(",", " ")
+    if "#" in text:
+        text = "\n".join(
+            "" if line.lstrip().startswith("#") else line for line in text.splitlines()
+        )
+    return text
+
+
+def read_lines(path):
+    """
+    Read the lines of a text or CSV file as fields.
+
+    Returns:
+        list: (line number, fields) per line, with blank lines kept as
+        empty field lists so callers can split the file into blocks
+    """
+    return [(line_no, line.split()) for line_no, line in enumerate(read_text(path).splitlines(), 1)]
+
+
+def parse_number(token, line_no):
+    """Convert a field to an int, or a float if it is not integral."""
+    if isinstance(token, (int, float)) and not isinstance(token, bool):
+        return token
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"Line {line_no}: {token!r} is not a number") from None
+
+
+def int_row(fields, line_no):
+    """Convert a row of fields to ints."""
+    try:
+        return list(map(int, fields))
+    except ValueError:
+        raise ValueError(f"Line {line_no}: expected whole numbers") from None
+
+
+def read_blocks(path):
+    """
+    Split a text or CSV file into blocks of integer rows separated by blank lines.
+
+    Returns:
+        list: Blocks, each a list of (line number, row) pairs
+    """
+    blocks = []
+    current = []
+    for line_no, fields in read_lines(path):
+        if not fields:
+            if current:
+                blocks.append(current)
+                current = []
+            continue
+        current.append((line_no, int_row(fields, line_no)))
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def check_matrix(name, matrix, rows, columns):
+    """Raise ValueError unless the matrix has the given shape."""
+    if len(matrix) != rows:
+        raise ValueError(f"{name} has {len(matrix)} rows, expected {rows}")
+    for i, row in enumerate(matrix):
+        if len(row) != columns:
+            raise ValueError(f"{name} row {i} has {len(row)} values, expected {columns}")
+
+
+def load_banker_input(path):
+    """
+    Load a Banker's algorithm state.
+
+    JSON files hold an object with ``available``, ``max`` (or
+    ``max_needs``, as in saved scenarios) and ``allocated``. Text and CSV
+    files hold three blocks separated by blank lines: the available
+    vector on one line, the maximum matrix and the allocation matrix, one
+    process per line.
+
+    Returns:
+        (list, list, list): Available vector, maximum matrix and allocation matrix
+    """
+    if is_json_file(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        available = data.get("available")
+        max_matrix = data.get("max", data.get("max_needs"))
+        allocated = data.get("allocated")
+        if available is None or max_matrix is None or allocated is None:
+            raise ValueError("Expected 'available', 'max' and 'allocated'")
+    else:
+        blocks = read_blocks(path)
+        if len(blocks) != 3:
+            raise ValueError(
+                f"Expected 3 blocks (available, max, allocated) separated by blank lines, found {len(blocks)}"
+            )
+        if len(blocks[0]) != 1:
+            raise ValueError(f"Line {blocks[0][1][0]}: the available vector must be a single line")
+        available = blocks[0][0][1]
+        max_matrix = [row for _, row in blocks[1]]
+        allocated = [row for _, row in blocks[2]]
+
+    n, m = len(max_matrix), len(available)
+    check_matrix("Max matrix", max_matrix, n, m)
+    check_matrix("Allocated matrix", allocated, n, m)
+    if any(x < 0 for x in available):
+        raise ValueError("Available resources must not be negative")
+    for i, (max_row, alloc_row) in enumerate(zip(max_matrix, allocated)):
+        if any(a < 0 or a > c for a, c in zip(alloc_row, max_row)):
+            raise ValueError(f"P{i}: allocation must be between 0 and the maximum")
+    return available, max_matrix, allocated
+
+
+def load_reference_string(path):
+    """
+    Load a page reference string.
+
+    JSON files hold a list of pages, or an object with ``references``
+    and optionally ``frames``. Text and CSV files hold the pages
+    separated by whitespace, commas or newlines.
+
+    Returns:
+        (list, int): Page references, and the number of frames (None if not given)
+    """
+    frames = None
+    if is_json_file(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            frames = data.get("frames")
+            data = data.get("references")
+        if not isinstance(data, list):
+            raise ValueError("Expected a list of page references")
+        references = data
+    else:
+        tokens = read_text(path).split()
+        try:
+            references = list(map(int, tokens))
+        except ValueError:
+            references = tokens
+    if not references:
+        raise ValueError("The reference string is empty")
+    if frames is not None and (not isinstance(frames, int) or frames < 1):
+        raise ValueError("'frames' must be a positive integer")
+    return references, frames
+
+
+def number_column(tokens):
+    """Convert a column of fields to ints, or floats if any is not integral."""
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        pass
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        bad = next(token for token in tokens if not is_number(token))
+        raise ValueError(f"{bad!r} is not a number") from None
+
+
+def is_number(token):
+    """Return True if the field parses as a number."""
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def load_jobs(path):
+    """
+    Load jobs for the FCFS demonstration.
+
+    JSON files hold a list of jobs, or an object with ``jobs`` and
+    optionally ``stations``. A job is an object with ``arrival``,
+    ``burst`` and optionally ``id``, or a list ``[id, arrival, burst]``
+    or ``[arrival, burst]``. Text and CSV files hold one job per line in
+    the same list forms; a first line that is not numeric is a header.
+    Jobs without an ID are named P1, P2, ... in file order.
+
+    Text and CSV files are parsed by columns: the whole file is split once
+    and every column converted with a single ``map``, instead of parsing
+    line by line.
+
+    Returns:
+        (list, int): (id, arrival, burst) jobs, and the number of stations (None if not given)
+    """
+    if not is_json_file(path):
+        return load_job_columns(path), None
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    stations = None
+    if isinstance(data, dict):
+        stations = data.get("stations")
+        data = data.get("jobs")
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of jobs")
+    if stations is not None and (not isinstance(stations, int) or stations < 1):
+        raise ValueError("'stations' must be a positive integer")
+
+    jobs = []
+    for i, job in enumerate(data, 1):
+        if isinstance(job, dict):
+            job = [job.get("id"), job.get("arrival"), job.get("burst")]
+        if not isinstance(job, list) or len(job) not in (2, 3):
+            raise ValueError(f"Job {i}: expected an object, [arrival, burst] or [id, arrival, burst]")
+        job_id, arrival, burst = job if len(job) == 3 else [None] + job
+        if arrival is None or burst is None:
+            raise ValueError(f"Job {i}: missing arrival or burst")
+        job_id = f"P{i}" if job_id is None else str(job_id)
+        arrival = parse_number(arrival, i)
+        burst = parse_number(burst, i)
+        check_job(job_id, arrival, burst)
+        jobs.append((job_id, arrival, burst))
+    if not jobs:
+        raise ValueError("No jobs found")
+    return jobs, stations
+
+
+def load_job_columns(path):
+    """Load (id, arrival, burst) jobs from a text or CSV file, column by column."""
+    text = read_text(path).strip()
+    if not text:
+        raise ValueError("No jobs found")
+    first_line, _, rest = text.partition("\n")
+    if not is_number(first_line.split()[-1]):
+        text = rest  # Header row
+        first_line = text.lstrip().partition("\n")[0]
+    width = len(first_line.split())
+    if width not in (2, 3):
+        raise ValueError("Expected 'arrival burst' or 'id arrival burst' on each line")
+
+    tokens = text.split()
+    lines = sum(1 for line in text.splitlines() if line.strip())
+    if not tokens or len(tokens) != width * lines:
+        raise ValueError(f"Every line must hold {width} fields")
+    if width == 3:
+        ids = tokens[0::3]
+    else:
+        ids = [f"P{i}" for i in range(1, lines + 1)]
+    arrivals = number_column(tokens[width - 2::width])
+    bursts = number_column(tokens[width - 1::width])
+    if min(arrivals) < 0 or min(bursts) <= 0:
+        for job in zip(ids, arrivals, bursts):
+            check_job(*job)
+    return list(zip(ids, arrivals, bursts))
+
+
+def load_rag_input(path):
+    """
+    Load a resource allocation graph.
+
+    JSON files hold an object with ``requests`` (``[process, resource]``
+    pairs), ``assignments`` (``[resource, process]`` pairs) and optionally
+    ``processes``, ``resources`` and ``instances`` (a list aligned with
+    ``resources`` or an object by resource name). Text and CSV files hold
+    one record per line::
+
+        request P1 R1
+        assign R1 P2
+        instances R1 2
+
+    Processes and resources not listed explicitly are taken from the
+    edges in order of first appearance, and resources default to one
+    instance.
+
+    Returns:
+        dict: ``processes``, ``resources``, ``instances``, ``requests`` and ``assignments``
+    """
+    processes = []
+    resources = []
+    instance_counts = {}
+    requests = []
+    assignments = []
+    if is_json_file(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        processes = [str(p) for p in data.get("processes", [])]
+        resources = [str(r) for r in data.get("resources", [])]
+        instances = data.get("instances", {})
+        if isinstance(instances, list):
+            if len(instances) != len(resources):
+                raise ValueError("'instances' must have one count per resource")
+            instances = dict(zip(resources, instances))
+        instance_counts = {str(r): k for r, k in instances.items()}
+        try:
+            requests = [(str(p), str(r)) for p, r in data.get("requests", [])]
+            assignments = [(str(r), str(p)) for r, p in data.get("assignments", [])]
+        except (TypeError, ValueError):
+            raise ValueError("Edges must be pairs of names") from None
+    else:
+        for line_no, fields in read_lines(path):
+            if not fields:
+                continue
+            kind = fields[0].lower()
+            if len(fields) != 3 or kind not in ("request", "assign", "instances"):
+                raise ValueError(
+                    f"Line {line_no}: expected 'request P R', 'assign R P' or 'instances R k'"
+                )
+            if kind == "request":
+                requests.append((fields[1], fields[2]))
+            elif kind == "assign":
+                assignments.append((fields[1], fields[2]))
+            else:
+                instance_counts[fields[1]] = parse_number(fields[2], line_no)
+
+    process_set = set(processes)
+    resource_set = set(resources)
+    for p, r in requests:
+        if p not in process_set:
+            process_set.add(p)
+            processes.append(p)
+        if r not in resource_set:
+            resource_set.add(r)
+            resources.append(r)
+    for r, p in assignments:
+        if r not in resource_set:
+            resource_set.add(r)
+            resources.append(r)
+        if p not in process_set:
+            process_set.add(p)
+            processes.append(p)
+    for r in instance_counts:
+        if r not in resource_set:
+            resource_set.add(r)
+            resources.append(r)
+
+    both = process_set & resource_set
+    if both:
+        raise ValueError(f"Names used as both process and resource: {', '.join(sorted(both))}")
+    instances = [instance_counts.get(r, 1) for r in resources]
+    if any(not isinstance(k, int) or k < 1 for k in instances):
+        raise ValueError("Resource instances must be positive integers")
+    return {
+        "processes": processes,
+        "resources": resources,
+        "instances": instances,
+        "requests": requests,
+        "assignments": assignments,
+    }
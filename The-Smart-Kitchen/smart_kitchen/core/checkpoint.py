@@ -0,0 +1,119 @@
+"""
+Simulation checkpoints and what-if branches
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class SimulationCheckpoint:
+    """
+    Immutable snapshot of a KitchenSimulationEngine.
+
+    Matrices are stored as tuples of row tuples. When a checkpoint is taken
+    from an engine that was checkpointed before, rows that did not change
+    are shared with the previous checkpoint instead of being stored again,
+    so a series of checkpoints costs memory in proportion to what changed.
+    """
+
+    def __init__(self, scenario, mode, step, deadlock_detected, available,
+                 max_resources, allocated, equipment_totals, staff_tasks,
+                 task_progress, rng_state, utilization, metrics, workload=None,
+                 task_policy=None):
+        """Store the engine state; use KitchenSimulationEngine.checkpoint() to build one."""
+        self.scenario = scenario
+        self.mode = mode
+        self.step = step
+        self.deadlock_detected = deadlock_detected
+        self.available = available
+        self.max_resources = max_resources
+        self.allocated = allocated
+        self.equipment_totals = equipment_totals
+        self.staff_tasks = staff_tasks
+        self.task_progress = task_progress
+        self.rng_state = rng_state
+        self.utilization = utilization
+        self.metrics = metrics
+        # Copy of the engine's Workload, or None if it had none
+        self.workload = workload
+        # TaskPolicy of the engine (None for random task choice)
+        self.task_policy = task_policy
+
+    @staticmethod
+    def share_rows(matrix, previous):
+        """Freeze a matrix, reusing row tuples equal to those in ``previous``."""
+        rows = []
+        for i, row in enumerate(matrix):
+            frozen = tuple(row)
+            if previous is not None and i < len(previous) and previous[i] == frozen:
+                frozen = previous[i]
+            rows.append(frozen)
+        return tuple(rows)
+
+    def fork(self, mode=None, extra_equipment=None, seed=None, task_policy=None):
+        """
+        Create an independent engine starting from this checkpoint.
+
+        Args:
+            mode: Simulation mode for the branch (defaults to the checkpoint's)
+            task_policy: TaskPolicy for the branch (defaults to the checkpoint's)
+            extra_equipment: Mapping of equipment name to units added to the branch
+            seed: Reseed the branch's RNG; by default it continues the checkpoint's stream
+
+        Returns:
+            KitchenSimulationEngine: The branch engine
+        """
+        from smart_kitchen.core.simulation_engine import KitchenSimulationEngine
+
+        engine = KitchenSimulationEngine.from_checkpoint(self)
+        if task_policy is not None:
+            engine.task_policy = task_policy
+        if mode is not None:
+            engine.mode = mode
+        if extra_equipment:
+            engine.add_equipment(extra_equipment)
+        if seed is not None:
+            engine.rng.seed(seed)
+        return engine
+
+    def fork_many(self, count, **variant):
+        """Create ``count`` independent branches with the same variant."""
+        return [self.fork(**variant) for _ in range(count)]
+
+
+def _run_branch(job):
+    """Run one branch to completion; module level so it can run in a worker process."""
+    checkpoint, variant, steps = job
+    engine = checkpoint.fork(**variant)
+    steps_run = engine.run(steps)
+    return {
+        "variant": variant,
+        "steps": steps_run,
+        "deadlock": engine.deadlock_detected,
+        "checkpoint": engine.checkpoint(),
+    }
+
+
+def run_branches(checkpoint, variants, steps, parallel=True, max_workers=None):
+    """
+    Fork a checkpoint once per variant and run every branch for ``steps`` steps.
+
+    Args:
+        checkpoint: SimulationCheckpoint to branch from
+        variants: List of keyword dictionaries for SimulationCheckpoint.fork
+        steps: Maximum number of steps to run each branch
+        parallel: Run branches in worker processes
+        max_workers: Maximum number of worker processes
+
+    Returns:
+        list: One result dictionary per variant, in order, with the variant,
+        the number of steps run, whether it deadlocked and its final checkpoint
+    """
+    jobs = [(checkpoint, variant, steps) for variant in variants]
+    if not parallel or len(jobs) < 2:
+        return [_run_branch(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_branch, jobs))
@@ -0,0 +1,112 @@
+"""
+Compiled kitchen scenario with interned names and precomputed equipment needs
+"""
+import os
+import sys
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.kitchen_algorithm import held_mask
+from smart_kitchen.data.kitchen_data import FOOD_TASKS, TASK_EQUIPMENT_NEEDS
+
+
+class CompiledScenario:
+    """
+    Kitchen scenario with staff, equipment and task names interned to ints.
+
+    Compiling happens once at load time so that the simulation hot loop
+    works purely on indices: each task's equipment needs are stored both as
+    a tuple of equipment indices and as a bitmask, where bit j is set when
+    the task needs equipment j. A staff member is ready to work on a task
+    when ``need_mask & ~held_mask == 0``.
+    """
+
+    NO_TASK = -1
+
+    def __init__(self, staff_names, equipment_names, food_tasks=None, task_equipment_needs=None):
+        """
+        Compile a scenario.
+
+        Args:
+            staff_names: List of staff names (roles), one per staff member
+            equipment_names: List of equipment type names
+            food_tasks: Mapping of staff role to its task names
+            task_equipment_needs: Mapping of task name to needed equipment names
+        """
+        if food_tasks is None:
+            food_tasks = FOOD_TASKS
+        if task_equipment_needs is None:
+            task_equipment_needs = TASK_EQUIPMENT_NEEDS
+
+        self.staff_names = tuple(staff_names)
+        self.equipment_names = tuple(equipment_names)
+        self.num_staff = len(self.staff_names)
+        self.num_equipment = len(self.equipment_names)
+
+        # First index wins so that lookups match list.index()
+        self.staff_index = {}
+        for i, name in enumerate(self.staff_names):
+            self.staff_index.setdefault(name, i)
+        self.equipment_index = {}
+        for j, name in enumerate(self.equipment_names):
+            self.equipment_index.setdefault(name, j)
+
+        # Intern every task reachable from the staff in this scenario
+        task_names = []
+        self.task_index = {}
+        self.staff_task_ids = []
+        for staff in self.staff_names:
+            ids = []
+            for task in food_tasks.get(staff, []):
+                if task not in self.task_index:
+                    self.task_index[task] = len(task_names)
+                    task_names.append(task)
+                ids.append(self.task_index[task])
+            self.staff_task_ids.append(tuple(ids))
+        self.task_names = tuple(task_names)
+        self.num_tasks = len(self.task_names)
+
+        # Equipment the scenario does not stock is ignored, as before
+        self.task_need_indices = []
+        self.task_need_masks = []
+        for task in self.task_names:
+            indices = []
+            for equipment in task_equipment_needs.get(task, []):
+                j = self.equipment_index.get(equipment)
+                if j is not None and j not in indices:
+                    indices.append(j)
+            self.task_need_indices.append(tuple(indices))
+            self.task_need_masks.append(self.mask_of(indices))
+
+    @classmethod
+    def from_scenario(cls, scenario, food_tasks=None, task_equipment_needs=None):
+        """Compile a scenario dictionary as found in KITCHEN_SCENARIOS or a JSON file."""
+        return cls(scenario["staff"], scenario["equipment"], food_tasks, task_equipment_needs)
+
+    @staticmethod
+    def mask_of(equipment_indices):
+        """Build a bitmask from an iterable of equipment indices."""
+        mask = 0
+        for j in equipment_indices:
+            mask |= 1 << j
+        return mask
+
+    # Bitmask of equipment a staff member holds at least one of
+    held_mask = staticmethod(held_mask)
+
+    def indices_of(self, mask):
+        """Expand a bitmask back into a list of equipment indices."""
+        return [j for j in range(self.num_equipment) if mask >> j & 1]
+
+    def has_tasks(self, staff_idx):
+        """Return True if the staff member's role has any food tasks."""
+        return bool(self.staff_task_ids[staff_idx])
+
+    def is_ready(self, task_id, held_mask):
+        """Return True if ``held_mask`` covers every equipment the task needs."""
+        return self.task_need_masks[task_id] & ~held_mask == 0
+
+    def missing_mask(self, task_id, held_mask):
+        """Return the bitmask of needed equipment not covered by ``held_mask``."""
+        return self.task_need_masks[task_id] & ~held_mask
@@ -0,0 +1,168 @@
+"""
+Gantt chart layout: time-axis ticks and level-of-detail slice merging
+"""
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def nice_step(raw):
+    """
+    Round a raw tick spacing up to 1, 2 or 5 times a power of ten.
+
+    Args:
+        raw: Smallest acceptable spacing in time units
+
+    Returns:
+        float: Tick spacing in time units
+    """
+    if raw <= 0:
+        raise ValueError("Tick spacing must be positive")
+    power = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5, 10):
+        if multiple * power >= raw * (1 - 1e-9):
+            return multiple * power
+    return 10 * power
+
+
+def time_ticks(start, end, scale, min_spacing=70):
+    """
+    Choose tick marks for the visible part of a time axis.
+
+    Args:
+        start: First visible time
+        end: Last visible time
+        scale: Pixels per time unit
+        min_spacing: Smallest gap between ticks in pixels
+
+    Returns:
+        (float, list): Tick spacing and the tick times inside [start, end]
+    """
+    step = nice_step(min_spacing / scale)
+    first = math.ceil(start / step)
+    last = math.floor(end / step)
+    return step, [i * step for i in range(first, last + 1)]
+
+
+class GanttTimeline:
+    """
+    Slices of a Gantt chart, grouped into rows.
+
+    Each row keeps its slices sorted by start time in parallel arrays.
+    Slices within a row must not overlap (one station or one job per row),
+    so the end times are sorted as well and the first visible slice is
+    found with a binary search. Where slices are narrower than a pixel,
+    ``visible`` steps through the viewport a pixel at a time and skips the
+    slices inside each pixel with another binary search, so the work per
+    row is bounded by the viewport width rather than the number of slices.
+    """
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows: Row labels, top to bottom
+        """
+        self.rows = list(rows)
+        self.starts = [array("d") for _ in self.rows]
+        self.ends = [array("d") for _ in self.rows]
+        self.slice_ids = [array("q") for _ in self.rows]
+        self.labels = []
+        self.markers = []
+        self.start = 0
+        self.end = 0
+
+    def __len__(self):
+        return len(self.labels)
+
+    @classmethod
+    def from_slices(cls, rows, slices):
+        """
+        Build a timeline from (row index, start, end, label[, marker]) tuples.
+
+        The optional marker is a time drawn as a dashed line on the slice's
+        row, such as the arrival of a job.
+        """
+        timeline = cls(rows)
+        for entry in slices:
+            timeline.add(*entry)
+        return timeline
+
+    def add(self, row, start, end, label, marker=None):
+        """
+        Add a slice to a row.
+
+        Slices may arrive in any order; a row is re-sorted only when a
+        slice starts before the row's last one.
+
+        Returns:
+            int: Slice ID, in insertion order
+        """
+        if end < start:
+            raise ValueError(f"Slice {label} ends before it starts")
+        slice_id = len(self.labels)
+        self.labels.append(label)
+        self.markers.append(marker)
+        if slice_id == 0:
+            self.start, self.end = start, end
+        else:
+            self.start = min(self.start, start)
+            self.end = max(self.end, end)
+
+        starts, ends, ids = self.starts[row], self.ends[row], self.slice_ids[row]
+        if starts and start < starts[-1]:
+            i = bisect_right(starts, start)
+            starts.insert(i, start)
+            ends.insert(i, end)
+            ids.insert(i, slice_id)
+        else:
+            starts.append(start)
+            ends.append(end)
+            ids.append(slice_id)
+        return slice_id
+
+    def visible(self, row, start, end, scale, min_width=1.0):
+        """
+        Return the segments of a row to draw between two times.
+
+        Slices at least ``min_width`` pixels wide are returned on their own.
+        A narrower slice absorbs every slice starting within ``min_width``
+        pixels of it and merges with a preceding narrow block less than
+        ``min_width`` pixels away, so a dense run of tiny jobs becomes one
+        block instead of thousands of sub-pixel rectangles.
+
+        Args:
+            row: Row index
+            start: First visible time
+            end: Last visible time
+            scale: Pixels per time unit
+            min_width: Narrowest slice, in pixels, drawn on its own
+
+        Returns:
+            list: (start, end, slice ID, count) per segment; the slice ID is
+            that of the first slice in the segment and count > 1 marks a
+            merged block
+        """
+        starts, ends, ids = self.starts[row], self.ends[row], self.slice_ids[row]
+        span = min_width / scale
+        segments = []
+        i = bisect_right(ends, start)
+        count = len(starts)
+        merging = False
+        while i < count and starts[i] < end:
+            s, e = starts[i], ends[i]
+            if e - s >= span:
+                segments.append((s, e, ids[i], 1))
+                merging = False
+                i += 1
+                continue
+            # Swallow every slice starting within one pixel of this one
+            j = bisect_left(starts, s + span, i + 1, count)
+            e = ends[j - 1]
+            if merging and s - segments[-1][1] < span:
+                first_start, _, first_id, merged = segments[-1]
+                segments[-1] = (first_start, e, first_id, merged + j - i)
+            else:
+                segments.append((s, e, ids[i], j - i))
+                merging = True
+            i = j
+        return segments
@@ -2,6 +2,16 @@
 Kitchen Resource Management Algorithm based on Banker's Algorithm
 """
 
+
+def held_mask(allocated_row):
+    """Build the bitmask of equipment a staff member holds at least one of."""
+    mask = 0
+    for j, count in enumerate(allocated_row):
+        if count > 0:
+            mask |= 1 << j
+    return mask
+
+
 class KitchenResourceManager:
     """
     Implements Banker's Algorithm for kitchen resource management.
@@ -23,6 +33,14 @@ class KitchenResourceManager:
         self.allocated = allocated_resources
         self.num_staff = len(max_resources)
         self.num_equipment = len(available_resources)
+        # Bit j of held_masks[i] is set while staff i holds any equipment j
+        self.held_masks = [held_mask(row) for row in allocated_resources]
+        # Incremental deadlock detection: staff proven able to finish by the
+        # last scan, whether that scan found the state safe, and whether the
+        # allocation changed in a way that needs another scan
+        self._finishable = [False] * self.num_staff
+        self._known_safe = False
+        self._needs_scan = True
         
     def calculate_need(self):
         """Calculate the equipment still needed by each staff member."""
@@ -64,7 +82,40 @@ class KitchenResourceManager:
                 return False, []
                 
         return True, safe_sequence
-    
+
+    def find_safe_sequence(self):
+        """
+        Determine safety with repeated passes over the staff.
+
+        Gives the same verdict as is_safe(), but every staff member who can
+        finish during a pass is taken before starting over, so large
+        kitchens cost O(passes x staff x equipment) rather than
+        O(staff^2 x equipment). The sequence may differ from is_safe()'s.
+
+        Returns:
+            (bool, list): Tuple with safety status and safe sequence if available
+        """
+        work = self.available[:]
+        pending = list(range(self.num_staff))
+        safe_sequence = []
+
+        while pending:
+            still_pending = []
+            for i in pending:
+                max_row = self.max_resources[i]
+                alloc_row = self.allocated[i]
+                if all(max_row[j] - alloc_row[j] <= work[j] for j in range(self.num_equipment)):
+                    for j in range(self.num_equipment):
+                        work[j] += alloc_row[j]
+                    safe_sequence.append(i)
+                else:
+                    still_pending.append(i)
+            if len(still_pending) == len(pending):
+                return False, []
+            pending = still_pending
+
+        return True, safe_sequence
+
     def request_resources(self, staff_id, request):
         """
         Process a request for additional equipment from a staff member.
@@ -105,7 +156,45 @@ class KitchenResourceManager:
             self.available = old_available
             self.allocated = old_allocated
             return False, "Request would lead to unsafe state"
+        
+        self.held_masks[staff_id] = held_mask(self.allocated[staff_id])
+        # The safety check above just proved the new state safe
+        self._finishable = [True] * self.num_staff
+        self._known_safe = True
+        self._needs_scan = False
+        return True, "Request granted"
+    
+    def allocate_resources(self, staff_id, request):
+        """
+        Grant a request first-come first-served, without a safety check.
+        
+        Used by detection-and-recovery simulation, where unsafe states are
+        allowed and deadlocks are resolved after the fact.
+        
+        Args:
+            staff_id: Index of the staff member making the request
+            request: List of requested equipment counts
             
+        Returns:
+            (bool, str): Whether the request was granted and why
+        """
+        for j in range(self.num_equipment):
+            if request[j] > self.max_resources[staff_id][j] - self.allocated[staff_id][j]:
+                return False, "Request exceeds maximum need"
+        
+        for j in range(self.num_equipment):
+            if request[j] > self.available[j]:
+                return False, "Insufficient resources available"
+        
+        for j in range(self.num_equipment):
+            self.available[j] -= request[j]
+            self.allocated[staff_id][j] += request[j]
+        
+        self.held_masks[staff_id] = held_mask(self.allocated[staff_id])
+        # Nothing is known about the new state until it is scanned again
+        self._finishable = [False] * self.num_staff
+        self._known_safe = False
+        self._needs_scan = True
         return True, "Request granted"
     
     def release_resources(self, staff_id, release):
@@ -125,9 +214,79 @@ class KitchenResourceManager:
         for j in range(self.num_equipment):
             self.available[j] += release[j]
             self.allocated[staff_id][j] -= release[j]
-            
+        
+        self.held_masks[staff_id] = held_mask(self.allocated[staff_id])
+        self._resources_returned()
         return True, "Resources released"
 
+    def add_available(self, equipment_id, units):
+        """
+        Add units of an equipment type to the available pool.
+        
+        Args:
+            equipment_id: Index of the equipment type
+            units: Number of units to add
+        """
+        self.available[equipment_id] += units
+        self._resources_returned()
+
+    def remove_available(self, equipment_id, units, keep_safe=False):
+        """
+        Take idle units of an equipment type out of the available pool.
+        
+        Args:
+            equipment_id: Index of the equipment type
+            units: Number of units to remove
+            keep_safe: Refuse the removal if it would leave an unsafe state
+            
+        Returns:
+            bool: True if the units were removed
+        """
+        if units > self.available[equipment_id]:
+            return False
+        self.available[equipment_id] -= units
+        
+        if keep_safe:
+            safe, _ = self.is_safe()
+            if not safe:
+                self.available[equipment_id] += units
+                return False
+        
+        # Less equipment can turn a safe state unsafe
+        self._finishable = [keep_safe] * self.num_staff
+        self._known_safe = keep_safe
+        self._needs_scan = not keep_safe
+        return True
+    
+    def raise_claim(self, staff_id, equipment_id, units):
+        """
+        Raise a staff member's maximum need for an equipment type.
+        
+        Args:
+            staff_id: Index of the staff member
+            equipment_id: Index of the equipment type
+            units: New maximum need; a lower value leaves the claim unchanged
+        """
+        if units <= self.max_resources[staff_id][equipment_id]:
+            return
+        self.max_resources[staff_id][equipment_id] = units
+        # A larger need can turn a safe state unsafe
+        self._finishable = [False] * self.num_staff
+        self._known_safe = False
+        self._needs_scan = True
+    
+    def _resources_returned(self):
+        """
+        Update incremental detection after equipment went back to the pool.
+        
+        Returning equipment never makes a safe state unsafe, and every staff
+        member that could finish before still can, so only a state already
+        known to be unsafe has to be scanned again, and only for the staff
+        that were stuck.
+        """
+        if not self._known_safe:
+            self._needs_scan = True
+
     def detect_deadlock(self):
         """
         Detect if there is a deadlock in the current state.
@@ -136,4 +295,87 @@ class KitchenResourceManager:
             bool: True if deadlock detected, False otherwise
         """
         safe, _ = self.is_safe()
-        return not safe 
\ No newline at end of file
+        return not safe
+
+    def find_deadlocked_staff(self, requests):
+        """
+        Find the staff members that are deadlocked on their current requests.
+        
+        This is the detection algorithm for multiple-instance resources: staff
+        without an outstanding request can finish and return what they hold,
+        so only the requesting staff are reduced against the pooled equipment,
+        and whoever can never be satisfied is deadlocked.
+        
+        Args:
+            requests: Mapping of staff index to its outstanding request row
+            
+        Returns:
+            list: Indices of the deadlocked staff, in ascending order
+        """
+        work = self.available[:]
+        for i in range(self.num_staff):
+            if i not in requests:
+                row = self.allocated[i]
+                for j in range(self.num_equipment):
+                    work[j] += row[j]
+        
+        blocked = sorted(requests)
+        progress = True
+        while progress and blocked:
+            progress = False
+            still_blocked = []
+            for i in blocked:
+                request = requests[i]
+                if all(request[j] <= work[j] for j in range(self.num_equipment)):
+                    row = self.allocated[i]
+                    for j in range(self.num_equipment):
+                        work[j] += row[j]
+                    progress = True
+                else:
+                    still_blocked.append(i)
+            blocked = still_blocked
+        return blocked
+
+    def detect_deadlock_incremental(self):
+        """
+        Detect a deadlock, scanning only when the allocation changed.
+        
+        Gives the same answer as detect_deadlock() as long as the state is
+        only changed through request_resources, release_resources and
+        add_available. A state known to be safe costs nothing to check, and
+        a re-check after equipment is returned resumes from the staff the
+        previous scan had already shown could finish.
+        
+        Returns:
+            bool: True if deadlock detected, False otherwise
+        """
+        if self._known_safe:
+            return False
+        if not self._needs_scan:
+            return True
+        
+        finished = self._finishable
+        work = self.available[:]
+        for i in range(self.num_staff):
+            if finished[i]:
+                for j in range(self.num_equipment):
+                    work[j] += self.allocated[i][j]
+        
+        # Reduce the staff that were stuck until no one else can finish
+        progress = True
+        while progress:
+            progress = False
+            for i in range(self.num_staff):
+                if finished[i]:
+                    continue
+                max_row = self.max_resources[i]
+                alloc_row = self.allocated[i]
+                if all(max_row[j] - alloc_row[j] <= work[j] for j in range(self.num_equipment)):
+                    for j in range(self.num_equipment):
+                        work[j] += alloc_row[j]
+                    finished[i] = True
+                    progress = True
+        
+        self._known_safe = all(finished)
+        self._needs_scan = False
+        return not self._known_safe 
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Multi-kitchen simulation with a shared central equipment pool
+"""
+import os
+import random
+import sys
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine, MODE_BANKERS
+from smart_kitchen.core.simulation_metrics import SimulationMetrics
+
+
+class MultiKitchenEngine:
+    """
+    Runs several kitchens side by side, borrowing from a shared equipment pool.
+
+    Resources are hierarchical. Every kitchen is a KitchenSimulationEngine
+    with its own local equipment and admission rules. When a local request
+    is denied, the kitchen tries to borrow one unit of that type from the
+    central pool. The pool is itself a KitchenResourceManager whose
+    "staff" are the kitchens, so every loan passes Banker's admission
+    against the kitchens' borrowing claims. Borrowed units that sit idle
+    at the end of a step are returned.
+    """
+
+    def __init__(self, scenarios, pool_equipment, mode=MODE_BANKERS, seed=None, borrow_limits=None):
+        """
+        Initialize the kitchens and the shared pool.
+
+        Args:
+            scenarios: List of scenario dictionaries, one per kitchen
+            pool_equipment: Mapping of equipment name to units in the shared pool
+            mode: Simulation mode of every kitchen (one of SIMULATION_MODES)
+            seed: Optional seed; each kitchen gets its own derived stream
+            borrow_limits: Optional list of per-kitchen mappings of equipment
+                name to the most units that kitchen may borrow at once.
+                By default a kitchen may borrow up to the shortfall between
+                its staff's combined maximum needs and its own units.
+        """
+        rng = random.Random(seed)
+        self.kitchens = [
+            KitchenSimulationEngine(scenario, mode, seed=rng.randrange(2 ** 32))
+            for scenario in scenarios
+        ]
+        self.kitchen_names = [
+            f"{k + 1}. {scenario.get('name', 'Kitchen')}" for k, scenario in enumerate(scenarios)
+        ]
+        self.pool_names = list(pool_equipment)
+        pool_units = [pool_equipment[name] for name in self.pool_names]
+
+        # Pool index of each kitchen-local equipment index (None if not pooled)
+        self.pool_index = []
+        for kitchen in self.kitchens:
+            self.pool_index.append([
+                self.pool_names.index(name) if name in pool_equipment else None
+                for name in kitchen.compiled.equipment_names
+            ])
+
+        claims = [
+            self._borrow_claim(k, pool_units, borrow_limits[k] if borrow_limits else None)
+            for k in range(len(self.kitchens))
+        ]
+        self.pool = KitchenResourceManager(
+            pool_units[:],
+            claims,
+            [[0] * len(self.pool_names) for _ in self.kitchens]
+        )
+
+        # Pool-level metrics: kitchens play the part of staff
+        self.pool_compiled = CompiledScenario(self.kitchen_names, self.pool_names, {}, {})
+        self.pool_metrics = SimulationMetrics(self.pool_compiled, pool_units, pool_units)
+        self.loans = 0
+        self.returns = 0
+        # Admission decisions only change when the pool does, so denials are
+        # remembered per (kitchen, equipment) until the next loan or return
+        self.denied = {}
+
+        self.current_step = 0
+        for k, kitchen in enumerate(self.kitchens):
+            kitchen.equipment_source = self._make_source(k)
+
+    def _borrow_claim(self, kitchen_idx, pool_units, limits):
+        """Return a kitchen's maximum claim on each pooled equipment type."""
+        kitchen = self.kitchens[kitchen_idx]
+        claim = [0] * len(self.pool_names)
+        for j, p in enumerate(self.pool_index[kitchen_idx]):
+            if p is None:
+                continue
+            name = self.pool_names[p]
+            if limits is not None:
+                wanted = limits.get(name, 0)
+            else:
+                max_needs = kitchen.kitchen_manager.max_resources
+                wanted = sum(row[j] for row in max_needs) - kitchen.equipment_totals[j]
+            claim[p] = min(pool_units[p], max(0, wanted))
+        return claim
+
+    def _make_source(self, kitchen_idx):
+        """Build the equipment_source callback for one kitchen."""
+        def borrow(equipment_idx):
+            return self.borrow(kitchen_idx, equipment_idx)
+        return borrow
+
+    def borrow(self, kitchen_idx, equipment_idx):
+        """
+        Lend one unit from the pool to a kitchen, if Banker's admission allows it.
+
+        Args:
+            kitchen_idx: Index of the borrowing kitchen
+            equipment_idx: Kitchen-local index of the equipment type
+
+        Returns:
+            bool: True if a unit was added to the kitchen
+        """
+        p = self.pool_index[kitchen_idx][equipment_idx]
+        if p is None:
+            return False
+        reason = self.denied.get((kitchen_idx, p))
+        if reason is not None:
+            self.pool_metrics.request(reason)
+            return False
+
+        request = [0] * len(self.pool_names)
+        request[p] = 1
+        success, reason = self.pool.request_resources(kitchen_idx, request)
+        self.pool_metrics.request(reason)
+        if not success:
+            self.denied[(kitchen_idx, p)] = reason
+            return False
+        self.denied.clear()
+
+        kitchen = self.kitchens[kitchen_idx]
+        kitchen.add_equipment({self.pool_names[p]: 1})
+        self.loans += 1
+        self.pool_metrics.allocation_changed(
+            p, self.pool_metrics.totals[p] - self.pool.available[p], self.current_step
+        )
+        return True
+
+    def return_idle(self, kitchen_idx):
+        """
+        Give borrowed units a kitchen is not using back to the pool.
+
+        Returns:
+            int: Number of units returned
+        """
+        kitchen = self.kitchens[kitchen_idx]
+        borrowed = self.pool.allocated[kitchen_idx]
+        returned = 0
+        for j, p in enumerate(self.pool_index[kitchen_idx]):
+            if p is None or not borrowed[p]:
+                continue
+            units = min(borrowed[p], kitchen.kitchen_manager.available[j])
+            if units and kitchen.remove_equipment(self.pool_names[p], units):
+                release = [0] * len(self.pool_names)
+                release[p] = units
+                self.pool.release_resources(kitchen_idx, release)
+                self.denied.clear()
+                self.pool_metrics.allocation_changed(
+                    p, self.pool_metrics.totals[p] - self.pool.available[p], self.current_step
+                )
+                returned += units
+        self.returns += returned
+        return returned
+
+    def step(self):
+        """
+        Advance every kitchen that is still running by one step.
+
+        Returns:
+            bool: False once every kitchen has stopped on a deadlock
+        """
+        self.current_step += 1
+        running = False
+        for k, kitchen in enumerate(self.kitchens):
+            if kitchen.step():
+                running = True
+            if any(self.pool.allocated[k]):
+                self.return_idle(k)
+        return running
+
+    def run(self, max_steps):
+        """
+        Run up to ``max_steps`` steps, stopping early when every kitchen is deadlocked.
+
+        Returns:
+            int: Number of steps actually simulated
+        """
+        steps = 0
+        while steps < max_steps and self.step():
+            steps += 1
+        return steps
+
+    def summary(self):
+        """
+        Summarize every kitchen and the shared pool.
+
+        Returns:
+            dict: Per-kitchen metric summaries, pool utilization and admission
+            counts, and the number of loans and returns
+        """
+        step = self.current_step
+        return {
+            "steps": step,
+            "kitchens": [
+                {
+                    "name": name,
+                    "deadlock": kitchen.deadlock_detected,
+                    "borrowed": dict(zip(self.pool_names, self.pool.allocated[k])),
+                    "metrics": kitchen.metrics.summary(kitchen.current_step),
+                }
+                for k, (name, kitchen) in enumerate(zip(self.kitchen_names, self.kitchens))
+            ],
+            "pool": self.pool_metrics.summary(step),
+            "loans": self.loans,
+            "returns": self.returns,
+        }
+
+    def format_summary(self):
+        """Return the summary as a plain-text table."""
+        summary = self.summary()
+        steps = summary["steps"]
+        out = []
+        out.append(f"Multi-Kitchen Simulation ({len(self.kitchens)} kitchens, {steps} steps)\n" + "-" * 60)
+
+        out.append("\nKitchens:")
+        out.append(f"{'Kitchen':<36}{'Tasks':<8}{'Per 100 steps':<15}{'Status'}")
+        for kitchen in summary["kitchens"]:
+            tasks = sum(count for _, count in kitchen["metrics"]["tasks_per_staff"])
+            rate = tasks * 100 / steps if steps else 0.0
+            status = "Deadlocked" if kitchen["deadlock"] else "Running"
+            out.append(f"{kitchen['name'][:35]:<36}{tasks:<8}{rate:<15.2f}{status}")
+
+        out.append("\nShared Pool:")
+        out.append(f"{'Equipment':<24}{'Units':<8}{'On loan':<10}{'Utilization'}")
+        for p, (name, _, utilization) in enumerate(summary["pool"]["equipment"]):
+            units = self.pool_metrics.totals[p]
+            on_loan = units - self.pool.available[p]
+            out.append(f"{name:<24}{units:<8}{on_loan:<10}{utilization * 100:.1f}%")
+        out.append(f"Loans: {summary['loans']}  Returns: {summary['returns']}")
+
+        out.append("\nPool Admission:")
+        if not summary["pool"]["requests"]:
+            out.append("  None")
+        for reason, count in sorted(summary["pool"]["requests"].items()):
+            out.append(f"  {reason:<40}{count}")
+        return "\n".join(out)
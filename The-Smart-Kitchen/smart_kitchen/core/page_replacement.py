@@ -0,0 +1,263 @@
+"""
+Streaming page replacement: FIFO, LRU, Clock and Belady's optimal (OPT)
+"""
+import heapq
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+
+
+class PageReplacer(ABC):
+    """
+    Fixed number of frames holding pages, with a replacement policy.
+
+    Subclasses implement ``access`` and ``frames``. Each access is O(1)
+    (O(log frames) for OPT), whatever the length of the reference string.
+    """
+
+    name = "Replacer"
+
+    def __init__(self, frames):
+        """
+        Args:
+            frames: Number of page frames
+        """
+        if frames < 1:
+            raise ValueError("At least one frame is required")
+        self.num_frames = frames
+
+    @abstractmethod
+    def access(self, page):
+        """
+        Reference a page.
+
+        Returns:
+            (bool, object): Whether the reference faulted, and the evicted page (or None)
+        """
+
+    @abstractmethod
+    def frames(self):
+        """Return the resident pages, in the policy's order."""
+
+
+class FIFOReplacer(PageReplacer):
+    """Evict the page that has been resident longest."""
+
+    name = "FIFO"
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.queue = deque()
+        self.resident = set()
+
+    def access(self, page):
+        if page in self.resident:
+            return False, None
+        evicted = None
+        if len(self.queue) == self.num_frames:
+            evicted = self.queue.popleft()
+            self.resident.discard(evicted)
+        self.queue.append(page)
+        self.resident.add(page)
+        return True, evicted
+
+    def frames(self):
+        """Return the resident pages, oldest first."""
+        return list(self.queue)
+
+
+class LRUReplacer(PageReplacer):
+    """Evict the page that was referenced least recently."""
+
+    name = "LRU"
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.recency = OrderedDict()
+
+    def access(self, page):
+        recency = self.recency
+        if page in recency:
+            recency.move_to_end(page)
+            return False, None
+        evicted = None
+        if len(recency) == self.num_frames:
+            evicted, _ = recency.popitem(last=False)
+        recency[page] = None
+        return True, evicted
+
+    def frames(self):
+        """Return the resident pages, least recently used first."""
+        return list(self.recency)
+
+
+class ClockReplacer(PageReplacer):
+    """
+    Second-chance replacement with a circular hand over the frames.
+
+    A referenced page gets its bit set; the hand clears set bits as it
+    sweeps and evicts the first page whose bit is already clear.
+    """
+
+    name = "Clock"
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.slots = []
+        self.referenced = []
+        self.slot_of = {}
+        self.hand = 0
+
+    def access(self, page):
+        slot = self.slot_of.get(page)
+        if slot is not None:
+            self.referenced[slot] = True
+            return False, None
+
+        if len(self.slots) < self.num_frames:
+            self.slot_of[page] = len(self.slots)
+            self.slots.append(page)
+            self.referenced.append(True)
+            return True, None
+
+        referenced = self.referenced
+        hand = self.hand
+        while referenced[hand]:
+            referenced[hand] = False
+            hand = (hand + 1) % self.num_frames
+        evicted = self.slots[hand]
+        del self.slot_of[evicted]
+        self.slots[hand] = page
+        self.slot_of[page] = hand
+        referenced[hand] = True
+        self.hand = (hand + 1) % self.num_frames
+        return True, evicted
+
+    def frames(self):
+        """Return the resident pages in slot order."""
+        return list(self.slots)
+
+
+class OPTReplacer(PageReplacer):
+    """
+    Belady's optimal replacement: evict the page used furthest in the future.
+
+    OPT is offline, so it needs the whole reference string up front.
+    The next use of every reference is precomputed in one backwards pass
+    into a compact integer array, and resident pages sit in a max-heap
+    keyed by next use with lazy deletion of stale entries.
+    """
+
+    name = "OPT"
+
+    def __init__(self, frames, references):
+        """
+        Args:
+            frames: Number of page frames
+            references: The complete reference string, in order
+        """
+        super().__init__(frames)
+        self.references = references
+        count = len(references)
+        self.next_use = array("q", bytes(8 * count))
+        last_seen = {}
+        for i in range(count - 1, -1, -1):
+            page = references[i]
+            self.next_use[i] = last_seen.get(page, count)
+            last_seen[page] = i
+        self.position = 0
+        self.resident = {}
+        self.heap = []
+
+    def access(self, page):
+        position = self.position
+        if page != self.references[position]:
+            raise ValueError(f"Reference {position} is {self.references[position]}, not {page}")
+        self.position = position + 1
+        next_use = self.next_use[position]
+
+        resident = self.resident
+        fault = page not in resident
+        evicted = None
+        if fault and len(resident) == self.num_frames:
+            while True:
+                use, _, victim = heapq.heappop(self.heap)
+                if resident.get(victim) == -use:
+                    break
+            del resident[victim]
+            evicted = victim
+
+        resident[page] = next_use
+        # The position breaks ties between pages never used again
+        heapq.heappush(self.heap, (-next_use, position, page))
+        if len(self.heap) > 4 * self.num_frames:
+            # Drop stale entries left behind by hits
+            self.heap = [(-use, i, p) for i, (p, use) in enumerate(resident.items())]
+            heapq.heapify(self.heap)
+        return fault, evicted
+
+    def frames(self):
+        """Return the resident pages in the order they were loaded."""
+        return list(self.resident)
+
+
+# Policies offered by the demonstration, by name
+REPLACEMENT_POLICIES = {
+    policy.name: policy for policy in (FIFOReplacer, LRUReplacer, ClockReplacer, OPTReplacer)
+}
+
+
+def make_replacer(name, frames, references=None):
+    """
+    Create a replacer by policy name.
+
+    Args:
+        name: One of REPLACEMENT_POLICIES
+        frames: Number of page frames
+        references: Reference string, required by OPT only
+    """
+    policy = REPLACEMENT_POLICIES[name]
+    if policy is OPTReplacer:
+        if references is None:
+            raise ValueError("OPT needs the complete reference string")
+        return policy(frames, references)
+    return policy(frames)
+
+
+def simulate_replacement(replacer, references, record_steps=False):
+    """
+    Run a reference stream through a replacer.
+
+    Only counters are kept unless ``record_steps`` is set, so arbitrarily
+    long streams run in constant memory (apart from OPT's next-use index).
+
+    Args:
+        replacer: PageReplacer to drive
+        references: Iterable of page references
+        record_steps: Keep (step, page, frames, fault) for every reference
+
+    Returns:
+        dict: References, faults, hits, fault rate, final frames and the
+        recorded steps (None unless requested)
+    """
+    faults = 0
+    count = 0
+    steps = [] if record_steps else None
+    access = replacer.access
+    for page in references:
+        count += 1
+        fault, _ = access(page)
+        if fault:
+            faults += 1
+        if record_steps:
+            steps.append((count, page, replacer.frames(), fault))
+    return {
+        "policy": replacer.name,
+        "frames": replacer.num_frames,
+        "references": count,
+        "faults": faults,
+        "hits": count - faults,
+        "fault_rate": faults / count if count else 0.0,
+        "final_frames": replacer.frames(),
+        "steps": steps,
+    }
@@ -0,0 +1,564 @@
+"""
+Resource allocation graphs: processes, resources, request and assignment edges, and cycle detection
+"""
+import heapq
+from collections import deque
+
+
+def strongly_connected_components(num_nodes, successors):
+    """
+    Tarjan's strongly connected components, without recursion.
+
+    Runs in O(V + E) with an explicit stack of (node, next successor
+    position) frames, so arbitrarily long paths do not hit Python's
+    recursion limit.
+
+    Args:
+        num_nodes: Number of nodes, numbered 0 .. num_nodes - 1
+        successors: Adjacency lists, successors[v] being the nodes v has edges to
+
+    Returns:
+        list: Components as lists of nodes, in reverse topological order
+        (every edge between components points to an earlier one)
+    """
+    index = [-1] * num_nodes
+    lowlink = [0] * num_nodes
+    on_stack = [False] * num_nodes
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(num_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        frames = [(root, 0)]
+        while frames:
+            node, position = frames[-1]
+            edges = successors[node]
+            if position < len(edges):
+                frames[-1] = (node, position + 1)
+                succ = edges[position]
+                if index[succ] == -1:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack[succ] = True
+                    frames.append((succ, 0))
+                elif on_stack[succ] and index[succ] < lowlink[node]:
+                    lowlink[node] = index[succ]
+                continue
+
+            # All successors done: pop the frame and close the component
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+class ResourceAllocationGraph:
+    """
+    Resource allocation graph of processes (staff) and resources (equipment).
+
+    A request edge ``process -> resource`` means the process waits for the
+    resource; an assignment edge ``resource -> process`` means a unit of
+    the resource is held by the process. Nodes are numbered with the
+    processes first, and edges are kept as adjacency lists of node numbers.
+    """
+
+    def __init__(self, processes, resources, instances=None):
+        """
+        Args:
+            processes: Process names
+            resources: Resource names
+            instances: Units of each resource (default: one each)
+        """
+        self.processes = list(processes)
+        self.resources = list(resources)
+        self.instances = list(instances) if instances is not None else [1] * len(self.resources)
+        if len(self.instances) != len(self.resources):
+            raise ValueError("Expected one instance count per resource")
+        self.names = self.processes + self.resources
+        self.node_of = {name: v for v, name in enumerate(self.names)}
+        if len(self.node_of) != len(self.names):
+            raise ValueError("Process and resource names must be unique")
+        self.successors = [[] for _ in self.names]
+
+    @classmethod
+    def from_edges(cls, processes, resources, instances, requests, assignments):
+        """
+        Build a graph from named edges.
+
+        Args:
+            requests: (process, resource) request edges
+            assignments: (resource, process) assignment edges
+        """
+        graph = cls(processes, resources, instances)
+        for process, resource in requests:
+            graph.add_request(process, resource)
+        for resource, process in assignments:
+            graph.add_assignment(resource, process)
+        return graph
+
+    @property
+    def num_processes(self):
+        return len(self.processes)
+
+    def is_process(self, node):
+        return node < len(self.processes)
+
+    def _node(self, name, want_process):
+        node = self.node_of.get(name)
+        if node is None:
+            raise ValueError(f"Unknown node {name}")
+        if self.is_process(node) != want_process:
+            raise ValueError(f"{name} is not a {'process' if want_process else 'resource'}")
+        return node
+
+    def add_request(self, process, resource):
+        """Add a request edge from a process to a resource."""
+        self.successors[self._node(process, True)].append(self._node(resource, False))
+
+    def add_assignment(self, resource, process):
+        """Add an assignment edge from a resource to a process."""
+        self.successors[self._node(resource, False)].append(self._node(process, True))
+
+    def cyclic_components(self):
+        """
+        Return the strongly connected components that contain a cycle.
+
+        Returns:
+            list: Components as lists of node numbers, each sorted
+        """
+        successors = self.successors
+        cyclic = []
+        for component in strongly_connected_components(len(self.names), successors):
+            if len(component) > 1 or component[0] in successors[component[0]]:
+                cyclic.append(sorted(component))
+        cyclic.sort()
+        return cyclic
+
+    def cycle_in(self, component, successors=None):
+        """
+        Return a shortest cycle through the first node of a cyclic component.
+
+        A breadth-first search from that node, restricted to the component,
+        finds the way back in time linear in the component's size.
+
+        Args:
+            component: Node numbers of the component, first node on the cycle
+            successors: Adjacency lists to search instead of the graph's own
+
+        Returns:
+            list: Node names along the cycle, with the first repeated at the end
+        """
+        if successors is None:
+            successors = self.successors
+        members = set(component)
+        start = component[0]
+        parent = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for succ in successors[node]:
+                if succ == start:
+                    path = [start]
+                    while node is not None:
+                        path.append(node)
+                        node = parent[node]
+                    path.reverse()
+                    return [self.names[v] for v in path]
+                if succ in members and succ not in parent:
+                    parent[succ] = node
+                    queue.append(succ)
+        raise ValueError("Component has no cycle")
+
+    def find_cycles(self):
+        """
+        Find one cycle per cyclic strongly connected component.
+
+        Every cycle of the graph lies inside one of these components, so
+        the graph is cycle-free exactly when this returns an empty list.
+
+        Returns:
+            list: Cycles in the demo's format, e.g. ["P1", "R1", "P2", "R2", "P1"]
+        """
+        return [self.cycle_in(component) for component in self.cyclic_components()]
+
+    def find_cycle(self):
+        """Return the first cycle found by find_cycles(), or None."""
+        cycles = self.find_cycles()
+        return cycles[0] if cycles else None
+
+    def all_edges(self):
+        """Return the adjacency lists of every edge in the graph."""
+        return self.successors
+
+    def _edge_counts(self, successors):
+        """
+        Count the units requested and held by each process.
+
+        Repeated edges stand for several units: two assignment edges from
+        a resource to a process mean the process holds two of its units.
+
+        Returns:
+            (list, list, list): Requested and held units per process, as
+            {resource index: units} dicts, and the free units per resource
+        """
+        n = len(self.processes)
+        requested = [{} for _ in range(n)]
+        held = [{} for _ in range(n)]
+        available = self.instances[:]
+        for p in range(n):
+            wants = requested[p]
+            for node in successors[p]:
+                r = node - n
+                wants[r] = wants.get(r, 0) + 1
+        for r, resource in enumerate(self.resources):
+            for p in successors[n + r]:
+                held[p][r] = held[p].get(r, 0) + 1
+                available[r] -= 1
+            if available[r] < 0:
+                raise ValueError(f"{resource} has more assignments than its {self.instances[r]} instances")
+        return requested, held, available
+
+    def reduce(self):
+        """
+        Detect deadlock by graph reduction over the resource instance counts.
+
+        A process whose every request fits into the free units can finish
+        and return what it holds; reducing until no process can is the
+        multiple-instance detection algorithm. Each resource keeps a
+        min-heap of the processes waiting on it keyed by units wanted, and
+        each process counts the resources it still waits for, so every
+        request edge is pushed and popped once: O(E log V) overall.
+
+        A cycle only means deadlock when no reduction breaks it, so a
+        cycle through a multi-instance resource can have an escape. The
+        processes left unreduced split into the deadlocked set proper,
+        those on a cycle of requests that can never be met, and the ones
+        merely blocked waiting behind them.
+
+        Returns:
+            dict: ``deadlocked`` (bool), ``sequence`` (process names in
+            reduction order), ``deadlocked_processes`` and
+            ``blocked_processes`` (names), and ``cycles``, one unbreakable
+            cycle per deadlocked group
+        """
+        n = len(self.processes)
+        requested, held, available = self._edge_counts(self.all_edges())
+        return self._reduce(range(n), requested, held, available)
+
+    def _reduce(self, processes, requested, held, available):
+        """
+        Reduce the given processes; any others count as already finished.
+
+        Args:
+            processes: Process nodes to reduce, in the order to try them
+            requested: Units requested per process, {resource index: units}
+            held: Units held per process, {resource index: units}
+            available: Free units per resource, counting units held by
+                processes outside ``processes`` as free
+
+        Returns:
+            dict: As for reduce(), with ``sequence`` covering ``processes`` only
+        """
+        n = len(self.processes)
+        waiting = {}
+        heaps = {}
+        ready = deque()
+        for p in processes:
+            count = 0
+            for r, units in requested[p].items():
+                if units > self.instances[r]:
+                    raise ValueError(
+                        f"{self.processes[p]} requests {units} units of {self.resources[r]}, "
+                        f"which has {self.instances[r]}"
+                    )
+                if units > available[r]:
+                    heapq.heappush(heaps.setdefault(r, []), (units, p))
+                    count += 1
+            waiting[p] = count
+            if not count:
+                ready.append(p)
+
+        sequence = []
+        while ready:
+            p = ready.popleft()
+            sequence.append(p)
+            for r, units in held[p].items():
+                available[r] += units
+                heap = heaps.get(r)
+                while heap and heap[0][0] <= available[r]:
+                    _, q = heapq.heappop(heap)
+                    waiting[q] -= 1
+                    if not waiting[q]:
+                        ready.append(q)
+
+        deadlocked = []
+        blocked = []
+        cycles = []
+        if len(sequence) < len(waiting):
+            unreduced = [p for p in waiting if waiting[p]]
+            # Wait-for edges that can never be satisfied, among the unreduced
+            residual = {}
+            for p in unreduced:
+                residual[p] = [n + r for r, units in requested[p].items() if units > available[r]]
+                for node in residual[p]:
+                    residual[node] = []
+            for p in unreduced:
+                for r in held[p]:
+                    if n + r in residual:
+                        residual[n + r].append(p)
+
+            nodes = list(residual)
+            local = {node: i for i, node in enumerate(nodes)}
+            local_successors = [[local[succ] for succ in residual[node]] for node in nodes]
+            on_cycle = set()
+            for component in strongly_connected_components(len(nodes), local_successors):
+                if len(component) > 1:
+                    component = sorted(nodes[i] for i in component)
+                    cycles.append(component)
+                    on_cycle.update(component)
+            for p in unreduced:
+                (deadlocked if p in on_cycle else blocked).append(self.processes[p])
+            cycles = [self.cycle_in(component, residual) for component in sorted(cycles)]
+
+        return {
+            "deadlocked": bool(deadlocked),
+            "sequence": [self.processes[p] for p in sequence],
+            "deadlocked_processes": deadlocked,
+            "blocked_processes": blocked,
+            "cycles": cycles,
+        }
+
+
+class DynamicResourceGraph(ResourceAllocationGraph):
+    """
+    Resource allocation graph that checks for cycles as edges come and go.
+
+    A topological order of the nodes is maintained with the Pearce-Kelly
+    algorithm. Adding an edge that agrees with the order costs O(1); an
+    edge against the order searches forwards from its head and backwards
+    from its tail, but only among the nodes ordered between the two, and
+    re-ranks just those nodes. If the forward search reaches the tail, the
+    edge closes a cycle: it is held back from the order and the cycle is
+    reported. Removing an edge never invalidates the order, so a release
+    costs only the adjacency list update, plus a retry of any held-back
+    edges, which exist only while the graph has a cycle.
+    """
+
+    def __init__(self, processes, resources, instances=None):
+        super().__init__(processes, resources, instances)
+        count = len(self.names)
+        self.predecessors = [[] for _ in range(count)]
+        self.rank = list(range(count))  # Node -> position in the topological order
+        # Edges that would close a cycle, with the cycle they close
+        self.held_back = []
+
+    def add_request(self, process, resource):
+        """
+        Add a request edge from a process to a resource.
+
+        Returns:
+            list: The cycle the edge closes (node names, first repeated at
+            the end), or None
+        """
+        return self.add_edge(self._node(process, True), self._node(resource, False))
+
+    def add_assignment(self, resource, process):
+        """
+        Add an assignment edge from a resource to a process.
+
+        Returns:
+            list: The cycle the edge closes, or None
+        """
+        return self.add_edge(self._node(resource, False), self._node(process, True))
+
+    def remove_request(self, process, resource):
+        """Remove a request edge, e.g. when the request is granted or withdrawn."""
+        self.remove_edge(self._node(process, True), self._node(resource, False))
+
+    def remove_assignment(self, resource, process):
+        """Remove an assignment edge when the process releases a unit."""
+        self.remove_edge(self._node(resource, False), self._node(process, True))
+
+    @property
+    def has_cycle(self):
+        return bool(self.held_back)
+
+    def find_cycles(self):
+        """Return the cycles closed by the held-back edges, one per edge."""
+        return [cycle for _, _, cycle in self.held_back]
+
+    def all_edges(self):
+        """Return the adjacency lists of every edge, held-back ones included."""
+        if not self.held_back:
+            return self.successors
+        successors = [edges[:] for edges in self.successors]
+        for tail, head, _ in self.held_back:
+            successors[tail].append(head)
+        return successors
+
+    def find_deadlock(self):
+        """
+        Reduce only the part of the graph that can reach a cycle.
+
+        A process from which no cycle can be reached is never left
+        unreduced, so it counts as finished and its units as free. Every
+        cycle runs through a held-back edge, so the processes that matter
+        are found by searching backwards from the held-back edges' tails,
+        and an acyclic graph costs nothing at all.
+
+        Returns:
+            dict: As for reduce(), without ``sequence``
+        """
+        if not self.held_back:
+            return {"deadlocked": False, "deadlocked_processes": [], "blocked_processes": [], "cycles": []}
+
+        n = len(self.processes)
+        reaching = {tail for tail, _, _ in self.held_back}
+        stack = list(reaching)
+        while stack:
+            node = stack.pop()
+            for pred in self.predecessors[node]:
+                if pred not in reaching:
+                    reaching.add(pred)
+                    stack.append(pred)
+        processes = sorted(node for node in reaching if node < n)
+
+        requested = {}
+        held = {}
+        for p in processes:
+            wants = requested[p] = {}
+            for node in self.successors[p]:
+                wants[node - n] = wants.get(node - n, 0) + 1
+            holds = held[p] = {}
+            for node in self.predecessors[p]:
+                holds[node - n] = holds.get(node - n, 0) + 1
+        for tail, head, _ in self.held_back:
+            if tail < n:
+                wants = requested[tail]
+                wants[head - n] = wants.get(head - n, 0) + 1
+            elif head in held:
+                holds = held[head]
+                holds[tail - n] = holds.get(tail - n, 0) + 1
+
+        # Units held outside the searched part will be returned
+        available = {}
+        for p in processes:
+            for r in requested[p]:
+                available[r] = self.instances[r]
+            for r in held[p]:
+                available[r] = self.instances[r]
+        for p in processes:
+            for r, units in held[p].items():
+                available[r] -= units
+
+        result = self._reduce(processes, requested, held, available)
+        del result["sequence"]
+        return result
+
+    def add_edge(self, tail, head):
+        """
+        Add an edge between two node numbers.
+
+        Returns:
+            list: The cycle the edge closes, or None
+        """
+        rank = self.rank
+        if rank[tail] < rank[head]:
+            self._link(tail, head)
+            return None
+
+        path, reached = self._forward(head, tail)
+        if path is not None:
+            cycle = [self.names[v] for v in [tail] + path]
+            self.held_back.append((tail, head, cycle))
+            return cycle
+        self._reorder(head, tail, reached)
+        self._link(tail, head)
+        return None
+
+    def remove_edge(self, tail, head):
+        """Remove one edge between two node numbers."""
+        for i, (t, h, _) in enumerate(self.held_back):
+            if t == tail and h == head:
+                del self.held_back[i]
+                return
+        try:
+            self.successors[tail].remove(head)
+            self.predecessors[head].remove(tail)
+        except ValueError:
+            raise ValueError(f"No edge {self.names[tail]} -> {self.names[head]}") from None
+
+        # The removal may have broken the cycles of held-back edges
+        if self.held_back:
+            held_back = self.held_back
+            self.held_back = []
+            for t, h, _ in held_back:
+                self.add_edge(t, h)
+
+    def _link(self, tail, head):
+        self.successors[tail].append(head)
+        self.predecessors[head].append(tail)
+
+    def _forward(self, head, tail):
+        """
+        Search forwards from ``head`` among nodes ranked at most ``tail``.
+
+        Returns:
+            (list, iterable): Path of nodes from ``head`` to ``tail`` (None
+            if ``tail`` is not reachable), and the nodes visited
+        """
+        rank = self.rank
+        upper = rank[tail]
+        parent = {head: None}
+        stack = [head]
+        while stack:
+            node = stack.pop()
+            if node == tail:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                path.reverse()
+                return path, parent
+            for succ in self.successors[node]:
+                if succ not in parent and rank[succ] <= upper:
+                    parent[succ] = node
+                    stack.append(succ)
+        return None, parent
+
+    def _reorder(self, head, tail, reached):
+        """Move the nodes reaching ``tail`` ahead of those reachable from ``head``."""
+        rank = self.rank
+        lower = rank[head]
+        seen = {tail}
+        stack = [tail]
+        while stack:
+            node = stack.pop()
+            for pred in self.predecessors[node]:
+                if pred not in seen and rank[pred] > lower:
+                    seen.add(pred)
+                    stack.append(pred)
+
+        backward = sorted(seen, key=rank.__getitem__)
+        forward = sorted(reached, key=rank.__getitem__)
+        positions = sorted(rank[v] for v in backward + forward)
+        for position, node in zip(positions, backward + forward):
+            rank[node] = position
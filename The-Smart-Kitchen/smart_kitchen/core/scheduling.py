@@ -0,0 +1,574 @@
+"""
+Scheduling of order tickets as CPU-style jobs
+"""
+import heapq
+import operator
+import os
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import accumulate
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.workload import percentile
+from smart_kitchen.core.utilization_history import UtilizationSeries
+
+
+def check_job(job_id, arrival, burst):
+    """Reject a job that cannot be scheduled."""
+    if arrival < 0 or burst <= 0:
+        raise ValueError(f"Invalid job {job_id}: arrival must be >= 0 and burst > 0")
+
+
+class FCFSScheduler:
+    """
+    First-come first-served scheduling on a single server.
+
+    Jobs are (id, arrival, burst) tuples. Each scheduled job is returned
+    as a row ``(id, arrival, burst, start, completion, turnaround,
+    waiting)``. Only running totals are kept, so jobs can be streamed
+    through ``feed`` or ``schedule`` in constant memory.
+    """
+
+    def __init__(self):
+        """Initialize an idle server at time 0."""
+        self.clock = 0
+        self.jobs = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.busy_time = 0
+        self.last_arrival = 0
+
+    def feed(self, job_id, arrival, burst):
+        """
+        Schedule the next job in arrival order.
+
+        Args:
+            job_id: Job identifier
+            arrival: Arrival time, no earlier than the previous job's
+            burst: Service time
+
+        Returns:
+            tuple: (id, arrival, burst, start, completion, turnaround, waiting)
+        """
+        check_job(job_id, arrival, burst)
+        if arrival < self.last_arrival:
+            raise ValueError(f"Job {job_id} arrives before the previous job")
+        self.last_arrival = arrival
+
+        start = arrival if arrival > self.clock else self.clock
+        completion = start + burst
+        turnaround = completion - arrival
+        waiting = start - arrival
+        self.clock = completion
+        self.jobs += 1
+        self.total_turnaround += turnaround
+        self.total_waiting += waiting
+        self.busy_time += burst
+        return (job_id, arrival, burst, start, completion, turnaround, waiting)
+
+    def schedule(self, jobs, presorted=False):
+        """
+        Schedule jobs, yielding one row per job in service order.
+
+        Args:
+            jobs: Iterable of (id, arrival, burst) tuples
+            presorted: True if the jobs already come in arrival order, so
+                they are streamed without being held in memory. Otherwise
+                they are sorted by arrival first (ties keep input order).
+        """
+        if not presorted:
+            jobs = sorted(jobs, key=operator.itemgetter(1))
+        feed = self.feed
+        for job_id, arrival, burst in jobs:
+            yield feed(job_id, arrival, burst)
+
+    def summary(self):
+        """
+        Summarize the jobs scheduled so far.
+
+        Returns:
+            dict: Job count, average turnaround and waiting time, makespan
+            and server utilization
+        """
+        jobs = self.jobs
+        return {
+            "jobs": jobs,
+            "average_turnaround": self.total_turnaround / jobs if jobs else 0.0,
+            "average_waiting": self.total_waiting / jobs if jobs else 0.0,
+            "makespan": self.clock,
+            "utilization": self.busy_time / self.clock if self.clock else 0.0,
+        }
+
+
+class MultiServerFCFSScheduler:
+    """
+    First-come first-served scheduling on ``stations`` identical servers.
+
+    Models a line of k identical stations serving one ticket queue
+    (M/G/k): each job, in arrival order, goes to the station that frees
+    up first, found on a min-heap of station free times in O(log k).
+    Rows are ``(id, arrival, burst, station, start, completion,
+    turnaround, waiting)``.
+
+    Jobs start in arrival order, so the jobs still queued when a new one
+    arrives are exactly those whose start lies after that arrival; their
+    start times are kept in a deque whose length is the queue length.
+    Queue lengths seen at each arrival go into a fixed-memory
+    UtilizationSeries (in its in-use column).
+    """
+
+    def __init__(self, stations):
+        """
+        Args:
+            stations: Number of identical stations
+        """
+        if stations < 1:
+            raise ValueError("At least one station is required")
+        self.stations = stations
+        self.free_at = [(0, station) for station in range(stations)]
+        self.busy_time = [0] * stations
+        self.station_jobs = [0] * stations
+        self.jobs = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.makespan = 0
+        self.last_arrival = 0
+        self.queued_starts = deque()
+        self.max_queue_length = 0
+        # Twelve levels cover over 100 million arrivals at the coarsest level;
+        # arrival times may be fractional
+        self.queue_history = UtilizationSeries(levels=12, step_typecode="d")
+
+    def feed(self, job_id, arrival, burst):
+        """
+        Schedule the next job in arrival order.
+
+        Returns:
+            tuple: (id, arrival, burst, station, start, completion, turnaround, waiting)
+        """
+        check_job(job_id, arrival, burst)
+        if arrival < self.last_arrival:
+            raise ValueError(f"Job {job_id} arrives before the previous job")
+        self.last_arrival = arrival
+
+        free_at, station = self.free_at[0]
+        start = arrival if arrival > free_at else free_at
+        completion = start + burst
+        heapq.heapreplace(self.free_at, (completion, station))
+
+        queued = self.queued_starts
+        while queued and queued[0] <= arrival:
+            queued.popleft()
+        if start > arrival:
+            queued.append(start)
+        queue_length = len(queued)
+        if queue_length > self.max_queue_length:
+            self.max_queue_length = queue_length
+        self.queue_history.add(arrival, queue_length, 0)
+
+        turnaround = completion - arrival
+        waiting = start - arrival
+        self.busy_time[station] += burst
+        self.station_jobs[station] += 1
+        self.jobs += 1
+        self.total_turnaround += turnaround
+        self.total_waiting += waiting
+        if completion > self.makespan:
+            self.makespan = completion
+        return (job_id, arrival, burst, station, start, completion, turnaround, waiting)
+
+    def schedule(self, jobs, presorted=False):
+        """
+        Schedule jobs, yielding one row per job in arrival order.
+
+        Args:
+            jobs: Iterable of (id, arrival, burst) tuples
+            presorted: True if the jobs already come in arrival order
+        """
+        if not presorted:
+            jobs = sorted(jobs, key=operator.itemgetter(1))
+        feed = self.feed
+        for job in jobs:
+            yield feed(job[0], job[1], job[2])
+
+    def queue_length_buckets(self, max_points=64):
+        """
+        Return the queue length over time, downsampled.
+
+        Returns:
+            list: Tuples of (start_time, min_length, max_length, mean_length)
+        """
+        return [bucket[:4] for bucket in self.queue_history.buckets(max_points)]
+
+    def summary(self):
+        """
+        Summarize the jobs scheduled so far.
+
+        The mean queue length is time-weighted over the makespan
+        (total waiting time divided by makespan, by Little's law).
+
+        Returns:
+            dict: Job count, stations, average turnaround and waiting
+            time, makespan, per-station jobs and utilization, and mean and
+            maximum queue length
+        """
+        jobs = self.jobs
+        makespan = self.makespan
+        return {
+            "jobs": jobs,
+            "stations": self.stations,
+            "average_turnaround": self.total_turnaround / jobs if jobs else 0.0,
+            "average_waiting": self.total_waiting / jobs if jobs else 0.0,
+            "makespan": makespan,
+            "station_jobs": list(self.station_jobs),
+            "station_utilization": [
+                busy / makespan if makespan else 0.0 for busy in self.busy_time
+            ],
+            "mean_queue_length": self.total_waiting / makespan if makespan else 0.0,
+            "max_queue_length": self.max_queue_length,
+        }
+
+
+def fcfs_arrays(arrivals, bursts):
+    """
+    Compute FCFS start and completion times for whole arrays at once.
+
+    The completion recurrence ``C[i] = max(A[i], C[i-1]) + B[i]`` unrolls
+    to ``C[i] = P[i] + max(A[k] - P[k-1] for k <= i)``, where ``P`` is the
+    running sum of bursts. Both running sum and running maximum are
+    computed by itertools.accumulate with built-in operators, so the loop
+    runs in C rather than bytecode.
+
+    Args:
+        arrivals: Arrival times in non-decreasing order (ValueError otherwise)
+        bursts: Service times, one per arrival
+
+    Returns:
+        (list, list, list, list): Start, completion, turnaround and waiting times
+    """
+    if len(arrivals) != len(bursts):
+        raise ValueError("arrivals and bursts must have the same length")
+    if not arrivals:
+        return [], [], [], []
+    if not all(map(operator.le, arrivals, arrivals[1:])):
+        job_id = next(i for i in range(1, len(arrivals)) if arrivals[i] < arrivals[i - 1])
+        raise ValueError(f"Job {job_id} arrives before the previous job")
+
+    prefix = list(accumulate(bursts))
+    slack = map(operator.sub, arrivals, [0] + prefix[:-1])
+    # The server starts idle at time 0
+    offsets = accumulate(slack, max, initial=0)
+    next(offsets)
+    completion = list(map(operator.add, prefix, offsets))
+    start = list(map(operator.sub, completion, bursts))
+    turnaround = list(map(operator.sub, completion, arrivals))
+    waiting = list(map(operator.sub, start, arrivals))
+    return start, completion, turnaround, waiting
+
+
+class SchedulingPolicy(ABC):
+    """
+    Ready-queue ordering for the event-driven scheduler core.
+
+    The core keeps ready jobs in a heap ordered by ``key``; lower keys run
+    first and ties go to the job that became ready first. ``preemptive``
+    policies take the server from the running job when a job with a lower
+    key arrives, and a ``quantum`` limits how long a job runs before it
+    goes back to the queue.
+    """
+
+    name = "Policy"
+    preemptive = False
+    quantum = None
+
+    @abstractmethod
+    def key(self, job):
+        """
+        Return the heap key of a ready job.
+
+        Args:
+            job: Job state list; see schedule_jobs for the fields
+        """
+
+
+class FCFSPolicy(SchedulingPolicy):
+    """First come, first served."""
+
+    name = "FCFS"
+
+    def key(self, job):
+        return job[JOB_ARRIVAL]
+
+
+class SJFPolicy(SchedulingPolicy):
+    """Non-preemptive shortest job first."""
+
+    name = "SJF"
+
+    def key(self, job):
+        return job[JOB_BURST]
+
+
+class SRTFPolicy(SchedulingPolicy):
+    """Preemptive shortest remaining time first."""
+
+    name = "SRTF"
+    preemptive = True
+
+    def key(self, job):
+        return job[JOB_REMAINING]
+
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """Round robin: jobs take turns of at most ``quantum`` time units."""
+
+    name = "Round Robin"
+
+    def __init__(self, quantum=4):
+        """
+        Args:
+            quantum: Longest time slice a job runs before requeueing
+        """
+        if quantum <= 0:
+            raise ValueError("The quantum must be positive")
+        self.quantum = quantum
+
+    def key(self, job):
+        # Every job is equal, so the queue is FIFO by ready order
+        return 0
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """
+    Priority scheduling with aging; lower numbers mean higher priority.
+
+    A waiting job's effective priority improves by ``aging`` per time unit.
+    All ready jobs age at the same rate, so ordering them by
+    ``priority + aging * ready_since`` is the same as ordering them by
+    effective priority at any moment, and heap keys never need updating.
+    """
+
+    name = "Priority"
+
+    def __init__(self, aging=0.1, preemptive=False):
+        """
+        Args:
+            aging: Priority gained per time unit spent waiting
+            preemptive: Let a higher-priority arrival take the server
+        """
+        self.aging = aging
+        self.preemptive = preemptive
+
+    def key(self, job):
+        return job[JOB_PRIORITY] + self.aging * job[JOB_READY_SINCE]
+
+
+# Fields of the job state lists used by schedule_jobs
+JOB_ID, JOB_ARRIVAL, JOB_BURST, JOB_PRIORITY, JOB_REMAINING, JOB_START, JOB_READY_SINCE = range(7)
+
+
+def schedule_jobs(jobs, policy, presorted=False):
+    """
+    Run jobs through an event-driven single-server scheduler.
+
+    Time jumps from event to event (arrivals, completions, quantum
+    expiries), and ready jobs wait in a heap ordered by the policy, so each
+    event costs O(log n). Arrivals at the end of a time slice are queued
+    before the job whose slice ended.
+
+    Args:
+        jobs: Iterable of (id, arrival, burst) or (id, arrival, burst, priority) tuples
+        policy: SchedulingPolicy deciding the order of ready jobs
+        presorted: True if jobs already come in arrival order, so they are
+            streamed rather than sorted first
+
+    Yields:
+        tuple: (id, arrival, burst, start, completion, turnaround, waiting)
+        per job as it completes; start is when the job first ran
+    """
+    if not presorted:
+        jobs = sorted(jobs, key=operator.itemgetter(1))
+    pending = iter(jobs)
+    key = policy.key
+    quantum = policy.quantum
+    preemptive = policy.preemptive
+
+    # Heap entries are (key, sequence, job); the sequence keeps ties in ready order
+    ready = []
+    sequence = 0
+    last_arrival = 0
+    upcoming = next(pending, None)
+
+    def enqueue(job):
+        nonlocal sequence
+        job_key = key(job)
+        heapq.heappush(ready, (job_key, sequence, job))
+        sequence += 1
+        return job_key
+
+    def admit(now):
+        """Queue every job arrived by ``now``; return the lowest key admitted."""
+        nonlocal last_arrival, upcoming
+        best = None
+        while upcoming is not None and upcoming[1] <= now:
+            job_id, arrival, burst = upcoming[0], upcoming[1], upcoming[2]
+            check_job(job_id, arrival, burst)
+            if arrival < last_arrival:
+                raise ValueError(f"Job {job_id} arrives before the previous job")
+            last_arrival = arrival
+            priority = upcoming[3] if len(upcoming) > 3 else 0
+            job_key = enqueue([job_id, arrival, burst, priority, burst, None, arrival])
+            if best is None or job_key < best:
+                best = job_key
+            upcoming = next(pending, None)
+        return best
+
+    clock = 0
+    while True:
+        admit(clock)
+        if not ready:
+            if upcoming is None:
+                return
+            clock = max(clock, upcoming[1])
+            continue
+
+        job = heapq.heappop(ready)[2]
+        if job[JOB_START] is None:
+            job[JOB_START] = clock
+        # Decided before any subtraction: with fractional times the
+        # remaining time never lands exactly on zero
+        remaining = job[JOB_REMAINING]
+        slice_start = clock
+        finishes = quantum is None or remaining <= quantum
+        if finishes:
+            run_until = clock + remaining
+        else:
+            run_until = clock + quantum
+
+        # A preemptive policy re-decides at every arrival within the slice
+        preempted = False
+        while preemptive:
+            if upcoming is None or upcoming[1] >= run_until:
+                break
+            clock = upcoming[1]
+            # Measured from the slice start, so repeated arrivals do not accumulate rounding
+            job[JOB_REMAINING] = remaining - (clock - slice_start)
+            best = admit(clock)
+            if best is not None and best < key(job):
+                preempted = True
+                break
+
+        if not preempted:
+            clock = run_until
+            if finishes:
+                job[JOB_REMAINING] = 0
+                job_id, arrival, burst, _, _, start, _ = job
+                yield (job_id, arrival, burst, start, clock, clock - arrival, clock - arrival - burst)
+                continue
+            job[JOB_REMAINING] = remaining - quantum
+            # Time slice over: queue arrivals first, then the job itself
+            admit(clock)
+        job[JOB_READY_SINCE] = clock
+        enqueue(job)
+
+
+def generate_jobs(count, mean_interarrival=5.0, mean_burst=4.0, priorities=10, seed=None):
+    """
+    Generate a random order-ticket workload.
+
+    Arrivals are a Poisson process and bursts exponentially distributed,
+    both rounded to whole time units (bursts to at least 1).
+
+    Args:
+        count: Number of jobs
+        mean_interarrival: Mean time between arrivals
+        mean_burst: Mean service time
+        priorities: Number of priority levels (0 is the highest)
+        seed: Optional random seed
+
+    Returns:
+        list: (id, arrival, burst, priority) tuples in arrival order
+    """
+    rng = random.Random(seed)
+    jobs = []
+    arrival = 0.0
+    for job_id in range(count):
+        arrival += rng.expovariate(1 / mean_interarrival)
+        burst = max(1, round(rng.expovariate(1 / mean_burst)))
+        jobs.append((job_id, int(arrival), burst, rng.randrange(priorities)))
+    return jobs
+
+
+def default_policies(quantum=4, aging=0.1):
+    """Return one instance of every scheduling policy."""
+    return [FCFSPolicy(), SJFPolicy(), SRTFPolicy(), RoundRobinPolicy(quantum), PriorityPolicy(aging)]
+
+
+def compare_schedulers(jobs, policies=None, percentiles=(50, 95, 99)):
+    """
+    Run the same workload under several policies.
+
+    Args:
+        jobs: List of jobs in arrival order, e.g. from generate_jobs
+        policies: SchedulingPolicy instances (default: default_policies())
+        percentiles: Turnaround and waiting percentiles to report
+
+    Returns:
+        list: One dictionary per policy with its name, averages and
+        percentiles of turnaround and waiting time, makespan and the wall
+        clock seconds the run took
+    """
+    if policies is None:
+        policies = default_policies()
+    results = []
+    for policy in policies:
+        started = time.perf_counter()
+        turnaround = []
+        waiting = []
+        makespan = 0
+        for row in schedule_jobs(jobs, policy, presorted=True):
+            turnaround.append(row[5])
+            waiting.append(row[6])
+            makespan = row[4]
+        runtime = time.perf_counter() - started
+
+        count = len(turnaround)
+        turnaround.sort()
+        waiting.sort()
+        results.append({
+            "policy": policy.name,
+            "jobs": count,
+            "average_turnaround": sum(turnaround) / count if count else 0.0,
+            "average_waiting": sum(waiting) / count if count else 0.0,
+            "turnaround": {q: percentile(turnaround, q) for q in percentiles},
+            "waiting": {q: percentile(waiting, q) for q in percentiles},
+            "makespan": makespan,
+            "runtime": runtime,
+        })
+    return results
+
+
+def format_scheduler_comparison(results):
+    """Return a scheduler comparison as a plain-text table."""
+    if not results:
+        return "No results"
+    percentiles = list(results[0]["turnaround"])
+    header = f"{'Policy':<14}{'Avg TAT':<10}"
+    header += "".join(f"{'p' + str(q) + ' TAT':<10}" for q in percentiles)
+    header += f"{'Avg WT':<10}"
+    header += "".join(f"{'p' + str(q) + ' WT':<10}" for q in percentiles)
+    header += "Runtime"
+    out = [f"Scheduler Comparison ({results[0]['jobs']} jobs)", header, "-" * len(header)]
+    for result in results:
+        line = f"{result['policy']:<14}{result['average_turnaround']:<10.2f}"
+        line += "".join(f"{result['turnaround'][q]!s:<10}" for q in percentiles)
+        line += f"{result['average_waiting']:<10.2f}"
+        line += "".join(f"{result['waiting'][q]!s:<10}" for q in percentiles)
+        line += f"{result['runtime']:.3f}s"
+        out.append(line)
+    return "\n".join(out)
@@ -0,0 +1,421 @@
+"""
+Headless kitchen simulation engine, independent of any UI toolkit
+"""
+import os
+import random
+import sys
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.utilization_history import UtilizationHistory
+from smart_kitchen.core.simulation_metrics import SimulationMetrics
+from smart_kitchen.core.checkpoint import SimulationCheckpoint
+from smart_kitchen.data.kitchen_data import STAFF_PRIORITY
+
+# Simulation modes, as offered in the simulation tab
+MODE_NORMAL = "Normal(FCFS)"
+MODE_DEADLOCK = "Deadlock Scenario"
+MODE_BANKERS = "Banker's Method of Prevention"
+MODE_RECOVERY = "Detection and Recovery"
+
+SIMULATION_MODES = [MODE_NORMAL, MODE_DEADLOCK, MODE_BANKERS, MODE_RECOVERY]
+
+
+class KitchenSimulationEngine:
+    """
+    Steps a kitchen scenario forward without drawing anything.
+
+    The engine owns the resource manager, the compiled scenario and the
+    per-staff task state, so the UI can run as many steps as it wants and
+    render only the latest snapshot.
+    """
+
+    # Victim cost weights for detection-and-recovery mode
+    VICTIM_PROGRESS_WEIGHT = 1
+    VICTIM_ROLE_WEIGHT = 10
+    VICTIM_HOLD_WEIGHT = 5
+
+    def __init__(self, scenario, mode=MODE_NORMAL, seed=None, task_policy=None):
+        """
+        Initialize the engine for a scenario.
+
+        Args:
+            scenario: Scenario dictionary as found in KITCHEN_SCENARIOS
+            mode: One of SIMULATION_MODES
+            seed: Optional seed for the engine's random number generator
+            task_policy: Optional TaskPolicy that picks each staff member's
+                next task (default: uniformly at random)
+        """
+        self.scenario = scenario
+        self.mode = mode
+        self.rng = random.Random(seed)
+        self.task_policy = task_policy
+        self.current_step = 0
+        self.compiled = CompiledScenario.from_scenario(scenario)
+
+        self.kitchen_manager = KitchenResourceManager(
+            scenario["available"].copy(),
+            [row[:] for row in scenario["max_needs"]],
+            [row[:] for row in scenario["allocated"]]
+        )
+
+        # Task ids and progress per staff index
+        self.staff_tasks = [CompiledScenario.NO_TASK] * self.compiled.num_staff
+        self.task_progress = [0] * self.compiled.num_staff
+        for i in range(self.compiled.num_staff):
+            # Assign initial tasks from the staff's task list
+            if self.compiled.has_tasks(i):
+                self.staff_tasks[i] = self.next_task(i)
+
+        # Units of each equipment type never change, only where they are
+        manager = self.kitchen_manager
+        self.equipment_totals = [
+            manager.available[j] + sum(row[j] for row in manager.allocated)
+            for j in range(self.compiled.num_equipment)
+        ]
+        self.utilization = UtilizationHistory(self.compiled.num_equipment)
+        self.metrics = SimulationMetrics(self.compiled, self.equipment_totals, manager.available)
+
+        self.deadlock_detected = False
+        self.last_checkpoint = None
+        self.tracer = None
+        # Optional callable(equipment_idx) -> bool that tries to add a unit
+        # from outside the kitchen when a request is denied, e.g. a shared pool
+        self.equipment_source = None
+        # Optional Workload that assigns tasks from order queues
+        self.workload = None
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint):
+        """Create an engine in the state captured by ``checkpoint``."""
+        engine = cls(checkpoint.scenario, checkpoint.mode, task_policy=checkpoint.task_policy)
+        engine.restore(checkpoint)
+        return engine
+
+    def checkpoint(self):
+        """
+        Capture the full engine state.
+
+        Rows of the resource matrices that are unchanged since this engine's
+        previous checkpoint are shared with it rather than copied.
+
+        Returns:
+            SimulationCheckpoint: Immutable snapshot of the engine
+        """
+        manager = self.kitchen_manager
+        previous = self.last_checkpoint
+        checkpoint = SimulationCheckpoint(
+            scenario=self.scenario,
+            mode=self.mode,
+            step=self.current_step,
+            deadlock_detected=self.deadlock_detected,
+            available=tuple(manager.available),
+            max_resources=SimulationCheckpoint.share_rows(
+                manager.max_resources, previous.max_resources if previous else None
+            ),
+            allocated=SimulationCheckpoint.share_rows(
+                manager.allocated, previous.allocated if previous else None
+            ),
+            equipment_totals=tuple(self.equipment_totals),
+            staff_tasks=tuple(self.staff_tasks),
+            task_progress=tuple(self.task_progress),
+            rng_state=self.rng.getstate(),
+            utilization=self.utilization.copy(),
+            metrics=self.metrics.copy(),
+            workload=self.workload.copy() if self.workload is not None else None,
+            task_policy=self.task_policy
+        )
+        self.last_checkpoint = checkpoint
+        return checkpoint
+
+    def restore(self, checkpoint):
+        """Return the engine to the state captured by ``checkpoint``."""
+        # A trace cannot go back in time, so restoring ends it
+        self.detach_tracer()
+        self.mode = checkpoint.mode
+        self.current_step = checkpoint.step
+        self.deadlock_detected = checkpoint.deadlock_detected
+        self.kitchen_manager = KitchenResourceManager(
+            list(checkpoint.available),
+            [list(row) for row in checkpoint.max_resources],
+            [list(row) for row in checkpoint.allocated]
+        )
+        self.equipment_totals = list(checkpoint.equipment_totals)
+        self.staff_tasks = list(checkpoint.staff_tasks)
+        self.task_progress = list(checkpoint.task_progress)
+        self.rng.setstate(checkpoint.rng_state)
+        self.utilization = checkpoint.utilization.copy()
+        self.metrics = checkpoint.metrics.copy()
+        # Order queues and assignments must match the restored staff tasks
+        self.workload = checkpoint.workload.copy() if checkpoint.workload is not None else None
+        self.last_checkpoint = checkpoint
+
+    def attach_tracer(self, tracer):
+        """
+        Stream this engine's events to a SimulationTracer from now on.
+
+        Tasks and equipment already held start their slices at the current step.
+        """
+        tracer.attach(self)
+        self.tracer = tracer
+
+    def detach_tracer(self):
+        """Stop tracing, closing open slices and the trace file."""
+        if self.tracer is not None:
+            self.tracer.close(self.current_step)
+            self.tracer = None
+
+    def attach_workload(self, workload):
+        """
+        Take tasks from a Workload's order queues instead of picking them at random.
+
+        Tasks already in progress are finished first.
+        """
+        workload.attach(self)
+        self.workload = workload
+
+    def next_task(self, staff_idx):
+        """Pick a staff member's next task with the task policy, or at random."""
+        if self.task_policy is not None:
+            return self.task_policy.choose(self, staff_idx)
+        return self.rng.choice(self.compiled.staff_task_ids[staff_idx])
+
+    def add_equipment(self, extra_equipment):
+        """
+        Add units of existing equipment types to the kitchen.
+
+        Args:
+            extra_equipment: Mapping of equipment name to number of units to add
+        """
+        for name, units in extra_equipment.items():
+            j = self.compiled.equipment_index.get(name)
+            if j is None:
+                raise ValueError(f"Unknown equipment: {name}")
+            self.kitchen_manager.add_available(j, units)
+            self.equipment_totals[j] += units
+            self.metrics.capacity_changed(j, self.equipment_totals[j], self.current_step)
+
+    def remove_equipment(self, name, units=1):
+        """
+        Take idle units of an equipment type out of the kitchen.
+
+        In Banker's mode the removal is refused if it would leave the
+        kitchen in an unsafe state.
+
+        Args:
+            name: Equipment type name
+            units: Number of idle units to remove
+
+        Returns:
+            bool: True if the units were removed
+        """
+        j = self.compiled.equipment_index.get(name)
+        if j is None:
+            raise ValueError(f"Unknown equipment: {name}")
+        if not self.kitchen_manager.remove_available(j, units, keep_safe=self.mode == MODE_BANKERS):
+            return False
+        self.equipment_totals[j] -= units
+        self.metrics.capacity_changed(j, self.equipment_totals[j], self.current_step)
+        return True
+
+    def step(self):
+        """
+        Simulate a single step in the kitchen workflow.
+
+        Returns:
+            bool: False if a deadlock was detected and the step did not run
+        """
+        if self.deadlock_detected:
+            return False
+
+        # Increment step counter
+        self.current_step += 1
+
+        manager = self.kitchen_manager
+        tracer = self.tracer
+
+        # Check for deadlock if not using Banker's prevention or recovery;
+        # the manager only rescans when the allocation changed since its last check
+        if self.mode not in (MODE_BANKERS, MODE_RECOVERY):
+            if manager.detect_deadlock_incremental():
+                self.deadlock_detected = True
+                if tracer is not None:
+                    tracer.deadlock(self.current_step)
+                return False
+
+        compiled = self.compiled
+        rng = self.rng
+        metrics = self.metrics
+        totals = self.equipment_totals
+        step = self.current_step
+        workload = self.workload
+
+        # Hand newly arrived orders to idle staff
+        if workload is not None:
+            for staff_idx, task_id in workload.dispatch(step):
+                self.staff_tasks[staff_idx] = task_id
+                self.task_progress[staff_idx] = 0
+                if tracer is not None:
+                    tracer.task_started(staff_idx, task_id, step)
+        num_equipment = compiled.num_equipment
+        bankers_mode = self.mode == MODE_BANKERS
+        recovery_mode = self.mode == MODE_RECOVERY
+        # Banker's grants are safety checked, recovery grants are first-come first-served
+        grant = manager.request_resources if bankers_mode else manager.allocate_resources
+        # Outstanding requests of blocked staff, for deadlock detection in recovery mode
+        blocked = {}
+
+        # Process each staff member
+        for staff_idx in range(compiled.num_staff):
+            current_task = self.staff_tasks[staff_idx]
+
+            # Skip if no task assigned
+            if current_task == CompiledScenario.NO_TASK:
+                continue
+
+            # If task is complete, release equipment and assign a new one
+            if self.task_progress[staff_idx] >= 100:
+                metrics.task_completed(staff_idx)
+                held = manager.held_masks[staff_idx]
+                if held:
+                    manager.release_resources(staff_idx, manager.allocated[staff_idx][:])
+                    for j in compiled.indices_of(held):
+                        metrics.allocation_changed(j, totals[j] - manager.available[j], step)
+
+                if workload is not None:
+                    self.staff_tasks[staff_idx] = workload.task_finished(staff_idx, step)
+                else:
+                    self.staff_tasks[staff_idx] = self.next_task(staff_idx)
+                self.task_progress[staff_idx] = 0
+                if tracer is not None:
+                    tracer.task_completed(staff_idx, step)
+                    tracer.task_started(staff_idx, self.staff_tasks[staff_idx], step)
+                continue
+
+            missing = compiled.missing_mask(current_task, manager.held_masks[staff_idx])
+            metrics.waiting(staff_idx, missing, step)
+
+            # If staff has all needed equipment, progress by 5-15%
+            if not missing:
+                progress = self.task_progress[staff_idx] + rng.randint(5, 15)
+                self.task_progress[staff_idx] = min(100, progress)
+            # Otherwise, request the first missing equipment that can be granted
+            elif bankers_mode or recovery_mode:
+                for equipment_idx in compiled.task_need_indices[current_task]:
+                    if not missing >> equipment_idx & 1:
+                        continue
+
+                    request = [0] * num_equipment
+                    request[equipment_idx] = 1
+
+                    success, reason = grant(staff_idx, request)
+                    # Top up from outside the kitchen and try once more, unless
+                    # the request is beyond what the staff member may ever hold
+                    source = self.equipment_source
+                    if (not success and source is not None
+                            and reason != "Request exceeds maximum need"
+                            and source(equipment_idx)):
+                        success, reason = grant(staff_idx, request)
+                    metrics.request(reason)
+                    if success:
+                        metrics.allocation_changed(
+                            equipment_idx, totals[equipment_idx] - manager.available[equipment_idx], step
+                        )
+                        if tracer is not None:
+                            tracer.equipment_granted(staff_idx, equipment_idx, step)
+                        missing &= ~(1 << equipment_idx)
+                        break
+                    if tracer is not None:
+                        tracer.request_denied(staff_idx, equipment_idx, reason, step)
+
+                if recovery_mode and missing:
+                    blocked[staff_idx] = [missing >> j & 1 for j in range(num_equipment)]
+
+        if blocked:
+            self.recover_from_deadlock(blocked)
+
+        available = manager.available
+        self.utilization.record(
+            step,
+            [total - free for total, free in zip(totals, available)],
+            available
+        )
+        return True
+
+    def victim_cost(self, staff_idx):
+        """
+        Cost of preempting a staff member's equipment.
+
+        Weighs the task progress that would be lost, the seniority of the
+        role and the number of equipment units that would be taken back.
+        """
+        return (
+            self.VICTIM_PROGRESS_WEIGHT * self.task_progress[staff_idx]
+            + self.VICTIM_ROLE_WEIGHT * STAFF_PRIORITY.get(self.compiled.staff_names[staff_idx], 0)
+            + self.VICTIM_HOLD_WEIGHT * sum(self.kitchen_manager.allocated[staff_idx])
+        )
+
+    def preempt(self, staff_idx):
+        """Take back all equipment from a staff member and restart its task."""
+        manager = self.kitchen_manager
+        step = self.current_step
+        held = manager.held_masks[staff_idx]
+        lost = self.task_progress[staff_idx]
+
+        manager.release_resources(staff_idx, manager.allocated[staff_idx][:])
+        for j in self.compiled.indices_of(held):
+            self.metrics.allocation_changed(j, self.equipment_totals[j] - manager.available[j], step)
+            if self.tracer is not None:
+                self.tracer.equipment_released(staff_idx, j, step)
+
+        self.task_progress[staff_idx] = 0
+        self.metrics.preempted(staff_idx, lost)
+
+    def recover_from_deadlock(self, requests):
+        """
+        Detect deadlocks among blocked staff and break them by preemption.
+
+        Detection only reduces the blocked staff, and each round preempts the
+        cheapest deadlocked staff member that holds equipment until nobody
+        is deadlocked (or only staff holding nothing remain).
+
+        Args:
+            requests: Mapping of blocked staff index to its outstanding request row
+
+        Returns:
+            list: Staff indices preempted, in order
+        """
+        manager = self.kitchen_manager
+        victims = []
+        deadlocked = manager.find_deadlocked_staff(requests)
+        while deadlocked:
+            candidates = [i for i in deadlocked if manager.held_masks[i]]
+            if not candidates:
+                # Waiting on equipment nobody holds; preemption cannot help
+                break
+            victim = min(candidates, key=self.victim_cost)
+            self.preempt(victim)
+            victims.append(victim)
+            del requests[victim]
+            deadlocked = manager.find_deadlocked_staff(requests)
+
+        if victims:
+            self.metrics.deadlock_resolved()
+            if self.tracer is not None:
+                self.tracer.deadlock(self.current_step)
+        return victims
+
+    def run(self, max_steps):
+        """
+        Run up to ``max_steps`` steps, stopping early on deadlock.
+
+        Returns:
+            int: Number of steps actually simulated
+        """
+        steps = 0
+        while steps < max_steps and self.step():
+            steps += 1
+        return steps
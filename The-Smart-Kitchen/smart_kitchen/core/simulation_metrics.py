@@ -0,0 +1,195 @@
+"""
+Incremental simulation metrics: throughput, wait times and utilization
+"""
+
+
+class SimulationMetrics:
+    """
+    Metrics collected while a KitchenSimulationEngine runs.
+
+    Everything is updated from engine events in O(1) per event (per
+    equipment bit for wait changes), and time-based quantities are
+    integrated only when a value changes, so steady-state steps cost
+    nothing beyond a comparison. Time is measured in simulation steps.
+    """
+
+    def __init__(self, compiled, equipment_totals, available, start_step=0):
+        """
+        Initialize empty metrics.
+
+        Args:
+            compiled: CompiledScenario of the simulated kitchen
+            equipment_totals: Units of each equipment type
+            available: Currently available units of each equipment type
+            start_step: Step at which collection starts
+        """
+        self.compiled = compiled
+        self.start_step = start_step
+        num_staff = compiled.num_staff
+        num_equipment = compiled.num_equipment
+
+        # Throughput
+        self.tasks_completed = [0] * num_staff
+        self.role_completed = {}
+
+        # Waiting: the missing-equipment mask each staff member is blocked on
+        self.blocked_steps = [0] * num_equipment
+        self.waiting_mask = [0] * num_staff
+        self.waiting_since = [start_step] * num_staff
+
+        # Time-weighted utilization, integrated on change
+        self.totals = list(equipment_totals)
+        self.in_use = [equipment_totals[j] - available[j] for j in range(num_equipment)]
+        self.usage_area = [0] * num_equipment
+        self.capacity_area = [0] * num_equipment
+        self.usage_since = [start_step] * num_equipment
+
+        # Request outcomes keyed by the manager's reason message
+        self.request_outcomes = {}
+
+        # Detection and recovery: deadlocks broken, staff preempted and the
+        # task progress (in percent of a task) thrown away by preemption
+        self.recoveries = 0
+        self.preemptions = 0
+        self.lost_progress = 0
+
+    def copy(self):
+        """Return an independent copy of the metrics."""
+        clone = SimulationMetrics.__new__(SimulationMetrics)
+        clone.__dict__.update(self.__dict__)
+        for name in ("tasks_completed", "blocked_steps", "waiting_mask", "waiting_since",
+                     "totals", "in_use", "usage_area", "capacity_area", "usage_since"):
+            setattr(clone, name, getattr(self, name)[:])
+        clone.role_completed = dict(self.role_completed)
+        clone.request_outcomes = dict(self.request_outcomes)
+        return clone
+
+    def task_completed(self, staff_idx):
+        """Record that a staff member finished a task."""
+        self.tasks_completed[staff_idx] += 1
+        role = self.compiled.staff_names[staff_idx]
+        self.role_completed[role] = self.role_completed.get(role, 0) + 1
+
+    def waiting(self, staff_idx, missing_mask, step):
+        """
+        Record the equipment a staff member is waiting for at ``step``.
+
+        Only a change of the mask does any work: the time spent waiting on
+        the previous mask is charged to each of its equipment types.
+        """
+        previous = self.waiting_mask[staff_idx]
+        if missing_mask == previous:
+            return
+        if previous:
+            elapsed = step - self.waiting_since[staff_idx]
+            for j in self.compiled.indices_of(previous):
+                self.blocked_steps[j] += elapsed
+        self.waiting_mask[staff_idx] = missing_mask
+        self.waiting_since[staff_idx] = step
+
+    def request(self, reason):
+        """Record the outcome of a resource request by its reason message."""
+        self.request_outcomes[reason] = self.request_outcomes.get(reason, 0) + 1
+
+    def preempted(self, staff_idx, lost_progress):
+        """Record that a staff member lost its equipment and task progress."""
+        self.preemptions += 1
+        self.lost_progress += lost_progress
+
+    def deadlock_resolved(self):
+        """Record that a deadlock was broken by preemption."""
+        self.recoveries += 1
+
+    def _fold_usage(self, equipment_idx, step):
+        """Integrate utilization of one equipment type up to ``step``."""
+        elapsed = step - self.usage_since[equipment_idx]
+        if elapsed:
+            self.usage_area[equipment_idx] += self.in_use[equipment_idx] * elapsed
+            self.capacity_area[equipment_idx] += self.totals[equipment_idx] * elapsed
+            self.usage_since[equipment_idx] = step
+
+    def allocation_changed(self, equipment_idx, in_use, step):
+        """Record a new in-use count for an equipment type."""
+        self._fold_usage(equipment_idx, step)
+        self.in_use[equipment_idx] = in_use
+
+    def capacity_changed(self, equipment_idx, total, step):
+        """Record a new number of units for an equipment type."""
+        self._fold_usage(equipment_idx, step)
+        self.totals[equipment_idx] = total
+
+    def blocked_time(self, equipment_idx, step):
+        """Return total staff-steps spent blocked on an equipment type up to ``step``."""
+        blocked = self.blocked_steps[equipment_idx]
+        for i, mask in enumerate(self.waiting_mask):
+            if mask >> equipment_idx & 1:
+                blocked += step - self.waiting_since[i]
+        return blocked
+
+    def utilization(self, equipment_idx, step):
+        """Return the time-weighted utilization of an equipment type up to ``step``."""
+        elapsed = step - self.usage_since[equipment_idx]
+        usage = self.usage_area[equipment_idx] + self.in_use[equipment_idx] * elapsed
+        capacity = self.capacity_area[equipment_idx] + self.totals[equipment_idx] * elapsed
+        return usage / capacity if capacity else 0.0
+
+    def summary(self, step):
+        """
+        Summarize the metrics up to ``step``.
+
+        Returns:
+            dict: Steps covered, tasks per staff and role, blocked time and
+            utilization per equipment, request outcome counts and recovery
+            counts
+        """
+        compiled = self.compiled
+        return {
+            "steps": step - self.start_step,
+            "tasks_per_staff": list(zip(compiled.staff_names, self.tasks_completed)),
+            "tasks_per_role": dict(self.role_completed),
+            "equipment": [
+                (name, self.blocked_time(j, step), self.utilization(j, step))
+                for j, name in enumerate(compiled.equipment_names)
+            ],
+            "requests": dict(self.request_outcomes),
+            "recoveries": self.recoveries,
+            "preemptions": self.preemptions,
+            "lost_progress": self.lost_progress,
+        }
+
+    def format_summary(self, step):
+        """Return the summary as a plain-text table."""
+        summary = self.summary(step)
+        steps = summary["steps"]
+        out = []
+        out.append(f"Simulation Metrics ({steps} steps)\n" + "-" * 40)
+
+        out.append("\nTasks Completed:")
+        out.append(f"{'Staff':<24}{'Tasks':<8}{'Per 100 steps'}")
+        for staff, tasks in summary["tasks_per_staff"]:
+            rate = tasks * 100 / steps if steps else 0.0
+            out.append(f"{staff:<24}{tasks:<8}{rate:.2f}")
+        completed = sum(tasks for _, tasks in summary["tasks_per_staff"])
+        rate = completed * 100 / steps if steps else 0.0
+        out.append(f"{'All staff':<24}{completed:<8}{rate:.2f}")
+        out.append(f"{'By role':<24}{'Tasks'}")
+        for role, tasks in sorted(summary["tasks_per_role"].items()):
+            out.append(f"  {role:<22}{tasks}")
+
+        out.append("\nEquipment:")
+        out.append(f"{'Equipment':<24}{'Blocked (staff-steps)':<24}{'Utilization'}")
+        for name, blocked, utilization in summary["equipment"]:
+            out.append(f"{name:<24}{blocked:<24}{utilization * 100:.1f}%")
+
+        out.append("\nRequests:")
+        if not summary["requests"]:
+            out.append("  None")
+        for reason, count in sorted(summary["requests"].items()):
+            out.append(f"  {reason:<40}{count}")
+
+        if summary["recoveries"]:
+            out.append("\nRecovery:")
+            out.append(f"  {'Deadlocks resolved':<40}{summary['recoveries']}")
+            out.append(f"  {'Staff preempted':<40}{summary['preemptions']}")
+            out.append(f"  {'Work lost (tasks)':<40}{summary['lost_progress'] / 100:.2f}")
+        return "\n".join(out)
@@ -0,0 +1,173 @@
+"""
+Chrome Trace Event export of simulation timelines
+"""
+import json
+
+
+class ChromeTraceWriter:
+    """
+    Streams Chrome Trace Event JSON (array format) to a file.
+
+    Events are written as soon as they are emitted, so the size of a trace
+    is limited by the disk rather than by memory. The output opens in
+    chrome://tracing and in the Perfetto UI.
+    """
+
+    def __init__(self, path):
+        """
+        Open the trace file and write the array header.
+
+        Args:
+            path: Output file path
+        """
+        self.path = path
+        self.events_written = 0
+        self._file = open(path, "w")
+        self._file.write("[\n")
+
+    def emit(self, event):
+        """Write a single trace event dictionary."""
+        if self.events_written:
+            self._file.write(",\n")
+        self._file.write(json.dumps(event, separators=(",", ":")))
+        self.events_written += 1
+
+    def close(self):
+        """Terminate the JSON array and close the file."""
+        if self._file is None:
+            return
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SimulationTracer:
+    """
+    Turns KitchenSimulationEngine events into trace events.
+
+    Every staff member is a track (thread) of one kitchen process. Tasks are
+    duration slices on that track, equipment holds are slices nested inside
+    the task, denied requests are thread-scoped instant events and
+    deadlocks are global instant events. Only the start step of each open
+    slice is kept in memory; slices are written when they end.
+    """
+
+    PID = 1
+
+    def __init__(self, writer, step_us=1000):
+        """
+        Initialize the tracer.
+
+        Args:
+            writer: ChromeTraceWriter (or anything with emit/close)
+            step_us: Trace microseconds per simulation step
+        """
+        self.writer = writer
+        self.step_us = step_us
+        self.compiled = None
+        self.task_ids = []
+        self.task_since = []
+        self.hold_since = []
+        self.last_step = 0
+
+    def attach(self, engine):
+        """
+        Describe the engine's kitchen and open slices for its current state.
+
+        Called by KitchenSimulationEngine.attach_tracer; tasks and holds
+        already in progress start at the engine's current step.
+        """
+        compiled = engine.compiled
+        step = engine.current_step
+        self.compiled = compiled
+        self.last_step = step
+
+        emit = self.writer.emit
+        emit({"name": "process_name", "ph": "M", "pid": self.PID,
+              "args": {"name": engine.scenario.get("name", "Kitchen")}})
+        for i, name in enumerate(compiled.staff_names):
+            emit({"name": "thread_name", "ph": "M", "pid": self.PID, "tid": i + 1,
+                  "args": {"name": f"{name} #{i + 1}"}})
+
+        self.task_ids = list(engine.staff_tasks)
+        self.task_since = [step] * compiled.num_staff
+        self.hold_since = [
+            {j: step for j in compiled.indices_of(mask)}
+            for mask in engine.kitchen_manager.held_masks
+        ]
+
+    def _slice(self, staff_idx, name, category, start, end, args=None):
+        """Write a complete ('X') event."""
+        event = {"name": name, "cat": category, "ph": "X", "pid": self.PID, "tid": staff_idx + 1,
+                 "ts": start * self.step_us, "dur": (end - start) * self.step_us}
+        if args:
+            event["args"] = args
+        self.writer.emit(event)
+
+    def _task_name(self, task_id):
+        return self.compiled.task_names[task_id]
+
+    def task_started(self, staff_idx, task_id, step):
+        """Record that a staff member started a task."""
+        self.task_ids[staff_idx] = task_id
+        self.task_since[staff_idx] = step
+        self.last_step = step
+
+    def task_completed(self, staff_idx, step):
+        """Close the staff member's task slice and any equipment holds inside it."""
+        for j in sorted(self.hold_since[staff_idx]):
+            self.equipment_released(staff_idx, j, step)
+        task_id = self.task_ids[staff_idx]
+        if task_id >= 0:
+            self._slice(staff_idx, self._task_name(task_id), "task",
+                        self.task_since[staff_idx], step)
+        self.task_ids[staff_idx] = -1
+        self.last_step = step
+
+    def equipment_granted(self, staff_idx, equipment_idx, step):
+        """Open an equipment hold slice."""
+        self.hold_since[staff_idx].setdefault(equipment_idx, step)
+        self.last_step = step
+
+    def equipment_released(self, staff_idx, equipment_idx, step):
+        """Close an equipment hold slice."""
+        since = self.hold_since[staff_idx].pop(equipment_idx, None)
+        if since is not None:
+            self._slice(staff_idx, self.compiled.equipment_names[equipment_idx], "equipment",
+                        since, step)
+        self.last_step = step
+
+    def request_denied(self, staff_idx, equipment_idx, reason, step):
+        """Write an instant event for a denied equipment request."""
+        self.writer.emit({
+            "name": "Request denied", "cat": "request", "ph": "i", "s": "t",
+            "pid": self.PID, "tid": staff_idx + 1, "ts": step * self.step_us,
+            "args": {"equipment": self.compiled.equipment_names[equipment_idx], "reason": reason}
+        })
+        self.last_step = step
+
+    def deadlock(self, step):
+        """Write a global instant event for a detected deadlock."""
+        self.writer.emit({
+            "name": "Deadlock", "cat": "deadlock", "ph": "i", "s": "g",
+            "pid": self.PID, "tid": 0, "ts": step * self.step_us
+        })
+        self.last_step = step
+
+    def close(self, step=None):
+        """
+        Close every open slice at ``step`` (default: the last traced step)
+        and finish the trace file.
+        """
+        if step is None:
+            step = self.last_step
+        if self.compiled is not None:
+            for i in range(self.compiled.num_staff):
+                self.task_completed(i, step)
+        self.writer.close()
@@ -0,0 +1,403 @@
+"""
+Trace-driven simulation: replay recorded kitchen logs and audit them with Banker's admission
+"""
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+
+EVENT_START = "start"
+EVENT_END = "end"
+
+# Kinds of findings reported by the audit
+FINDING_DELAY = "Banker's delay"
+FINDING_CONFLICT = "Conflict"
+FINDING_CLAIM = "Claim exceeded"
+
+FINDING_KINDS = [FINDING_DELAY, FINDING_CONFLICT, FINDING_CLAIM]
+
+LOG_FIELDS = ("timestamp", "staff", "task", "event")
+
+
+def parse_timestamp(value):
+    """
+    Convert a logged timestamp to seconds.
+
+    Accepts plain numbers (seconds) and ISO 8601 date-times.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value.strip()).timestamp()
+
+
+def read_kitchen_log(path):
+    """
+    Stream events from a kitchen log, one at a time.
+
+    The log is CSV with a header row, or JSON Lines (``.jsonl`` or
+    ``.ndjson``) with one object per line. Either way every record has
+    the fields ``timestamp``, ``staff``, ``task`` and ``event`` (``start``
+    or ``end``). Only one record is held in memory at a time.
+
+    Args:
+        path: Path of the log file
+
+    Yields:
+        tuple: (seconds, staff, task, event) per record
+    """
+    jsonl = os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson")
+    with open(path, "r", newline="") as f:
+        if jsonl:
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = csv.DictReader(f)
+        for line_no, record in enumerate(records, 1):
+            missing = [field for field in LOG_FIELDS if field not in record]
+            if missing:
+                raise ValueError(f"Log record {line_no} is missing: {', '.join(missing)}")
+            yield (
+                parse_timestamp(record["timestamp"]),
+                str(record["staff"]).strip(),
+                str(record["task"]).strip(),
+                str(record["event"]).strip().lower(),
+            )
+
+
+class KitchenLogReplay:
+    """
+    Drives a KitchenSimulationEngine from a recorded kitchen log.
+
+    Tasks start and end when the log says they did, instead of being
+    drawn at random and progressing at a random rate. When a task starts,
+    the staff member takes one unit of every equipment type the task
+    needs, and each unit is first put to Banker's admission:
+
+    - Conflict: no unit was free, so the real kitchen double-booked the
+      equipment. Banker's admission would have queued the task.
+    - Banker's delay: a unit was free, but granting it left an unsafe
+      state, so Banker's admission would have delayed the task.
+    - Claim exceeded: the staff member held more than its declared
+      maximum need, which Banker's admission refuses outright. The claim
+      is raised to cover the unit taken, so later checks see what the
+      staff member really holds.
+
+    The unit is still taken whenever one is free, because the log records
+    what actually happened. Memory is bounded by the kitchen, not the log:
+    findings are counted per equipment and staff member, only the first
+    ``max_examples`` are kept, and ``on_finding`` can stream every one.
+
+    Staff are named in the log either as ``"Role #n"``, the n-th staff
+    member of the kitchen (the track names of the Chrome trace export), or
+    by role alone. A bare role starts on the first idle staff member of
+    that role and ends on the one doing that task.
+    """
+
+    def __init__(self, engine, seconds_per_step=60, max_examples=20, on_finding=None):
+        """
+        Initialize the replay.
+
+        Args:
+            engine: KitchenSimulationEngine of the kitchen the log was recorded in
+            seconds_per_step: Logged seconds per simulation step
+            max_examples: Number of findings kept for the report
+            on_finding: Optional callable(step, staff_idx, task_id, equipment_idx, kind)
+                called for every finding
+        """
+        self.engine = engine
+        self.seconds_per_step = seconds_per_step
+        self.on_finding = on_finding
+        compiled = engine.compiled
+
+        # Tasks come from the log only
+        for i in range(compiled.num_staff):
+            engine.staff_tasks[i] = CompiledScenario.NO_TASK
+            engine.task_progress[i] = 0
+        if engine.tracer is not None:
+            for i in range(compiled.num_staff):
+                engine.tracer.task_completed(i, engine.current_step)
+
+        self.role_staff = {}
+        for i, role in enumerate(compiled.staff_names):
+            self.role_staff.setdefault(role, []).append(i)
+
+        self.start_step = engine.current_step
+        self.first_timestamp = None
+        self.events_read = 0
+        self.tasks_started = 0
+        self.anomalies = {}
+        self.findings = {
+            kind: [0] * compiled.num_equipment for kind in FINDING_KINDS
+        }
+        self.staff_findings = {
+            kind: [0] * compiled.num_staff for kind in FINDING_KINDS
+        }
+        self.tasks_with_findings = {kind: 0 for kind in FINDING_KINDS}
+        self.max_examples = max_examples
+        self.examples = []
+
+    def run(self, events):
+        """
+        Replay a stream of events, such as read_kitchen_log(path).
+
+        Returns:
+            dict: The replay summary
+        """
+        for timestamp, staff, task, event in events:
+            self.feed(timestamp, staff, task, event)
+        self.finish()
+        return self.summary()
+
+    def _anomaly(self, reason):
+        self.anomalies[reason] = self.anomalies.get(reason, 0) + 1
+
+    def _resolve_staff(self, staff, task_id, event):
+        """
+        Find the staff member a logged staff name refers to.
+
+        Returns:
+            (int, str): Staff index, or None and the reason it was not found
+        """
+        compiled = self.engine.compiled
+        role, _, number = staff.partition("#")
+        role = role.strip()
+        if number:
+            try:
+                staff_idx = int(number) - 1
+            except ValueError:
+                return None, "Unknown staff"
+            if 0 <= staff_idx < compiled.num_staff and compiled.staff_names[staff_idx] == role:
+                return staff_idx, None
+            return None, "Unknown staff"
+
+        if role not in self.role_staff:
+            return None, "Unknown staff"
+        tasks = self.engine.staff_tasks
+        for staff_idx in self.role_staff[role]:
+            if event == EVENT_START and tasks[staff_idx] == CompiledScenario.NO_TASK:
+                return staff_idx, None
+            if event == EVENT_END and tasks[staff_idx] == task_id:
+                return staff_idx, None
+        return None, "No idle staff" if event == EVENT_START else "End without start"
+
+    def _advance(self, step):
+        """Move the engine to ``step``, sampling utilization of the step left behind."""
+        engine = self.engine
+        if step <= engine.current_step:
+            return
+        self._record_utilization()
+        engine.current_step = step
+
+    def _record_utilization(self):
+        engine = self.engine
+        available = engine.kitchen_manager.available
+        engine.utilization.record(
+            engine.current_step,
+            [total - free for total, free in zip(engine.equipment_totals, available)],
+            available
+        )
+
+    def feed(self, timestamp, staff, task, event):
+        """
+        Apply one logged event.
+
+        Events that cannot be mapped onto the kitchen are counted by reason
+        and skipped. Events logged out of order are applied at the current step.
+
+        Args:
+            timestamp: Time of the event in seconds
+            staff: Logged staff name
+            task: Logged task name
+            event: "start" or "end"
+        """
+        self.events_read += 1
+        compiled = self.engine.compiled
+        if event not in (EVENT_START, EVENT_END):
+            self._anomaly("Unknown event")
+            return
+        task_id = compiled.task_index.get(task)
+        if task_id is None:
+            self._anomaly("Unknown task")
+            return
+        staff_idx, reason = self._resolve_staff(staff, task_id, event)
+        if staff_idx is None:
+            self._anomaly(reason)
+            return
+
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        elapsed = max(0.0, timestamp - self.first_timestamp)
+        self._advance(self.start_step + int(elapsed // self.seconds_per_step))
+
+        if event == EVENT_START:
+            if self.engine.staff_tasks[staff_idx] != CompiledScenario.NO_TASK:
+                # The log never ended the previous task
+                self._anomaly("Start without end")
+                self._end_task(staff_idx)
+            self._start_task(staff_idx, task_id)
+        elif self.engine.staff_tasks[staff_idx] == task_id:
+            self._end_task(staff_idx)
+        else:
+            self._anomaly("End without start")
+
+    def _start_task(self, staff_idx, task_id):
+        """Start a logged task and audit the equipment it takes."""
+        engine = self.engine
+        manager = engine.kitchen_manager
+        compiled = engine.compiled
+        metrics = engine.metrics
+        tracer = engine.tracer
+        step = engine.current_step
+        totals = engine.equipment_totals
+
+        engine.staff_tasks[staff_idx] = task_id
+        engine.task_progress[staff_idx] = 0
+        self.tasks_started += 1
+        if tracer is not None:
+            tracer.task_started(staff_idx, task_id, step)
+
+        kinds = set()
+        missing = compiled.missing_mask(task_id, manager.held_masks[staff_idx])
+        for equipment_idx in compiled.indices_of(missing):
+            request = [0] * compiled.num_equipment
+            request[equipment_idx] = 1
+
+            success, reason = manager.request_resources(staff_idx, request)
+            metrics.request(reason)
+            if not success:
+                if reason == "Request exceeds maximum need":
+                    kind = FINDING_CLAIM
+                    if manager.available[equipment_idx] > 0:
+                        # Free but beyond the claim: the kitchen took it anyway
+                        manager.raise_claim(
+                            staff_idx, equipment_idx, manager.allocated[staff_idx][equipment_idx] + 1
+                        )
+                        success, _ = manager.allocate_resources(staff_idx, request)
+                elif reason == "Insufficient resources available":
+                    kind = FINDING_CONFLICT
+                else:
+                    kind = FINDING_DELAY
+                    # Free but unsafe: the kitchen took it anyway
+                    success, _ = manager.allocate_resources(staff_idx, request)
+                self._finding(step, staff_idx, task_id, equipment_idx, kind)
+                kinds.add(kind)
+                if tracer is not None:
+                    tracer.request_denied(staff_idx, equipment_idx, reason, step)
+
+            if success:
+                metrics.allocation_changed(
+                    equipment_idx, totals[equipment_idx] - manager.available[equipment_idx], step
+                )
+                if tracer is not None:
+                    tracer.equipment_granted(staff_idx, equipment_idx, step)
+
+        for kind in kinds:
+            self.tasks_with_findings[kind] += 1
+
+    def _end_task(self, staff_idx):
+        """Finish a staff member's task and release everything it holds."""
+        engine = self.engine
+        manager = engine.kitchen_manager
+        step = engine.current_step
+
+        engine.metrics.task_completed(staff_idx)
+        held = manager.held_masks[staff_idx]
+        if held:
+            manager.release_resources(staff_idx, manager.allocated[staff_idx][:])
+            for j in engine.compiled.indices_of(held):
+                engine.metrics.allocation_changed(
+                    j, engine.equipment_totals[j] - manager.available[j], step
+                )
+        engine.staff_tasks[staff_idx] = CompiledScenario.NO_TASK
+        engine.task_progress[staff_idx] = 0
+        if engine.tracer is not None:
+            engine.tracer.task_completed(staff_idx, step)
+
+    def _finding(self, step, staff_idx, task_id, equipment_idx, kind):
+        """Count a finding, keep it as an example and pass it on."""
+        self.findings[kind][equipment_idx] += 1
+        self.staff_findings[kind][staff_idx] += 1
+        if len(self.examples) < self.max_examples:
+            self.examples.append((step, staff_idx, task_id, equipment_idx, kind))
+        if self.on_finding is not None:
+            self.on_finding(step, staff_idx, task_id, equipment_idx, kind)
+
+    def finish(self):
+        """Sample utilization at the last replayed step."""
+        self._record_utilization()
+
+    def summary(self):
+        """
+        Summarize the replay.
+
+        Returns:
+            dict: Events read, log anomalies by kind, tasks started, findings per
+            equipment and per staff member, tasks with each kind of finding,
+            example findings and the engine's metric summary
+        """
+        engine = self.engine
+        compiled = engine.compiled
+        return {
+            "steps": engine.current_step - self.start_step,
+            "events": self.events_read,
+            "anomalies": dict(self.anomalies),
+            "tasks_started": self.tasks_started,
+            "tasks_with_findings": dict(self.tasks_with_findings),
+            "equipment": [
+                (name, {kind: self.findings[kind][j] for kind in FINDING_KINDS})
+                for j, name in enumerate(compiled.equipment_names)
+            ],
+            "staff": [
+                (f"{name} #{i + 1}", {kind: self.staff_findings[kind][i] for kind in FINDING_KINDS})
+                for i, name in enumerate(compiled.staff_names)
+            ],
+            "examples": [
+                (step, f"{compiled.staff_names[i]} #{i + 1}", compiled.task_names[t],
+                 compiled.equipment_names[j], kind)
+                for step, i, t, j, kind in self.examples
+            ],
+            "metrics": engine.metrics.summary(engine.current_step),
+        }
+
+    def format_summary(self):
+        """Return the summary as a plain-text report."""
+        summary = self.summary()
+        out = []
+        out.append(
+            f"Log Replay ({summary['events']} events, {summary['steps']} steps)\n" + "-" * 60
+        )
+        out.append(f"Tasks started: {summary['tasks_started']}")
+        for kind in FINDING_KINDS:
+            out.append(f"  Tasks with {kind.lower():<28}{summary['tasks_with_findings'][kind]}")
+
+        header = "".join(f"{kind:<18}" for kind in FINDING_KINDS).rstrip()
+        out.append("\nBy Equipment:")
+        out.append(f"{'Equipment':<24}{header}")
+        for name, counts in summary["equipment"]:
+            out.append(f"{name:<24}" + "".join(f"{counts[kind]:<18}" for kind in FINDING_KINDS).rstrip())
+
+        out.append("\nBy Staff:")
+        out.append(f"{'Staff':<24}{header}")
+        for name, counts in summary["staff"]:
+            if any(counts.values()):
+                out.append(f"{name[:23]:<24}" + "".join(f"{counts[kind]:<18}" for kind in FINDING_KINDS).rstrip())
+
+        out.append("\nExamples:")
+        if not summary["examples"]:
+            out.append("  None")
+        for step, staff, task, equipment, kind in summary["examples"]:
+            out.append(f"  Step {step}: {kind} - {staff} started {task} needing {equipment}")
+
+        if summary["anomalies"]:
+            out.append("\nLog Anomalies:")
+            for reason, count in sorted(summary["anomalies"].items()):
+                out.append(f"  {reason:<40}{count}")
+        return "\n".join(out)
@@ -0,0 +1,191 @@
+"""
+Fixed-memory equipment utilization history with multi-resolution downsampling
+"""
+from array import array
+
+
+class UtilizationSeries:
+    """
+    Utilization history of a single equipment type.
+
+    Samples of (step, in_use, available) are kept in a stack of ring buffers.
+    Level 0 holds raw samples; each higher level holds buckets that merge
+    ``factor`` buckets of the level below, keeping the min, max and sum of
+    in-use counts. Memory is fixed at ``levels * capacity`` buckets no
+    matter how long the simulation runs, and adding a sample is amortized
+    O(1).
+    """
+
+    def __init__(self, capacity=32, levels=8, factor=4, step_typecode="q"):
+        """
+        Initialize an empty series.
+
+        Args:
+            capacity: Number of buckets kept per level
+            levels: Number of resolution levels
+            factor: Number of lower-level buckets merged into one bucket
+            step_typecode: Array typecode of the time axis, "q" for whole
+                steps or "d" for fractional times
+        """
+        self.capacity = capacity
+        self.levels = levels
+        self.factor = factor
+        self.samples = 0
+
+        # Closed buckets per level, stored column-wise in ring buffers
+        self.start_step = [array(step_typecode, bytes(8 * capacity)) for _ in range(levels)]
+        self.in_use_min = [array("i", bytes(4 * capacity)) for _ in range(levels)]
+        self.in_use_max = [array("i", bytes(4 * capacity)) for _ in range(levels)]
+        self.in_use_sum = [array("q", bytes(8 * capacity)) for _ in range(levels)]
+        self.available_sum = [array("q", bytes(8 * capacity)) for _ in range(levels)]
+        self.count = [array("i", bytes(4 * capacity)) for _ in range(levels)]
+        self.head = [0] * levels      # Next slot to write
+        self.size = [0] * levels      # Closed buckets held
+        self.closed = [0] * levels    # Closed buckets ever written
+
+        # Open (partial) bucket per level above 0
+        self.open = [None] * levels
+        self.open_children = [0] * levels
+
+    def add(self, step, in_use, available):
+        """Record one sample."""
+        self.samples += 1
+        self._close(0, step, in_use, in_use, in_use, available, 1)
+
+    def _close(self, level, step, low, high, in_use_sum, available_sum, count):
+        """Store a closed bucket at ``level`` and merge it into the level above."""
+        slot = self.head[level]
+        self.start_step[level][slot] = step
+        self.in_use_min[level][slot] = low
+        self.in_use_max[level][slot] = high
+        self.in_use_sum[level][slot] = in_use_sum
+        self.available_sum[level][slot] = available_sum
+        self.count[level][slot] = count
+        self.head[level] = slot + 1 if slot + 1 < self.capacity else 0
+        if self.size[level] < self.capacity:
+            self.size[level] += 1
+        self.closed[level] += 1
+
+        parent = level + 1
+        if parent == self.levels:
+            return
+
+        # Merge into the parent's open bucket in place
+        bucket = self.open[parent]
+        if bucket is None:
+            self.open[parent] = [step, low, high, in_use_sum, available_sum, count]
+            self.open_children[parent] = 1
+            return
+        if low < bucket[1]:
+            bucket[1] = low
+        if high > bucket[2]:
+            bucket[2] = high
+        bucket[3] += in_use_sum
+        bucket[4] += available_sum
+        bucket[5] += count
+        self.open_children[parent] += 1
+        if self.open_children[parent] == self.factor:
+            self.open[parent] = None
+            self._close(parent, *bucket)
+
+    @staticmethod
+    def _merge(left, right):
+        """Merge two buckets, ``left`` possibly being None."""
+        if left is None:
+            return list(right)
+        return [
+            left[0],
+            min(left[1], right[1]),
+            max(left[2], right[2]),
+            left[3] + right[3],
+            left[4] + right[4],
+            left[5] + right[5],
+        ]
+
+    def copy(self):
+        """Return an independent copy of the series."""
+        clone = UtilizationSeries.__new__(UtilizationSeries)
+        clone.capacity = self.capacity
+        clone.levels = self.levels
+        clone.factor = self.factor
+        clone.samples = self.samples
+        for name in ("start_step", "in_use_min", "in_use_max", "in_use_sum", "available_sum", "count"):
+            setattr(clone, name, [column[:] for column in getattr(self, name)])
+        clone.head = self.head[:]
+        clone.size = self.size[:]
+        clone.closed = self.closed[:]
+        clone.open = [bucket[:] if bucket is not None else None for bucket in self.open]
+        clone.open_children = self.open_children[:]
+        return clone
+
+    def _covers_everything(self, level):
+        """Return True if ``level`` still holds every sample recorded."""
+        return self.closed[level] == self.size[level]
+
+    def buckets(self, max_points):
+        """
+        Return the history downsampled to at most about ``max_points`` buckets.
+
+        The finest level that still covers the whole run within
+        ``max_points`` buckets is used; if none does, the coarsest level's
+        most recent buckets are returned. The cost is O(capacity),
+        independent of run length.
+
+        Returns:
+            list: Tuples of (start_step, in_use_min, in_use_max, in_use_mean, available_mean)
+        """
+        if not self.samples:
+            return []
+
+        chosen = self.levels - 1
+        for level in range(self.levels):
+            if self._covers_everything(level) and self.size[level] + 1 <= max_points:
+                chosen = level
+                break
+
+        result = []
+        first = (self.head[chosen] - self.size[chosen]) % self.capacity
+        for k in range(self.size[chosen]):
+            slot = (first + k) % self.capacity
+            count = self.count[chosen][slot]
+            result.append((
+                self.start_step[chosen][slot],
+                self.in_use_min[chosen][slot],
+                self.in_use_max[chosen][slot],
+                self.in_use_sum[chosen][slot] / count,
+                self.available_sum[chosen][slot] / count,
+            ))
+
+        # Samples not yet closed into the chosen level sit in the open buckets
+        # at and below it, oldest at the chosen level
+        tail = None
+        for level in range(chosen, 0, -1):
+            if self.open[level] is not None:
+                tail = self._merge(tail, self.open[level])
+        if tail is not None:
+            result.append((
+                tail[0], tail[1], tail[2], tail[3] / tail[5], tail[4] / tail[5]
+            ))
+        return result
+
+
+class UtilizationHistory:
+    """Utilization series for every equipment type in a scenario."""
+
+    def __init__(self, num_equipment, capacity=32, levels=8, factor=4):
+        """Initialize one empty series per equipment type."""
+        self.series = [
+            UtilizationSeries(capacity, levels, factor)
+            for _ in range(num_equipment)
+        ]
+
+    def copy(self):
+        """Return an independent copy of every series."""
+        clone = UtilizationHistory(0)
+        clone.series = [series.copy() for series in self.series]
+        return clone
+
+    def record(self, step, in_use, available):
+        """Record the in-use and available counts of every equipment type."""
+        for j, series in enumerate(self.series):
+            series.add(step, in_use[j], available[j])
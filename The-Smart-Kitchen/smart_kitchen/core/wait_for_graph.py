@@ -0,0 +1,199 @@
+"""
+Wait-for graph kept in step with a KitchenResourceManager for live deadlock diagnosis
+"""
+import os
+import sys
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.resource_graph import DynamicResourceGraph
+
+
+class KitchenWaitForGraph:
+    """
+    Resource allocation graph derived from a kitchen manager's state.
+
+    Every unit a staff member holds is an assignment edge and every unit
+    of an outstanding (denied) request is a request edge. Requests and
+    releases go through this adapter, which forwards them to the manager
+    and then changes only the edges of the units involved, so the
+    incremental cycle check of DynamicResourceGraph costs time in
+    proportion to the change. A kitchen with no cycle cannot be
+    deadlocked, so diagnose() answers at once in the common case and only
+    reduces the staff that can reach a cycle while one exists.
+    """
+
+    def __init__(self, manager, staff_names=None, equipment_names=None):
+        """
+        Build the graph from the manager's current allocation.
+
+        Args:
+            manager: KitchenResourceManager to follow
+            staff_names: Names of the staff members, default "Staff 1", ...
+            equipment_names: Names of the equipment types, default "Equipment 1", ...
+        """
+        self.manager = manager
+        num_staff = manager.num_staff
+        num_equipment = manager.num_equipment
+        if staff_names is None:
+            staff_names = [f"Staff {i + 1}" for i in range(num_staff)]
+        if equipment_names is None:
+            equipment_names = [f"Equipment {j + 1}" for j in range(num_equipment)]
+        if len(staff_names) != num_staff or len(equipment_names) != num_equipment:
+            raise ValueError("Expected one name per staff member and equipment type")
+
+        self.graph = DynamicResourceGraph(staff_names, equipment_names)
+        # Units mirrored as assignment edges, per staff member and in total
+        self.held = [[0] * num_equipment for _ in range(num_staff)]
+        self.held_totals = [0] * num_equipment
+        # Outstanding request row of each waiting staff member
+        self.requests = {}
+        self._diagnosis = None
+        self._diagnosed_available = None
+        self.sync()
+
+    def request(self, staff_id, request, check_safety=True):
+        """
+        Ask the manager for equipment and record the request if it must wait.
+
+        A staff member has at most one outstanding request: a new request
+        replaces the previous one, and a granted request clears it.
+        Requests beyond the staff member's maximum need are invalid, and
+        requests for more units than the kitchen owns could never be met,
+        so neither is recorded as waiting.
+
+        Args:
+            staff_id: Index of the staff member making the request
+            request: List of requested equipment counts
+            check_safety: Use the Banker's check (request_resources) rather
+                than a first-come first-served grant (allocate_resources)
+
+        Returns:
+            (bool, str): Whether the request was granted and why
+        """
+        manager = self.manager
+        grant = manager.request_resources if check_safety else manager.allocate_resources
+        success, reason = grant(staff_id, request)
+        self.withdraw(staff_id)
+        if success:
+            self._sync_staff(staff_id)
+        elif reason != "Request exceeds maximum need" and all(
+            units <= free + held
+            for units, free, held in zip(request, manager.available, self.held_totals)
+        ):
+            self.wait(staff_id, request)
+        return success, reason
+
+    def wait(self, staff_id, request):
+        """
+        Record an outstanding request without asking the manager.
+
+        Used to carry waiting requests over to the graph of a rebuilt
+        manager; a new request replaces the previous one.
+        """
+        self.withdraw(staff_id)
+        self._add_edges(staff_id, request, True)
+        self.requests[staff_id] = request[:]
+
+    def release(self, staff_id, release):
+        """
+        Return equipment to the manager and drop the matching assignment edges.
+
+        Returns:
+            (bool, str): Whether the equipment was released and why
+        """
+        success, reason = self.manager.release_resources(staff_id, release)
+        if success:
+            self._sync_staff(staff_id)
+        return success, reason
+
+    def withdraw(self, staff_id):
+        """Drop a staff member's outstanding request, if any."""
+        request = self.requests.pop(staff_id, None)
+        if request is not None:
+            self._remove_edges(staff_id, request, True)
+
+    def sync(self):
+        """
+        Bring the assignment edges up to date with the whole allocation.
+
+        Only needed after the manager was changed without going through
+        this adapter; costs O(staff x equipment) plus the changed edges.
+        """
+        for staff_id in range(self.manager.num_staff):
+            self._sync_staff(staff_id)
+
+    def diagnose(self):
+        """
+        Diagnose deadlock among the waiting staff.
+
+        The result is cached until the graph or the available equipment
+        changes. Without a cycle the answer needs no search; with one,
+        the staff that can reach it are reduced over the instance counts,
+        because a cycle through a multi-instance resource can have an
+        escape.
+
+        Returns:
+            dict: ``deadlocked`` (bool), ``deadlocked_staff`` (indices on
+            an unbreakable cycle), ``blocked_staff`` (indices waiting
+            behind them) and ``cycles`` (one cycle of names per
+            deadlocked group)
+        """
+        available = tuple(self.manager.available)
+        if self._diagnosis is not None and available == self._diagnosed_available:
+            return self._diagnosis
+
+        graph = self.graph
+        graph.instances = [free + held for free, held in zip(available, self.held_totals)]
+        result = graph.find_deadlock()
+        node_of = graph.node_of
+        diagnosis = {
+            "deadlocked": result["deadlocked"],
+            "deadlocked_staff": [node_of[name] for name in result["deadlocked_processes"]],
+            "blocked_staff": [node_of[name] for name in result["blocked_processes"]],
+            "cycles": result["cycles"],
+        }
+        self._diagnosis = diagnosis
+        self._diagnosed_available = available
+        return diagnosis
+
+    def _sync_staff(self, staff_id):
+        """Add or remove assignment edges until they match one allocation row."""
+        allocated = self.manager.allocated[staff_id]
+        held = self.held[staff_id]
+        if allocated == held:
+            return
+        gained = [max(0, a - h) for a, h in zip(allocated, held)]
+        lost = [max(0, h - a) for a, h in zip(allocated, held)]
+        self._remove_edges(staff_id, lost, False)
+        self._add_edges(staff_id, gained, False)
+        for j, count in enumerate(allocated):
+            self.held_totals[j] += count - held[j]
+        self.held[staff_id] = allocated[:]
+
+    def _add_edges(self, staff_id, units, is_request):
+        """Add one request or assignment edge per unit."""
+        graph = self.graph
+        first_equipment = self.manager.num_staff
+        for j, count in enumerate(units):
+            node = first_equipment + j
+            for _ in range(count):
+                if is_request:
+                    graph.add_edge(staff_id, node)
+                else:
+                    graph.add_edge(node, staff_id)
+        self._diagnosis = None
+
+    def _remove_edges(self, staff_id, units, is_request):
+        """Remove one request or assignment edge per unit."""
+        graph = self.graph
+        first_equipment = self.manager.num_staff
+        for j, count in enumerate(units):
+            node = first_equipment + j
+            for _ in range(count):
+                if is_request:
+                    graph.remove_edge(staff_id, node)
+                else:
+                    graph.remove_edge(node, staff_id)
+        self._diagnosis = None
@@ -0,0 +1,434 @@
+"""
+Order-arrival workloads: order streams, per-role task queues and load sweeps
+"""
+import copy
+import json
+import math
+import os
+import random
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine
+
+
+class OrderStream(ABC):
+    """
+    Source of customer orders, each expanded into a list of task names.
+
+    Subclasses implement ``orders_at(step)``. Random orders are expanded
+    by ``expand``, which picks one task from each of ``tasks_per_order``
+    different roles present in the kitchen.
+    """
+
+    def __init__(self, tasks_per_order=3, seed=None):
+        """
+        Initialize the stream.
+
+        Args:
+            tasks_per_order: Number of tasks (from distinct roles) per random order
+            seed: Optional seed for the stream's random number generator
+        """
+        self.tasks_per_order = tasks_per_order
+        self.rng = random.Random(seed)
+        self.menu = {}
+        self._roles = []
+
+    def bind(self, compiled, servable):
+        """
+        Learn which roles and tasks the simulated kitchen offers.
+
+        Args:
+            compiled: CompiledScenario of the kitchen
+            servable: Set of task ids the kitchen's staff can actually perform
+        """
+        self.menu = {}
+        for role, i in compiled.staff_index.items():
+            tasks = [compiled.task_names[t] for t in compiled.staff_task_ids[i] if t in servable]
+            if tasks:
+                self.menu[role] = tasks
+        self._roles = sorted(self.menu)
+
+    def expand(self):
+        """Return the task names of one random order."""
+        count = min(self.tasks_per_order, len(self._roles))
+        return [self.rng.choice(self.menu[role]) for role in self.rng.sample(self._roles, count)]
+
+    def copy(self):
+        """Return a copy with its own random state; the menu and recorded orders are shared."""
+        clone = copy.copy(self)
+        clone.rng = random.Random()
+        clone.rng.setstate(self.rng.getstate())
+        return clone
+
+    @abstractmethod
+    def orders_at(self, step):
+        """Return the orders arriving at ``step`` as lists of task names."""
+
+
+class PoissonOrderStream(OrderStream):
+    """Orders arriving as a Poisson process with a fixed rate per step."""
+
+    def __init__(self, rate, tasks_per_order=3, seed=None):
+        """
+        Args:
+            rate: Mean number of orders per simulation step
+        """
+        super().__init__(tasks_per_order, seed)
+        self.rate = rate
+
+    def poisson(self, rate):
+        """Draw a Poisson-distributed count (Knuth's method)."""
+        if rate <= 0:
+            return 0
+        limit = math.exp(-rate)
+        count = 0
+        product = self.rng.random()
+        while product > limit:
+            count += 1
+            product *= self.rng.random()
+        return count
+
+    def rate_at(self, step):
+        """Return the arrival rate in effect at ``step``."""
+        return self.rate
+
+    def orders_at(self, step):
+        return [self.expand() for _ in range(self.poisson(self.rate_at(step)))]
+
+
+class TimeOfDayOrderStream(PoissonOrderStream):
+    """
+    Poisson arrivals whose rate follows a repeating time-of-day curve.
+
+    ``curve`` holds one rate per period of ``steps_per_period`` steps, for
+    example 24 hourly rates with a lunch and a dinner peak.
+    """
+
+    def __init__(self, curve, steps_per_period=60, tasks_per_order=3, seed=None):
+        """
+        Args:
+            curve: List of mean orders per step, one per period
+            steps_per_period: Simulation steps covered by each curve entry
+        """
+        super().__init__(0, tasks_per_order, seed)
+        self.curve = list(curve)
+        self.steps_per_period = steps_per_period
+
+    def rate_at(self, step):
+        return self.curve[(step // self.steps_per_period) % len(self.curve)]
+
+
+class ReplayOrderStream(OrderStream):
+    """
+    Orders replayed from a recorded list.
+
+    Each order is a dictionary with the arrival ``step`` and either the
+    ``tasks`` to perform or ``"random": true`` to expand a random order.
+    """
+
+    def __init__(self, orders, tasks_per_order=3, seed=None):
+        """
+        Args:
+            orders: List of order dictionaries
+        """
+        super().__init__(tasks_per_order, seed)
+        self.by_step = {}
+        for order in orders:
+            self.by_step.setdefault(int(order["step"]), []).append(order)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Load orders from a JSON file holding a list of order dictionaries."""
+        with open(path, "r") as f:
+            return cls(json.load(f), **kwargs)
+
+    def bind(self, compiled, servable):
+        super().bind(compiled, servable)
+        for orders in self.by_step.values():
+            for order in orders:
+                for task in order.get("tasks", []):
+                    if compiled.task_index.get(task) not in servable:
+                        raise ValueError(f"No staff in this kitchen can perform task: {task}")
+
+    def orders_at(self, step):
+        return [
+            self.expand() if order.get("random") else list(order["tasks"])
+            for order in self.by_step.get(step, [])
+        ]
+
+
+class Workload:
+    """
+    Feeds a KitchenSimulationEngine from an order stream through per-role queues.
+
+    Arriving orders are split into tasks, each queued FIFO for the role
+    that performs it. Idle staff take the next task of their role, and an
+    order is complete when its last task is. Staff busy with a task that
+    is not part of an order (such as the engine's initial random tasks)
+    finish it first.
+    """
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: OrderStream that generates the orders
+        """
+        self.stream = stream
+        self.compiled = None
+        self.queues = {}
+        self.idle = {}
+        self.task_role = {}
+        self.staff_order = []
+        self.open_orders = {}
+        self.next_order_id = 0
+        # Completed orders per latency in steps: memory grows with the
+        # spread of latencies, not with the number of orders
+        self.latency_counts = {}
+        self.orders_completed = 0
+        self.orders_arrived = 0
+        self.tasks_queued = 0
+
+    def attach(self, engine):
+        """Bind to an engine's kitchen; called by KitchenSimulationEngine.attach_workload."""
+        compiled = engine.compiled
+        manager = engine.kitchen_manager
+        self.compiled = compiled
+
+        self.queues = {role: deque() for role in compiled.staff_index}
+        self.idle = {role: deque() for role in compiled.staff_index}
+        self.task_role = {}
+        unservable = set()
+        for i, role in enumerate(compiled.staff_names):
+            for task_id in compiled.staff_task_ids[i]:
+                self.task_role.setdefault(task_id, role)
+                if not self.can_perform(manager, compiled, i, task_id):
+                    unservable.add(task_id)
+            if engine.staff_tasks[i] == CompiledScenario.NO_TASK and compiled.has_tasks(i):
+                self.idle[role].append(i)
+        self.staff_order = [None] * compiled.num_staff
+        self.stream.bind(compiled, set(self.task_role) - unservable)
+
+    def copy(self):
+        """
+        Return an independent copy of the queues, open orders and statistics.
+
+        The compiled scenario and the task-to-role table never change
+        after attach(), so they are shared.
+        """
+        clone = Workload.__new__(Workload)
+        clone.stream = self.stream.copy()
+        clone.compiled = self.compiled
+        clone.queues = {role: deque(queue) for role, queue in self.queues.items()}
+        clone.idle = {role: deque(idle) for role, idle in self.idle.items()}
+        clone.task_role = self.task_role
+        clone.staff_order = self.staff_order[:]
+        clone.open_orders = {order_id: order[:] for order_id, order in self.open_orders.items()}
+        clone.next_order_id = self.next_order_id
+        clone.latency_counts = dict(self.latency_counts)
+        clone.orders_completed = self.orders_completed
+        clone.orders_arrived = self.orders_arrived
+        clone.tasks_queued = self.tasks_queued
+        return clone
+
+    @staticmethod
+    def can_perform(manager, compiled, staff_idx, task_id):
+        """
+        Check whether a staff member's claims cover every equipment type a task needs.
+
+        Tasks outside the claims are kept off the menu, since every order
+        containing one would wait forever.
+        """
+        max_row = manager.max_resources[staff_idx]
+        return all(max_row[j] > 0 for j in compiled.task_need_indices[task_id])
+
+    @property
+    def backlog(self):
+        """Number of tasks waiting in the role queues."""
+        return self.tasks_queued
+
+    def dispatch(self, step):
+        """
+        Queue the orders arriving at ``step`` and hand tasks to idle staff.
+
+        Returns:
+            list: (staff index, task id) pairs of newly assigned tasks
+        """
+        touched = set()
+        for tasks in self.stream.orders_at(step):
+            order_id = self.next_order_id
+            self.next_order_id += 1
+            self.orders_arrived += 1
+            self.open_orders[order_id] = [step, len(tasks)]
+            for task in tasks:
+                task_id = self.compiled.task_index[task]
+                role = self.task_role[task_id]
+                self.queues[role].append((order_id, task_id))
+                self.tasks_queued += 1
+                touched.add(role)
+            if not tasks:
+                self._order_done(order_id, step)
+
+        assignments = []
+        for role in touched:
+            queue = self.queues[role]
+            idle = self.idle[role]
+            while queue and idle:
+                staff_idx = idle.popleft()
+                assignments.append((staff_idx, self._take(staff_idx, queue)))
+        return assignments
+
+    def _take(self, staff_idx, queue):
+        """Pop the next queued task for a staff member."""
+        order_id, task_id = queue.popleft()
+        self.tasks_queued -= 1
+        self.staff_order[staff_idx] = order_id
+        return task_id
+
+    def _order_done(self, order_id, step):
+        """Record the latency of a finished order."""
+        arrival, _ = self.open_orders.pop(order_id)
+        latency = step - arrival
+        self.latency_counts[latency] = self.latency_counts.get(latency, 0) + 1
+        self.orders_completed += 1
+
+    def task_finished(self, staff_idx, step):
+        """
+        Account for a finished task and pick the staff member's next one.
+
+        Returns:
+            int: Next task id, or CompiledScenario.NO_TASK if the queue is empty
+        """
+        order_id = self.staff_order[staff_idx]
+        if order_id is not None:
+            self.staff_order[staff_idx] = None
+            order = self.open_orders[order_id]
+            order[1] -= 1
+            if order[1] == 0:
+                self._order_done(order_id, step)
+
+        role = self.compiled.staff_names[staff_idx]
+        queue = self.queues[role]
+        if queue:
+            return self._take(staff_idx, queue)
+        self.idle[role].append(staff_idx)
+        return CompiledScenario.NO_TASK
+
+    def latency_percentiles(self, percentiles=(50, 90, 95, 99)):
+        """Return nearest-rank latency percentiles of completed orders, in steps."""
+        return {
+            q: histogram_percentile(self.latency_counts, self.orders_completed, q)
+            for q in percentiles
+        }
+
+    def summary(self, step):
+        """
+        Summarize the workload up to ``step``.
+
+        Returns:
+            dict: Orders arrived and completed, throughput, open orders,
+            queued tasks and latency percentiles
+        """
+        completed = self.orders_completed
+        return {
+            "orders_arrived": self.orders_arrived,
+            "orders_completed": completed,
+            "orders_per_100_steps": completed * 100 / step if step else 0.0,
+            "open_orders": len(self.open_orders),
+            "queued_tasks": self.tasks_queued,
+            "latency": self.latency_percentiles(),
+        }
+
+
+def percentile(values, q):
+    """Return the nearest-rank ``q``-th percentile of ``values`` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def histogram_percentile(counts, total, q):
+    """
+    Return the nearest-rank ``q``-th percentile of a histogram (None if empty).
+
+    Args:
+        counts: Mapping of value to number of occurrences
+        total: Sum of the counts
+        q: Percentile, 0-100
+    """
+    if not total:
+        return None
+    rank = max(1, math.ceil(q / 100 * total))
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        if seen >= rank:
+            return value
+
+
+def load_sweep(scenario, rates, steps, mode, tasks_per_order=3, seed=None):
+    """
+    Run a scenario under Poisson order streams of increasing rate.
+
+    Args:
+        scenario: Scenario dictionary
+        rates: Mean orders per step to try, in increasing order
+        steps: Steps to simulate per rate
+        mode: Simulation mode
+        tasks_per_order: Tasks per random order
+        seed: Optional seed shared by every run
+
+    Returns:
+        list: One workload summary per rate, with the rate added
+    """
+    results = []
+    for rate in rates:
+        engine = KitchenSimulationEngine(scenario, mode, seed=seed)
+        workload = Workload(PoissonOrderStream(rate, tasks_per_order, seed=seed))
+        engine.attach_workload(workload)
+        engine.run(steps)
+        summary = workload.summary(engine.current_step)
+        summary["rate"] = rate
+        summary["deadlock"] = engine.deadlock_detected
+        results.append(summary)
+    return results
+
+
+def saturation_point(results, completion_ratio=0.9):
+    """
+    Find the lowest rate at which the kitchen stops keeping up.
+
+    A run is saturated when it completes less than ``completion_ratio`` of
+    the orders that arrived, i.e. the backlog grows with the run length.
+
+    Returns:
+        float: The first saturated rate, or None if every rate kept up
+    """
+    for result in results:
+        arrived = result["orders_arrived"]
+        if arrived and result["orders_completed"] < completion_ratio * arrived:
+            return result["rate"]
+    return None
+
+
+def format_load_sweep(results):
+    """Return load sweep results as a plain-text table."""
+    out = []
+    out.append(f"{'Rate':<8}{'Arrived':<9}{'Done':<7}{'Open':<7}{'Queued':<8}{'p50':<7}{'p95':<7}{'p99'}")
+    for result in results:
+        latency = result["latency"]
+        cells = ["-" if latency[q] is None else str(latency[q]) for q in (50, 95, 99)]
+        out.append(
+            f"{result['rate']:<8}{result['orders_arrived']:<9}{result['orders_completed']:<7}"
+            f"{result['open_orders']:<7}{result['queued_tasks']:<8}{cells[0]:<7}{cells[1]:<7}{cells[2]}"
+        )
+    saturated = saturation_point(results)
+    out.append(f"\nSaturation point: {saturated if saturated is not None else 'not reached'}")
+    return "\n".join(out)
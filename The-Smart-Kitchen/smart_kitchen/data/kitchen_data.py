@@ -12,6 +12,10 @@ STAFF_TYPES = [
     "Kitchen Assistant"
 ]
 
+# Seniority of each role, highest first; used to spare senior staff when
+# equipment has to be taken back to break a deadlock
+STAFF_PRIORITY = {role: len(STAFF_TYPES) - i for i, role in enumerate(STAFF_TYPES)}
+
 # Define kitchen equipment types
 EQUIPMENT_TYPES = [
     "Oven",
@@ -0,0 +1,121 @@
+"""
+Unit tests for bulk input files of the algorithm demonstrations.
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.bulk_import import (
+    load_banker_input, load_reference_string, load_jobs, load_rag_input
+)
+
+
+class TestBulkImport(unittest.TestCase):
+    """Test cases for the CSV, JSON and text loaders"""
+
+    def write_file(self, suffix, text):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "w") as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_banker_text_and_json(self):
+        """Test that the block text format and JSON give the same state"""
+        text_path = self.write_file(".txt", (
+            "# available\n"
+            "3 3 2\n"
+            "\n"
+            "7 5 3\n"
+            "3,2,2\n"
+            "\n\n"
+            "0 1 0\n"
+            "2 0 0\n"
+        ))
+        json_path = self.write_file(".json", json.dumps({
+            "available": [3, 3, 2],
+            "max_needs": [[7, 5, 3], [3, 2, 2]],
+            "allocated": [[0, 1, 0], [2, 0, 0]],
+        }))
+        expected = ([3, 3, 2], [[7, 5, 3], [3, 2, 2]], [[0, 1, 0], [2, 0, 0]])
+        self.assertEqual(load_banker_input(text_path), expected)
+        self.assertEqual(load_banker_input(json_path), expected)
+
+    def test_banker_shape_errors(self):
+        """Test that mismatched matrices and over-allocation are rejected"""
+        ragged = self.write_file(".txt", "1 1\n\n1 1\n1\n\n0 0\n0 0\n")
+        with self.assertRaises(ValueError):
+            load_banker_input(ragged)
+        over = self.write_file(".csv", "1,1\n\n1,1\n\n2,0\n")
+        with self.assertRaises(ValueError):
+            load_banker_input(over)
+        missing = self.write_file(".txt", "1 1\n\n1 1\n")
+        with self.assertRaises(ValueError):
+            load_banker_input(missing)
+
+    def test_reference_string(self):
+        """Test references separated by spaces, commas and newlines, and JSON with frames"""
+        path = self.write_file(".csv", "7,0,1\n2 0 3\n")
+        self.assertEqual(load_reference_string(path), ([7, 0, 1, 2, 0, 3], None))
+
+        path = self.write_file(".json", json.dumps({"frames": 3, "references": [1, 2, 3]}))
+        self.assertEqual(load_reference_string(path), ([1, 2, 3], 3))
+
+        path = self.write_file(".txt", "A B A\n")
+        self.assertEqual(load_reference_string(path)[0], ["A", "B", "A"])
+
+        path = self.write_file(".txt", "\n")
+        with self.assertRaises(ValueError):
+            load_reference_string(path)
+
+    def test_jobs(self):
+        """Test job files with and without IDs, headers and stations"""
+        path = self.write_file(".csv", "id,arrival,burst\nA,0,5\nB,1,2.5\n")
+        self.assertEqual(load_jobs(path), ([("A", 0, 5), ("B", 1, 2.5)], None))
+
+        path = self.write_file(".txt", "0 5\n1 3\n")
+        self.assertEqual(load_jobs(path)[0], [("P1", 0, 5), ("P2", 1, 3)])
+
+        path = self.write_file(".json", json.dumps({
+            "stations": 2,
+            "jobs": [{"id": 7, "arrival": 0, "burst": 4}, {"arrival": 1, "burst": 2}, [2, 1]],
+        }))
+        self.assertEqual(load_jobs(path), ([("7", 0, 4), ("P2", 1, 2), ("P3", 2, 1)], 2))
+
+        path = self.write_file(".txt", "0 0\n")
+        with self.assertRaises(ValueError):
+            load_jobs(path)
+
+    def test_rag(self):
+        """Test RAG records, with names taken from the edges"""
+        path = self.write_file(".txt", (
+            "request P1 R1\n"
+            "assign R1 P2\n"
+            "request P2 R2\n"
+            "instances R2 2\n"
+        ))
+        graph = load_rag_input(path)
+        self.assertEqual(graph["processes"], ["P1", "P2"])
+        self.assertEqual(graph["resources"], ["R1", "R2"])
+        self.assertEqual(graph["instances"], [1, 2])
+        self.assertEqual(graph["requests"], [("P1", "R1"), ("P2", "R2")])
+        self.assertEqual(graph["assignments"], [("R1", "P2")])
+
+        path = self.write_file(".json", json.dumps({
+            "resources": ["R1"], "instances": [3],
+            "requests": [["P1", "R1"]], "assignments": [],
+        }))
+        self.assertEqual(load_rag_input(path)["instances"], [3])
+
+        path = self.write_file(".txt", "request P1 R1\nassign P1 R1\n")
+        with self.assertRaises(ValueError):
+            load_rag_input(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for simulation checkpoints and what-if branches.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.checkpoint import run_branches
+from smart_kitchen.core.simulation_engine import (
+    KitchenSimulationEngine, MODE_NORMAL, MODE_BANKERS
+)
+from smart_kitchen.core.task_policy import LeastBlockedTaskPolicy, LookaheadTaskPolicy
+from smart_kitchen.core.workload import PoissonOrderStream, Workload
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestSimulationCheckpoint(unittest.TestCase):
+    """Test cases for checkpointing and forking the simulation engine"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=11)
+        self.engine.run(40)
+
+    def test_restore_replays_identically(self):
+        """Test that restoring a checkpoint replays the same future"""
+        checkpoint = self.engine.checkpoint()
+        self.engine.run(60)
+        expected = (self.engine.staff_tasks[:], self.engine.task_progress[:],
+                    [row[:] for row in self.engine.kitchen_manager.allocated])
+
+        self.engine.restore(checkpoint)
+        self.assertEqual(self.engine.current_step, 40)
+        self.engine.run(60)
+
+        self.assertEqual(
+            (self.engine.staff_tasks, self.engine.task_progress, self.engine.kitchen_manager.allocated),
+            expected
+        )
+
+    def test_restore_rewinds_workload(self):
+        """Test that restoring also rewinds the order queues and statistics"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=4)
+        engine.attach_workload(Workload(PoissonOrderStream(0.3, seed=5)))
+        engine.run(50)
+        checkpoint = engine.checkpoint()
+        engine.run(100)
+        expected = (engine.staff_tasks[:], engine.workload.summary(engine.current_step))
+
+        engine.restore(checkpoint)
+        self.assertEqual(engine.workload.orders_arrived, checkpoint.workload.orders_arrived)
+        engine.run(100)
+        self.assertEqual((engine.staff_tasks, engine.workload.summary(engine.current_step)), expected)
+
+    def test_checkpoint_is_isolated_from_engine(self):
+        """Test that running on does not change an earlier checkpoint"""
+        checkpoint = self.engine.checkpoint()
+        allocated = checkpoint.allocated
+        samples = checkpoint.utilization.series[0].samples
+
+        self.engine.run(50)
+
+        self.assertIs(checkpoint.allocated, allocated)
+        self.assertEqual(checkpoint.step, 40)
+        self.assertEqual(checkpoint.utilization.series[0].samples, samples)
+
+    def test_unchanged_rows_are_shared(self):
+        """Test that consecutive checkpoints share unchanged matrix rows"""
+        first = self.engine.checkpoint()
+        second = self.engine.checkpoint()
+
+        for old_row, new_row in zip(first.max_resources, second.max_resources):
+            self.assertIs(old_row, new_row)
+        for old_row, new_row in zip(first.allocated, second.allocated):
+            self.assertIs(old_row, new_row)
+
+    def test_fork_branches_are_independent(self):
+        """Test that branches do not affect each other or the checkpoint"""
+        checkpoint = self.engine.checkpoint()
+        first, second = checkpoint.fork_many(2)
+        first.run(30)
+
+        self.assertEqual(second.current_step, 40)
+        self.assertEqual(list(checkpoint.task_progress), second.task_progress)
+
+    def test_fork_with_variant(self):
+        """Test forking with a different mode and extra equipment"""
+        checkpoint = self.engine.checkpoint()
+        branch = checkpoint.fork(mode=MODE_NORMAL, extra_equipment={"Stove": 1})
+        stove = branch.compiled.equipment_index["Stove"]
+
+        self.assertEqual(branch.mode, MODE_NORMAL)
+        self.assertEqual(branch.kitchen_manager.available[stove], checkpoint.available[stove] + 1)
+        self.assertEqual(branch.equipment_totals[stove], checkpoint.equipment_totals[stove] + 1)
+        with self.assertRaises(ValueError):
+            checkpoint.fork(extra_equipment={"Blast Chiller": 1})
+
+    def test_fork_keeps_task_policy(self):
+        """Test that branches choose tasks with the engine's policy"""
+        policy = LeastBlockedTaskPolicy()
+        engine = KitchenSimulationEngine(
+            KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=11, task_policy=policy
+        )
+        engine.run(20)
+        checkpoint = engine.checkpoint()
+
+        self.assertIs(checkpoint.fork().task_policy, policy)
+        other = LookaheadTaskPolicy()
+        self.assertIs(checkpoint.fork(task_policy=other).task_policy, other)
+
+        branch = checkpoint.fork()
+        engine.run(30)
+        branch.run(30)
+        self.assertEqual(branch.staff_tasks, engine.staff_tasks)
+
+    def test_run_branches(self):
+        """Test running several variants from one checkpoint"""
+        checkpoint = self.engine.checkpoint()
+        variants = [{}, {"extra_equipment": {"Oven": 2}}, {"seed": 5}]
+
+        results = run_branches(checkpoint, variants, 25, parallel=False)
+
+        self.assertEqual([r["variant"] for r in results], variants)
+        for result in results:
+            self.assertEqual(result["steps"], 25)
+            self.assertEqual(result["checkpoint"].step, 65)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unit tests for the compiled scenario representation.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS, FOOD_TASKS
+
+
+class TestCompiledScenario(unittest.TestCase):
+    """Test cases for the CompiledScenario class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.scenario = KITCHEN_SCENARIOS["small_kitchen"]
+        self.compiled = CompiledScenario.from_scenario(self.scenario)
+
+    def test_interned_indices(self):
+        """Test that names are interned to their list positions"""
+        for i, staff in enumerate(self.scenario["staff"]):
+            self.assertEqual(self.compiled.staff_index[staff], i)
+        for j, equipment in enumerate(self.scenario["equipment"]):
+            self.assertEqual(self.compiled.equipment_index[equipment], j)
+
+    def test_staff_task_ids(self):
+        """Test that each staff member maps to its role's tasks"""
+        for i, staff in enumerate(self.scenario["staff"]):
+            names = [self.compiled.task_names[t] for t in self.compiled.staff_task_ids[i]]
+            self.assertEqual(names, FOOD_TASKS[staff])
+
+    def test_need_mask_ignores_missing_equipment(self):
+        """Test that equipment not stocked by the scenario is not needed"""
+        # Preparing Sauce needs a Stove and a Food Processor; only the Stove is stocked
+        task_id = self.compiled.task_index["Preparing Sauce"]
+        stove = self.compiled.equipment_index["Stove"]
+        self.assertEqual(self.compiled.task_need_indices[task_id], (stove,))
+        self.assertEqual(self.compiled.task_need_masks[task_id], 1 << stove)
+
+    def test_is_ready(self):
+        """Test task readiness as a mask comparison"""
+        task_id = self.compiled.task_index["Searing Steaks"]  # Stove, Knife Set
+        stove = self.compiled.equipment_index["Stove"]
+        knives = self.compiled.equipment_index["Knife Set"]
+
+        self.assertFalse(self.compiled.is_ready(task_id, 1 << stove))
+        self.assertEqual(self.compiled.missing_mask(task_id, 1 << stove), 1 << knives)
+        self.assertTrue(self.compiled.is_ready(task_id, (1 << stove) | (1 << knives)))
+
+    def test_unknown_role_has_no_tasks(self):
+        """Test that staff without food tasks compile to an empty task list"""
+        compiled = CompiledScenario(["me"], ["Oven"])
+        self.assertFalse(compiled.has_tasks(0))
+        self.assertEqual(compiled.num_tasks, 0)
+
+    def test_held_mask_round_trip(self):
+        """Test building and expanding held-equipment masks"""
+        mask = CompiledScenario.held_mask([0, 2, 0, 1])
+        self.assertEqual(mask, 0b1010)
+        self.assertEqual(self.compiled.indices_of(mask), [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
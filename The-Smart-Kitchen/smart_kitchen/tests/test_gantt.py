@@ -0,0 +1,96 @@
+"""
+Unit tests for the Gantt chart layout helpers.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.gantt import GanttTimeline, nice_step, time_ticks
+
+
+class TestTimeTicks(unittest.TestCase):
+    """Test cases for tick spacing on the time axis"""
+
+    def test_nice_step(self):
+        """Test rounding up to 1, 2 or 5 times a power of ten"""
+        self.assertEqual(nice_step(1), 1)
+        self.assertEqual(nice_step(1.3), 2)
+        self.assertEqual(nice_step(3), 5)
+        self.assertEqual(nice_step(7), 10)
+        self.assertEqual(nice_step(180), 200)
+        self.assertAlmostEqual(nice_step(0.04), 0.05)
+        with self.assertRaises(ValueError):
+            nice_step(0)
+
+    def test_ticks_follow_the_scale(self):
+        """Test that ticks stay at least the minimum spacing apart at any zoom"""
+        step, ticks = time_ticks(0, 10, 60, min_spacing=60)
+        self.assertEqual(step, 1)
+        self.assertEqual(ticks, list(range(11)))
+
+        step, ticks = time_ticks(0, 1000000, 0.0007, min_spacing=70)
+        self.assertEqual(step, 100000)
+        self.assertEqual(len(ticks), 11)
+
+        step, ticks = time_ticks(13, 31, 10, min_spacing=70)
+        self.assertEqual(step, 10)
+        self.assertEqual(ticks, [20, 30])
+
+
+class TestGanttTimeline(unittest.TestCase):
+    """Test cases for row storage and level-of-detail merging"""
+
+    def test_out_of_order_slices_are_sorted(self):
+        """Test that rows stay sorted when slices are added out of order"""
+        timeline = GanttTimeline.from_slices(
+            ["S1"], [(0, 10, 12, "B"), (0, 0, 5, "A"), (0, 5, 10, "C")]
+        )
+        self.assertEqual(list(timeline.starts[0]), [0, 5, 10])
+        self.assertEqual([timeline.labels[i] for i in timeline.slice_ids[0]], ["A", "C", "B"])
+        self.assertEqual((timeline.start, timeline.end), (0, 12))
+        with self.assertRaises(ValueError):
+            timeline.add(0, 5, 4, "D")
+
+    def test_visible_window(self):
+        """Test that only slices overlapping the window are returned"""
+        timeline = GanttTimeline(["S1"])
+        for i in range(100):
+            timeline.add(0, 10 * i, 10 * i + 5, f"J{i}")
+
+        segments = timeline.visible(0, 22, 47, scale=10)
+        self.assertEqual([s[2] for s in segments], [2, 3, 4])
+        self.assertTrue(all(count == 1 for *_, count in segments))
+
+    def test_sub_pixel_slices_are_merged(self):
+        """Test that dense runs of tiny slices become one block per pixel run"""
+        timeline = GanttTimeline(["S1"])
+        for i in range(10000):
+            timeline.add(0, i, i + 1, f"J{i}")
+        timeline.add(0, 20000, 25000, "Long")
+
+        # 0.05 pixels per unit: each job is far narrower than a pixel
+        segments = timeline.visible(0, 0, 25000, scale=0.05, min_width=1)
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[0], (0, 10000, 0, 10000))
+        self.assertEqual(segments[1], (20000, 25000, 10000, 1))
+
+        # Zoomed in, every job is drawn on its own
+        self.assertEqual(len(timeline.visible(0, 0, 50, scale=10)), 50)
+
+    def test_segments_bounded_by_width(self):
+        """Test that sparse tiny slices give at most one segment per pixel"""
+        timeline = GanttTimeline(["S1"])
+        for i in range(100000):
+            timeline.add(0, 3 * i, 3 * i + 1, i)
+
+        # 300000 units across 600 pixels
+        segments = timeline.visible(0, 0, 300000, scale=0.002, min_width=1)
+        self.assertLessEqual(len(segments), 600)
+        self.assertEqual(sum(s[3] for s in segments), 100000)
+
+
+if __name__ == "__main__":
+    unittest.main()
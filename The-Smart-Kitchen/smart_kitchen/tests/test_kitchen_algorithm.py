@@ -129,6 +129,22 @@ class TestKitchenResourceManager(unittest.TestCase):
         self.assertEqual(self.kitchen_manager.available, [3, 4, 2])
         self.assertEqual(self.kitchen_manager.allocated[0], [0, 0, 0])
     
+    def test_held_masks_track_allocation(self):
+        """Test that held-equipment masks follow requests and releases"""
+        self.assertEqual(self.kitchen_manager.held_masks, [0b010, 0b001, 0b101])
+
+        roomy_manager = KitchenResourceManager(
+            [10, 10, 10],
+            self.max_resources,
+            [row[:] for row in self.allocated]
+        )
+        success, _ = roomy_manager.request_resources(0, [1, 0, 1])
+        self.assertTrue(success)
+        self.assertEqual(roomy_manager.held_masks[0], 0b111)
+
+        roomy_manager.release_resources(0, [1, 1, 0])
+        self.assertEqual(roomy_manager.held_masks[0], 0b100)
+
     def test_release_resources_invalid(self):
         """Test releasing more resources than allocated"""
         release = [1, 0, 0]  # Try to release 1 oven that is not allocated
@@ -155,6 +171,107 @@ class TestKitchenResourceManager(unittest.TestCase):
         deadlock = deadlock_manager.detect_deadlock()
         
         self.assertTrue(deadlock)
+    
+    def test_allocate_resources_skips_safety_check(self):
+        """Test that first-come first-served allocation grants unsafe requests"""
+        success, message = self.kitchen_manager.allocate_resources(0, [3, 0, 0])
+        
+        self.assertTrue(success)
+        self.assertEqual(message, "Request granted")
+        self.assertEqual(self.kitchen_manager.available, [0, 3, 2])
+        self.assertEqual(self.kitchen_manager.held_masks[0], 0b011)
+        self.assertFalse(self.kitchen_manager.allocate_resources(1, [1, 0, 0])[0])
+    
+    def test_find_deadlocked_staff(self):
+        """Test detection over outstanding requests only"""
+        manager = KitchenResourceManager(
+            [0, 0, 1],
+            [[1, 1, 0], [1, 1, 0], [0, 0, 1]],
+            [[1, 0, 0], [0, 1, 0], [0, 0, 0]]
+        )
+        
+        # Staff 0 and 1 each wait for what the other holds
+        self.assertEqual(manager.find_deadlocked_staff({0: [0, 1, 0], 1: [1, 0, 0]}), [0, 1])
+        # Staff 2 can be served, and nobody else is waiting
+        self.assertEqual(manager.find_deadlocked_staff({2: [0, 0, 1]}), [])
+        # A waiter that depends on a deadlocked holder is stuck as well
+        manager.allocated[2] = [0, 0, 1]
+        manager.available = [0, 0, 0]
+        self.assertEqual(
+            manager.find_deadlocked_staff({0: [0, 1, 0], 1: [1, 0, 0], 2: [1, 0, 0]}), [0, 1, 2]
+        )
+    
+    def test_incremental_detection_matches_full_scan(self):
+        """Test that incremental detection agrees with a full scan as equipment is returned"""
+        scenario = KITCHEN_SCENARIOS["deadlock_scenario"]
+        manager = KitchenResourceManager(
+            scenario["available"].copy(),
+            [row[:] for row in scenario["max_needs"]],
+            [row[:] for row in scenario["allocated"]]
+        )
+        
+        self.assertTrue(manager.detect_deadlock_incremental())
+        for staff_id in range(manager.num_staff):
+            manager.release_resources(staff_id, manager.allocated[staff_id][:])
+            self.assertEqual(manager.detect_deadlock_incremental(), manager.detect_deadlock())
+        
+        manager.add_available(0, 10)
+        self.assertEqual(manager.detect_deadlock_incremental(), manager.detect_deadlock())
+    
+    def test_incremental_detection_skips_unchanged_state(self):
+        """Test that a state known to be safe is not scanned again"""
+        manager = KitchenResourceManager(
+            [10, 10, 10],
+            [row[:] for row in self.max_resources],
+            [row[:] for row in self.allocated]
+        )
+        self.assertFalse(manager.detect_deadlock_incremental())
+        
+        # Releasing equipment keeps the state safe without another scan
+        manager.release_resources(2, [3, 0, 2])
+        manager.max_resources[0] = [99, 99, 99]  # bypasses the manager on purpose
+        self.assertFalse(manager.detect_deadlock_incremental())
+        self.assertTrue(manager.detect_deadlock())
+    
+    def test_raise_claim_forces_a_scan(self):
+        """Test that a raised claim is seen by incremental detection"""
+        manager = KitchenResourceManager(
+            [10, 10, 10],
+            [row[:] for row in self.max_resources],
+            [row[:] for row in self.allocated]
+        )
+        self.assertFalse(manager.detect_deadlock_incremental())
+        
+        manager.raise_claim(0, 0, 99)
+        self.assertEqual(manager.max_resources[0][0], 99)
+        self.assertTrue(manager.detect_deadlock_incremental())
+        
+        # A lower value never shrinks the claim
+        manager.raise_claim(0, 0, 1)
+        self.assertEqual(manager.max_resources[0][0], 99)
+    
+    def test_find_safe_sequence_agrees_with_is_safe(self):
+        """Test that the multi-pass safety check gives the same verdict as is_safe"""
+        for name, scenario in KITCHEN_SCENARIOS.items():
+            manager = KitchenResourceManager(
+                scenario["available"].copy(),
+                [row[:] for row in scenario["max_needs"]],
+                [row[:] for row in scenario["allocated"]]
+            )
+            safe, sequence = manager.find_safe_sequence()
+            self.assertEqual(safe, manager.is_safe()[0], name)
+            if safe:
+                self.assertEqual(sorted(sequence), list(range(manager.num_staff)))
+        
+        # Each staff member can only finish after the next one has
+        staff = 300
+        chain = KitchenResourceManager(
+            [1],
+            [[staff - i + 1] for i in range(staff)],
+            [[1] for _ in range(staff)]
+        )
+        self.assertEqual(chain.find_safe_sequence(), (True, list(range(staff - 1, -1, -1))))
+        self.assertEqual(chain.find_safe_sequence(), chain.is_safe())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""
+Unit tests for the multi-kitchen simulation with a shared equipment pool.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.multi_kitchen import MultiKitchenEngine
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+# Two pastry chefs sharing one mixer
+PASTRY_KITCHEN = {
+    "name": "Pastry Corner",
+    "staff": ["Pastry Chef", "Pastry Chef"],
+    "equipment": ["Mixer"],
+    "available": [1],
+    "max_needs": [[1], [1]],
+    "allocated": [[0], [0]],
+}
+
+
+class TestMultiKitchenEngine(unittest.TestCase):
+    """Test cases for the MultiKitchenEngine class"""
+
+    def test_default_claims_cover_shortfall(self):
+        """Test that a kitchen may borrow what its staff could need beyond its own units"""
+        engine = MultiKitchenEngine([PASTRY_KITCHEN, KITCHEN_SCENARIOS["small_kitchen"]], {"Mixer": 3})
+
+        self.assertEqual(engine.pool.max_resources[0], [1])
+        self.assertEqual(engine.kitchen_names[0], "1. Pastry Corner")
+
+    def test_borrow_limits(self):
+        """Test explicit per-kitchen borrowing limits"""
+        engine = MultiKitchenEngine(
+            [PASTRY_KITCHEN, PASTRY_KITCHEN], {"Mixer": 3, "Oven": 2},
+            borrow_limits=[{"Mixer": 2}, {"Mixer": 5, "Oven": 1}]
+        )
+
+        # Limits are capped by the pool and ignored for equipment a kitchen does not stock
+        self.assertEqual(engine.pool.max_resources, [[2, 0], [3, 0]])
+
+    def test_loans_are_returned(self):
+        """Test that a kitchen borrows under contention and gives idle units back"""
+        engine = MultiKitchenEngine([PASTRY_KITCHEN], {"Mixer": 1}, seed=2)
+        engine.run(300)
+
+        self.assertGreater(engine.loans, 0)
+        self.assertGreater(engine.returns, 0)
+        self.assertEqual(engine.loans - engine.returns, engine.pool.allocated[0][0])
+
+    def test_pool_accounting(self):
+        """Test that pooled units are always either in the pool or on loan to one kitchen"""
+        scenarios = [PASTRY_KITCHEN, KITCHEN_SCENARIOS["busy_restaurant"], PASTRY_KITCHEN]
+        engine = MultiKitchenEngine(scenarios, {"Mixer": 2, "Stove": 1}, seed=5)
+        own_units = [kitchen.equipment_totals[:] for kitchen in engine.kitchens]
+
+        for _ in range(200):
+            engine.step()
+            for p in range(len(engine.pool_names)):
+                on_loan = sum(row[p] for row in engine.pool.allocated)
+                self.assertEqual(engine.pool.available[p] + on_loan, engine.pool_metrics.totals[p])
+                self.assertTrue(engine.pool.is_safe()[0])
+            for k, kitchen in enumerate(engine.kitchens):
+                for j, p in enumerate(engine.pool_index[k]):
+                    borrowed = engine.pool.allocated[k][p] if p is not None else 0
+                    self.assertEqual(kitchen.equipment_totals[j], own_units[k][j] + borrowed)
+
+    def test_format_summary(self):
+        """Test the per-kitchen and pool summary table"""
+        engine = MultiKitchenEngine([PASTRY_KITCHEN, PASTRY_KITCHEN], {"Mixer": 1}, seed=1)
+        engine.run(50)
+        text = engine.format_summary()
+
+        self.assertIn("2 kitchens, 50 steps", text)
+        self.assertIn("2. Pastry Corner", text)
+        self.assertIn("Shared Pool:", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Unit tests for the page-replacement policies.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.page_replacement import (
+    FIFOReplacer, LRUReplacer, ClockReplacer, OPTReplacer,
+    REPLACEMENT_POLICIES, make_replacer, simulate_replacement
+)
+
+# Textbook reference string
+REFERENCES = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+
+
+class TestPageReplacement(unittest.TestCase):
+    """Test cases for FIFO, LRU, Clock and OPT replacement"""
+
+    def faults(self, name, frames, references=REFERENCES):
+        return simulate_replacement(make_replacer(name, frames, references), references)["faults"]
+
+    def test_textbook_fault_counts(self):
+        """Test fault counts on the textbook reference string with three frames"""
+        self.assertEqual(self.faults("FIFO", 3), 15)
+        self.assertEqual(self.faults("LRU", 3), 12)
+        self.assertEqual(self.faults("Clock", 3), 14)
+        self.assertEqual(self.faults("OPT", 3), 9)
+
+    def test_beladys_anomaly(self):
+        """Test that FIFO faults more with four frames than with three on Belady's string"""
+        references = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+        self.assertEqual(self.faults("FIFO", 3, references), 9)
+        self.assertEqual(self.faults("FIFO", 4, references), 10)
+
+    def test_opt_is_a_lower_bound(self):
+        """Test that no policy faults less than OPT"""
+        references = [(i * 7 + i // 3) % 11 for i in range(500)]
+        best = self.faults("OPT", 4, references)
+        for name in REPLACEMENT_POLICIES:
+            self.assertGreaterEqual(self.faults(name, 4, references), best)
+
+    def test_evicted_pages(self):
+        """Test that access reports the page each policy evicts"""
+        fifo = FIFOReplacer(2)
+        lru = LRUReplacer(2)
+        for page in (1, 2, 1):
+            fifo.access(page)
+            lru.access(page)
+        self.assertEqual(fifo.access(3), (True, 1))
+        self.assertEqual(lru.access(3), (True, 2))
+
+        clock = ClockReplacer(2)
+        clock.access(1)
+        clock.access(2)
+        # Both pages get a second chance, then page 1 goes
+        self.assertEqual(clock.access(3), (True, 1))
+        self.assertEqual(clock.frames(), [3, 2])
+
+    def test_steps_only_when_requested(self):
+        """Test that per-reference detail is recorded only on request"""
+        result = simulate_replacement(FIFOReplacer(3), iter(REFERENCES))
+        self.assertIsNone(result["steps"])
+        self.assertEqual(result["references"], 20)
+        self.assertEqual(result["hits"], 5)
+
+        result = simulate_replacement(FIFOReplacer(3), REFERENCES, record_steps=True)
+        self.assertEqual(result["steps"][3], (4, 2, [0, 1, 2], True))
+        self.assertEqual(result["final_frames"], [7, 0, 1])
+
+    def test_opt_requires_reference_string(self):
+        """Test that OPT is given the references it will see"""
+        with self.assertRaises(ValueError):
+            make_replacer("OPT", 3)
+        opt = OPTReplacer(3, [1, 2])
+        with self.assertRaises(ValueError):
+            opt.access(2)
+
+    def test_invalid_frames(self):
+        """Test that a replacer needs at least one frame"""
+        with self.assertRaises(ValueError):
+            LRUReplacer(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,318 @@
+"""
+Unit tests for resource allocation graphs and cycle detection.
+"""
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.resource_graph import (
+    ResourceAllocationGraph, DynamicResourceGraph, strongly_connected_components
+)
+
+
+def has_cycle_naive(num_nodes, successors):
+    """Cycle check by repeatedly removing nodes without incoming edges."""
+    indegree = [0] * num_nodes
+    for edges in successors:
+        for succ in edges:
+            indegree[succ] += 1
+    ready = [v for v in range(num_nodes) if indegree[v] == 0]
+    removed = 0
+    while ready:
+        node = ready.pop()
+        removed += 1
+        for succ in successors[node]:
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                ready.append(succ)
+    return removed < num_nodes
+
+
+class TestStronglyConnectedComponents(unittest.TestCase):
+    """Test cases for the iterative Tarjan implementation"""
+
+    def test_components(self):
+        """Test components and their reverse topological order"""
+        # 0 <-> 1 -> 2 <-> 3 -> 4, and 5 with a self-loop
+        successors = [[1], [0, 2], [3], [2, 4], [], [5]]
+        components = strongly_connected_components(6, successors)
+
+        self.assertEqual(sorted(sorted(c) for c in components), [[0, 1], [2, 3], [4], [5]])
+        position = {v: i for i, c in enumerate(components) for v in c}
+        self.assertLess(position[4], position[2])
+        self.assertLess(position[2], position[0])
+
+    def test_long_chain_does_not_recurse(self):
+        """Test a path far longer than Python's recursion limit"""
+        count = 200000
+        successors = [[v + 1] for v in range(count - 1)] + [[0]]
+        components = strongly_connected_components(count, successors)
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), count)
+
+
+class TestResourceAllocationGraph(unittest.TestCase):
+    """Test cases for building RAGs and finding their cycles"""
+
+    def test_textbook_deadlock(self):
+        """Test the demo's P1-R1-P2-R2 circular wait"""
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2", "P3"], ["R1", "R2"], [1, 1],
+            requests=[("P1", "R1"), ("P2", "R2"), ("P3", "R1")],
+            assignments=[("R1", "P2"), ("R2", "P1")],
+        )
+        self.assertEqual(graph.find_cycle(), ["P1", "R1", "P2", "R2", "P1"])
+
+    def test_no_cycle(self):
+        """Test that an acyclic graph reports no cycle"""
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2"], ["R1"], None, requests=[("P2", "R1")], assignments=[("R1", "P1")]
+        )
+        self.assertIsNone(graph.find_cycle())
+        self.assertEqual(graph.find_cycles(), [])
+
+    def test_one_cycle_per_component(self):
+        """Test that independent circular waits are all reported"""
+        processes = [f"P{i}" for i in range(6)]
+        resources = [f"R{i}" for i in range(6)]
+        requests = [(f"P{i}", f"R{i}") for i in range(6)]
+        # Two rings: P0-P1-P2 and P3-P4-P5
+        assignments = [(f"R{i}", f"P{(i + 1) % 3 + 3 * (i // 3)}") for i in range(6)]
+        graph = ResourceAllocationGraph.from_edges(processes, resources, None, requests, assignments)
+
+        cycles = graph.find_cycles()
+        self.assertEqual(len(cycles), 2)
+        self.assertEqual(cycles[0], ["P0", "R0", "P1", "R1", "P2", "R2", "P0"])
+        self.assertEqual(set(cycles[1]), {"P3", "R3", "P4", "R4", "P5", "R5"})
+
+    def test_cycles_are_real(self):
+        """Test reported cycles against a naive check on random graphs"""
+        rng = random.Random(5)
+        for _ in range(200):
+            n, m = rng.randint(1, 8), rng.randint(1, 8)
+            processes = [f"P{i}" for i in range(n)]
+            resources = [f"R{j}" for j in range(m)]
+            requests = [(rng.choice(processes), rng.choice(resources)) for _ in range(rng.randint(0, 10))]
+            assignments = [(rng.choice(resources), rng.choice(processes)) for _ in range(rng.randint(0, 10))]
+            graph = ResourceAllocationGraph.from_edges(processes, resources, None, requests, assignments)
+
+            cycles = graph.find_cycles()
+            self.assertEqual(bool(cycles), has_cycle_naive(n + m, graph.successors))
+            edges = set(requests) | set(assignments)
+            for cycle in cycles:
+                self.assertEqual(cycle[0], cycle[-1])
+                self.assertEqual(len(set(cycle)), len(cycle) - 1)
+                for a, b in zip(cycle, cycle[1:]):
+                    self.assertIn((a, b), edges)
+
+    def test_invalid_edges(self):
+        """Test that edges must run between a process and a resource"""
+        graph = ResourceAllocationGraph(["P1"], ["R1"])
+        with self.assertRaises(ValueError):
+            graph.add_request("R1", "P1")
+        with self.assertRaises(ValueError):
+            graph.add_assignment("R1", "P9")
+        with self.assertRaises(ValueError):
+            ResourceAllocationGraph(["A"], ["A"])
+
+
+class TestGraphReduction(unittest.TestCase):
+    """Test cases for multiple-instance deadlock detection"""
+
+    def test_cycle_with_escape(self):
+        """Test that a cycle through a spare oven is not a deadlock"""
+        # P1 -> R1 -> P2 -> R2 -> P1, but R1 has a second unit held by P3
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2", "P3"], ["R1", "R2"], [2, 1],
+            requests=[("P1", "R1"), ("P2", "R2")],
+            assignments=[("R1", "P2"), ("R1", "P3"), ("R2", "P1")],
+        )
+        self.assertTrue(graph.find_cycles())
+        result = graph.reduce()
+        self.assertFalse(result["deadlocked"])
+        self.assertEqual(result["sequence"], ["P3", "P1", "P2"])
+        self.assertEqual(result["deadlocked_processes"], [])
+        self.assertEqual(result["blocked_processes"], [])
+        self.assertEqual(result["cycles"], [])
+
+    def test_deadlocked_and_blocked(self):
+        """Test that waiters outside the cycle are reported as blocked"""
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2", "P3", "P4", "P5"], ["R1", "R2", "R3"], [1, 2, 1],
+            requests=[("P1", "R1"), ("P2", "R3"), ("P3", "R2"), ("P4", "R3"), ("P5", "R1")],
+            assignments=[("R1", "P2"), ("R2", "P1"), ("R2", "P2"), ("R3", "P3")],
+        )
+        result = graph.reduce()
+        self.assertTrue(result["deadlocked"])
+        self.assertEqual(result["sequence"], [])
+        self.assertEqual(result["deadlocked_processes"], ["P1", "P2", "P3"])
+        self.assertEqual(result["blocked_processes"], ["P4", "P5"])
+        self.assertEqual(result["cycles"], [["P1", "R1", "P2", "R3", "P3", "R2", "P1"]])
+
+    def test_repeated_edges_are_units(self):
+        """Test that a request for two units waits until both are free"""
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2"], ["R1"], [3],
+            requests=[("P1", "R1"), ("P1", "R1")],
+            assignments=[("R1", "P2"), ("R1", "P2")],
+        )
+        self.assertEqual(graph.reduce()["sequence"], ["P2", "P1"])
+
+        graph.add_request("P2", "R1")
+        graph.add_request("P2", "R1")
+        result = graph.reduce()
+        self.assertTrue(result["deadlocked"])
+        self.assertEqual(result["deadlocked_processes"], ["P2"])
+        self.assertEqual(result["blocked_processes"], ["P1"])
+
+    def test_matches_detection_algorithm(self):
+        """Test random graphs against the manager's detection algorithm"""
+        rng = random.Random(3)
+        for _ in range(300):
+            n, m = rng.randint(1, 7), rng.randint(1, 4)
+            instances = [rng.randint(1, 3) for _ in range(m)]
+            available = instances[:]
+            allocated = [[0] * m for _ in range(n)]
+            for j in range(m):
+                for _ in range(rng.randint(0, instances[j])):
+                    allocated[rng.randrange(n)][j] += 1
+                    available[j] -= 1
+            requests = {}
+            for i in range(n):
+                if rng.random() < 0.7:
+                    requests[i] = [rng.randint(0, instances[j]) for j in range(m)]
+
+            processes = [f"P{i}" for i in range(n)]
+            resources = [f"R{j}" for j in range(m)]
+            graph = ResourceAllocationGraph(processes, resources, instances)
+            for i in range(n):
+                for j in range(m):
+                    for _ in range(allocated[i][j]):
+                        graph.add_assignment(resources[j], processes[i])
+                    for _ in range(requests.get(i, [0] * m)[j]):
+                        graph.add_request(processes[i], resources[j])
+
+            manager = KitchenResourceManager(available, allocated, allocated)
+            stuck = manager.find_deadlocked_staff(requests)
+            result = graph.reduce()
+            self.assertEqual(
+                sorted(result["deadlocked_processes"] + result["blocked_processes"]),
+                sorted(processes[i] for i in stuck),
+            )
+            self.assertEqual(result["deadlocked"], bool(stuck))
+            self.assertEqual(len(result["sequence"]) + len(stuck), n)
+
+    def test_dynamic_graph_counts_held_back_edges(self):
+        """Test that reduction sees the edge that closed a cycle"""
+        graph = DynamicResourceGraph(["P1", "P2"], ["R1", "R2"])
+        graph.add_assignment("R1", "P1")
+        graph.add_assignment("R2", "P2")
+        graph.add_request("P1", "R2")
+        graph.add_request("P2", "R1")
+        self.assertEqual(graph.reduce()["deadlocked_processes"], ["P1", "P2"])
+
+    def test_find_deadlock_matches_reduce(self):
+        """Test the search restricted to processes reaching a cycle"""
+        rng = random.Random(9)
+        for _ in range(300):
+            n, m = rng.randint(1, 7), rng.randint(1, 4)
+            processes = [f"P{i}" for i in range(n)]
+            resources = [f"R{j}" for j in range(m)]
+            instances = [rng.randint(1, 3) for _ in range(m)]
+            graph = DynamicResourceGraph(processes, resources, instances)
+            for j in range(m):
+                for _ in range(rng.randint(0, instances[j])):
+                    graph.add_assignment(resources[j], rng.choice(processes))
+                for _ in range(rng.randint(0, 3)):
+                    graph.add_request(rng.choice(processes), resources[j])
+            counts = {}
+            for tail, heads in enumerate(graph.all_edges()):
+                for head in heads:
+                    counts[tail, head] = counts.get((tail, head), 0) + 1
+            if any(units > graph.instances[head - n] for (tail, head), units in counts.items() if tail < n):
+                continue
+
+            expected = graph.reduce()
+            del expected["sequence"]
+            self.assertEqual(graph.find_deadlock(), expected)
+
+    def test_invalid_counts(self):
+        """Test over-assigned resources and requests beyond the instances"""
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1", "P2"], ["R1"], [1], requests=[], assignments=[("R1", "P1"), ("R1", "P2")]
+        )
+        with self.assertRaises(ValueError):
+            graph.reduce()
+        graph = ResourceAllocationGraph.from_edges(
+            ["P1"], ["R1"], [1], requests=[("P1", "R1"), ("P1", "R1")], assignments=[]
+        )
+        with self.assertRaises(ValueError):
+            graph.reduce()
+
+
+class TestDynamicResourceGraph(unittest.TestCase):
+    """Test cases for incremental cycle detection"""
+
+    def test_closing_edge_reports_cycle(self):
+        """Test that the edge completing a circular wait reports it"""
+        graph = DynamicResourceGraph(["P1", "P2"], ["R1", "R2"])
+        self.assertIsNone(graph.add_assignment("R1", "P1"))
+        self.assertIsNone(graph.add_assignment("R2", "P2"))
+        self.assertIsNone(graph.add_request("P1", "R2"))
+        self.assertEqual(graph.add_request("P2", "R1"), ["P2", "R1", "P1", "R2", "P2"])
+        self.assertTrue(graph.has_cycle)
+
+        # P1 releases R1: the held-back request no longer closes a cycle
+        graph.remove_assignment("R1", "P1")
+        self.assertFalse(graph.has_cycle)
+        self.assertEqual(graph.find_cycles(), [])
+        self.assertIn(graph.node_of["R1"], graph.successors[graph.node_of["P2"]])
+
+    def test_removing_held_back_edge(self):
+        """Test that withdrawing the closing request clears the cycle"""
+        graph = DynamicResourceGraph(["P1"], ["R1"])
+        graph.add_assignment("R1", "P1")
+        self.assertEqual(graph.add_request("P1", "R1"), ["P1", "R1", "P1"])
+        graph.remove_request("P1", "R1")
+        self.assertFalse(graph.has_cycle)
+        with self.assertRaises(ValueError):
+            graph.remove_request("P1", "R1")
+
+    def test_matches_full_detection(self):
+        """Test random edge changes against whole-graph detection"""
+        rng = random.Random(11)
+        n, m = 12, 8
+        processes = [f"P{i}" for i in range(n)]
+        resources = [f"R{j}" for j in range(m)]
+        graph = DynamicResourceGraph(processes, resources)
+        edges = []
+        for _ in range(3000):
+            if edges and rng.random() < 0.45:
+                kind, a, b = edges.pop(rng.randrange(len(edges)))
+                (graph.remove_request if kind == "request" else graph.remove_assignment)(a, b)
+            elif rng.random() < 0.5:
+                edges.append(("request", rng.choice(processes), rng.choice(resources)))
+                graph.add_request(*edges[-1][1:])
+            else:
+                edges.append(("assign", rng.choice(resources), rng.choice(processes)))
+                graph.add_assignment(*edges[-1][1:])
+
+            full = ResourceAllocationGraph.from_edges(
+                processes, resources, None,
+                [(a, b) for kind, a, b in edges if kind == "request"],
+                [(a, b) for kind, a, b in edges if kind == "assign"],
+            )
+            self.assertEqual(graph.has_cycle, bool(full.find_cycles()))
+            # Edges inside the order always point forwards
+            for tail, heads in enumerate(graph.successors):
+                for head in heads:
+                    self.assertLess(graph.rank[tail], graph.rank[head])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+"""
+Unit tests for order-ticket scheduling.
+"""
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.scheduling import (
+    FCFSScheduler, MultiServerFCFSScheduler, fcfs_arrays, schedule_jobs, FCFSPolicy, SJFPolicy, SRTFPolicy,
+    RoundRobinPolicy, PriorityPolicy, generate_jobs, compare_schedulers,
+    format_scheduler_comparison
+)
+
+# Textbook workload: (id, arrival, burst)
+TEXTBOOK_JOBS = [("P1", 0, 8), ("P2", 1, 4), ("P3", 2, 9), ("P4", 3, 5)]
+
+
+class TestFCFSScheduler(unittest.TestCase):
+    """Test cases for FCFS scheduling"""
+
+    def setUp(self):
+        """Set up a small job set with an idle gap"""
+        self.jobs = [("P1", 0, 5), ("P2", 1, 3), ("P3", 2, 8), ("P4", 20, 2)]
+
+    def test_schedule_rows(self):
+        """Test start, completion, turnaround and waiting times"""
+        rows = list(FCFSScheduler().schedule(self.jobs))
+
+        self.assertEqual(rows[0], ("P1", 0, 5, 0, 5, 5, 0))
+        self.assertEqual(rows[1], ("P2", 1, 3, 5, 8, 7, 4))
+        self.assertEqual(rows[2], ("P3", 2, 8, 8, 16, 14, 6))
+        # The server sits idle until P4 arrives
+        self.assertEqual(rows[3], ("P4", 20, 2, 20, 22, 2, 0))
+
+    def test_unsorted_input_is_sorted_stably(self):
+        """Test that jobs are served in arrival order, ties in input order"""
+        jobs = [("B", 4, 1), ("A", 0, 2), ("C", 4, 1)]
+        order = [row[0] for row in FCFSScheduler().schedule(jobs)]
+        self.assertEqual(order, ["A", "B", "C"])
+
+    def test_streaming_rejects_out_of_order_arrivals(self):
+        """Test that presorted streams must really be in arrival order"""
+        scheduler = FCFSScheduler()
+        with self.assertRaises(ValueError):
+            list(scheduler.schedule([("A", 5, 1), ("B", 2, 1)], presorted=True))
+
+    def test_invalid_jobs(self):
+        """Test that negative arrivals and empty bursts are rejected"""
+        with self.assertRaises(ValueError):
+            FCFSScheduler().feed("A", -1, 3)
+        with self.assertRaises(ValueError):
+            FCFSScheduler().feed("A", 0, 0)
+
+    def test_summary(self):
+        """Test averages, makespan and utilization"""
+        scheduler = FCFSScheduler()
+        list(scheduler.schedule(self.jobs))
+        summary = scheduler.summary()
+
+        self.assertEqual(summary["jobs"], 4)
+        self.assertAlmostEqual(summary["average_turnaround"], 7.0)
+        self.assertAlmostEqual(summary["average_waiting"], 2.5)
+        self.assertEqual(summary["makespan"], 22)
+        self.assertAlmostEqual(summary["utilization"], 18 / 22)
+
+    def test_arrays_match_streaming(self):
+        """Test that the array form gives the same times as the streaming form"""
+        rng = random.Random(7)
+        arrivals = sorted(rng.randint(0, 500) for _ in range(1000))
+        bursts = [rng.randint(1, 5) for _ in arrivals]
+
+        start, completion, turnaround, waiting = fcfs_arrays(arrivals, bursts)
+        rows = list(FCFSScheduler().schedule(zip(range(1000), arrivals, bursts), presorted=True))
+
+        self.assertEqual(start, [row[3] for row in rows])
+        self.assertEqual(completion, [row[4] for row in rows])
+        self.assertEqual(turnaround, [row[5] for row in rows])
+        self.assertEqual(waiting, [row[6] for row in rows])
+        self.assertEqual(fcfs_arrays([], []), ([], [], [], []))
+
+    def test_arrays_reject_out_of_order(self):
+        """Test that the array form refuses arrivals out of order"""
+        with self.assertRaises(ValueError):
+            fcfs_arrays([5, 0], [1, 1])
+        with self.assertRaises(ValueError):
+            fcfs_arrays([0, 1], [1])
+
+
+class TestMultiServerFCFSScheduler(unittest.TestCase):
+    """Test cases for FCFS over several identical stations"""
+
+    def test_earliest_free_station(self):
+        """Test that each job goes to the station that frees up first"""
+        jobs = [("A", 0, 4), ("B", 0, 2), ("C", 1, 3), ("D", 1, 1), ("E", 9, 1)]
+        rows = list(MultiServerFCFSScheduler(2).schedule(jobs))
+
+        self.assertEqual(rows[0], ("A", 0, 4, 0, 0, 4, 4, 0))
+        self.assertEqual(rows[1], ("B", 0, 2, 1, 0, 2, 2, 0))
+        # C waits for B's station, D for A's
+        self.assertEqual(rows[2], ("C", 1, 3, 1, 2, 5, 4, 1))
+        self.assertEqual(rows[3], ("D", 1, 1, 0, 4, 5, 4, 3))
+        self.assertEqual(rows[4][4], 9)
+
+    def test_one_station_matches_fcfs(self):
+        """Test that a single station schedules exactly like FCFSScheduler"""
+        jobs = [job[:3] for job in generate_jobs(1000, mean_interarrival=3, seed=8)]
+        single = list(FCFSScheduler().schedule(jobs, presorted=True))
+        multi = list(MultiServerFCFSScheduler(1).schedule(jobs, presorted=True))
+
+        self.assertEqual([row[:3] + row[4:] for row in multi], single)
+
+    def test_fractional_arrivals(self):
+        """Test that fractional arrival times are recorded in the queue history"""
+        scheduler = MultiServerFCFSScheduler(2)
+        rows = list(scheduler.schedule([("a", 0.5, 2), ("b", 1, 3), ("c", 1.5, 1)]))
+        self.assertEqual([row[5] for row in rows], [2.5, 4, 3.5])
+        self.assertEqual([bucket[0] for bucket in scheduler.queue_length_buckets()], [0.5, 1, 1.5])
+
+    def test_queue_length(self):
+        """Test the queue length seen at arrivals and its time-weighted mean"""
+        jobs = [("A", 0, 10), ("B", 1, 1), ("C", 2, 1), ("D", 3, 1), ("E", 20, 1)]
+        scheduler = MultiServerFCFSScheduler(1)
+        list(scheduler.schedule(jobs))
+        summary = scheduler.summary()
+
+        self.assertEqual(summary["max_queue_length"], 3)
+        self.assertEqual([bucket[2] for bucket in scheduler.queue_length_buckets()], [0, 1, 2, 3, 0])
+        # B, C and D wait 9, 9 and 9 units over a 21 unit makespan
+        self.assertAlmostEqual(summary["mean_queue_length"], 27 / 21)
+
+    def test_station_utilization(self):
+        """Test per-station job counts and busy fractions"""
+        scheduler = MultiServerFCFSScheduler(3)
+        list(scheduler.schedule(generate_jobs(3000, mean_interarrival=1.0, mean_burst=2.0, seed=4)))
+        summary = scheduler.summary()
+
+        self.assertEqual(sum(summary["station_jobs"]), 3000)
+        self.assertTrue(all(0 < u <= 1 for u in summary["station_utilization"]))
+        with self.assertRaises(ValueError):
+            MultiServerFCFSScheduler(0)
+
+
+class TestSchedulingPolicies(unittest.TestCase):
+    """Test cases for the event-driven scheduler core and its policies"""
+
+    def completions(self, policy, jobs=TEXTBOOK_JOBS):
+        return {row[0]: row[4] for row in schedule_jobs(jobs, policy)}
+
+    def average_waiting(self, policy, jobs=TEXTBOOK_JOBS):
+        rows = list(schedule_jobs(jobs, policy))
+        return sum(row[6] for row in rows) / len(rows)
+
+    def test_fcfs_policy_matches_fcfs_scheduler(self):
+        """Test that the FCFS policy gives the same rows as FCFSScheduler"""
+        jobs = generate_jobs(500, seed=3)
+        expected = list(FCFSScheduler().schedule([job[:3] for job in jobs], presorted=True))
+        self.assertEqual(list(schedule_jobs(jobs, FCFSPolicy(), presorted=True)), expected)
+
+    def test_sjf(self):
+        """Test non-preemptive shortest job first"""
+        self.assertEqual(self.completions(SJFPolicy()), {"P1": 8, "P2": 12, "P4": 17, "P3": 26})
+        self.assertAlmostEqual(self.average_waiting(SJFPolicy()), 7.75)
+
+    def test_srtf(self):
+        """Test that shorter arrivals preempt the running job"""
+        self.assertEqual(self.completions(SRTFPolicy()), {"P2": 5, "P4": 10, "P1": 17, "P3": 26})
+        self.assertAlmostEqual(self.average_waiting(SRTFPolicy()), 6.5)
+
+    def test_round_robin(self):
+        """Test time slicing, with arrivals queued ahead of the job whose slice ended"""
+        jobs = [("A", 0, 5), ("B", 1, 3), ("C", 2, 1)]
+        self.assertEqual(self.completions(RoundRobinPolicy(2), jobs), {"C": 5, "B": 8, "A": 9})
+        with self.assertRaises(ValueError):
+            RoundRobinPolicy(0)
+
+    def test_fractional_bursts(self):
+        """Test that fractional times finish without relying on exact zero"""
+        jobs = [(1, 0.0, 0.3), (2, 0.1, 0.7)]
+        for policy in (RoundRobinPolicy(0.1), SRTFPolicy()):
+            completions = self.completions(policy, jobs)
+            self.assertEqual(sorted(completions), [1, 2])
+            self.assertAlmostEqual(completions[1], 0.3 if policy.preemptive else 0.5)
+            self.assertAlmostEqual(completions[2], 1.0)
+
+    def test_priority_with_aging(self):
+        """Test that aging lets a low-priority job overtake later high-priority ones"""
+        # A stream of high-priority jobs arriving every 2 units, each taking 2
+        jobs = [("low", 0, 1, 9)] + [(f"high{i}", 2 * i, 2, 0) for i in range(20)]
+
+        starved = self.completions(PriorityPolicy(aging=0), jobs)["low"]
+        aged = self.completions(PriorityPolicy(aging=1), jobs)["low"]
+        self.assertEqual(starved, 41)
+        self.assertLess(aged, 20)
+
+    def test_preemptive_priority(self):
+        """Test that a higher-priority arrival can take the server"""
+        jobs = [("low", 0, 10, 5), ("high", 2, 1, 0)]
+        self.assertEqual(self.completions(PriorityPolicy(aging=0, preemptive=True), jobs)["high"], 3)
+        self.assertEqual(self.completions(PriorityPolicy(aging=0), jobs)["high"], 11)
+
+    def test_idle_gaps(self):
+        """Test that the server idles until the next arrival"""
+        jobs = [("A", 5, 2), ("B", 20, 1)]
+        for policy in (FCFSPolicy(), SRTFPolicy(), RoundRobinPolicy(1)):
+            self.assertEqual(self.completions(policy, jobs), {"A": 7, "B": 21})
+
+    def test_compare_schedulers(self):
+        """Test the comparison runner on a generated workload"""
+        jobs = generate_jobs(2000, seed=1)
+        results = compare_schedulers(jobs)
+
+        self.assertEqual(
+            [r["policy"] for r in results], ["FCFS", "SJF", "SRTF", "Round Robin", "Priority"]
+        )
+        by_name = {r["policy"]: r for r in results}
+        self.assertTrue(all(r["jobs"] == 2000 for r in results))
+        # SRTF minimizes average waiting time
+        self.assertEqual(min(results, key=lambda r: r["average_waiting"])["policy"], "SRTF")
+        self.assertLessEqual(by_name["SJF"]["average_waiting"], by_name["FCFS"]["average_waiting"])
+        self.assertIn("p95 TAT", format_scheduler_comparison(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the headless kitchen simulation engine.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import (
+    KitchenSimulationEngine, MODE_NORMAL, MODE_BANKERS, MODE_RECOVERY
+)
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestKitchenSimulationEngine(unittest.TestCase):
+    """Test cases for the KitchenSimulationEngine class"""
+
+    def test_initial_tasks_follow_roles(self):
+        """Test that every staff member starts on one of its role's tasks"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], seed=1)
+        for i, task_id in enumerate(engine.staff_tasks):
+            self.assertIn(task_id, engine.compiled.staff_task_ids[i])
+            self.assertEqual(engine.task_progress[i], 0)
+
+    def test_scenario_is_not_mutated(self):
+        """Test that running the engine leaves the scenario data untouched"""
+        scenario = KITCHEN_SCENARIOS["small_kitchen"]
+        available = scenario["available"][:]
+        allocated = [row[:] for row in scenario["allocated"]]
+
+        KitchenSimulationEngine(scenario, mode=MODE_BANKERS, seed=3).run(200)
+
+        self.assertEqual(scenario["available"], available)
+        self.assertEqual(scenario["allocated"], allocated)
+
+    def test_seed_is_reproducible(self):
+        """Test that two engines with the same seed produce the same run"""
+        first = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=7)
+        second = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=7)
+        first.run(300)
+        second.run(300)
+
+        self.assertEqual(first.staff_tasks, second.staff_tasks)
+        self.assertEqual(first.task_progress, second.task_progress)
+        self.assertEqual(first.kitchen_manager.allocated, second.kitchen_manager.allocated)
+
+    def test_deadlock_stops_engine(self):
+        """Test that the deadlock scenario halts outside Banker's mode"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["deadlock_scenario"], MODE_NORMAL, seed=0)
+
+        self.assertEqual(engine.run(10), 0)
+        self.assertTrue(engine.deadlock_detected)
+        self.assertFalse(engine.step())
+
+    def test_bankers_mode_keeps_running(self):
+        """Test that Banker's mode requests equipment and never deadlocks"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["deadlock_scenario"], MODE_BANKERS, seed=0)
+
+        self.assertEqual(engine.run(500), 500)
+        self.assertFalse(engine.deadlock_detected)
+        self.assertTrue(all(
+            task_id != CompiledScenario.NO_TASK for task_id in engine.staff_tasks
+        ))
+
+    def test_recovery_mode_keeps_running(self):
+        """Test that recovery mode runs through the deadlock scenario"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["deadlock_scenario"], MODE_RECOVERY, seed=0)
+
+        self.assertEqual(engine.run(200), 200)
+        self.assertFalse(engine.deadlock_detected)
+        self.assertGreater(sum(engine.metrics.tasks_completed), 0)
+
+    def test_recovery_preempts_cheapest_victim(self):
+        """Test that a hold-and-wait cycle is broken by preempting the cheapest staff member"""
+        scenario = {
+            "name": "Two prep cooks",
+            "staff": ["Prep Cook", "Prep Cook"],
+            "equipment": ["Cutting Board", "Knife Set"],
+            "available": [0, 0],
+            "max_needs": [[1, 1], [1, 1]],
+            "allocated": [[1, 0], [0, 1]],
+        }
+        engine = KitchenSimulationEngine(scenario, MODE_RECOVERY, seed=0)
+        chopping = engine.compiled.task_index["Chopping Vegetables"]
+        engine.staff_tasks = [chopping, chopping]
+        engine.task_progress = [30, 10]
+
+        engine.step()
+
+        # The second cook has less progress to lose, so it gives up its knife set
+        self.assertEqual(engine.kitchen_manager.allocated, [[1, 0], [0, 0]])
+        self.assertEqual(engine.task_progress, [30, 0])
+        self.assertEqual(engine.metrics.recoveries, 1)
+        self.assertEqual(engine.metrics.preemptions, 1)
+        self.assertEqual(engine.metrics.lost_progress, 10)
+
+        engine.step()
+        self.assertEqual(engine.kitchen_manager.allocated[0], [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
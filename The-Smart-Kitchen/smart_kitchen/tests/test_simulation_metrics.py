@@ -0,0 +1,117 @@
+"""
+Unit tests for incremental simulation metrics.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_metrics import SimulationMetrics
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine, MODE_BANKERS
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestSimulationMetrics(unittest.TestCase):
+    """Test cases for the SimulationMetrics class"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.compiled = CompiledScenario(["Chef", "Chef", "Dishwasher"], ["Stove", "Oven"])
+        self.metrics = SimulationMetrics(self.compiled, [2, 1], [1, 1])
+
+    def test_task_completion_counts(self):
+        """Test throughput per staff member and per role"""
+        self.metrics.task_completed(0)
+        self.metrics.task_completed(1)
+        self.metrics.task_completed(0)
+
+        self.assertEqual(self.metrics.tasks_completed, [2, 1, 0])
+        self.assertEqual(self.metrics.role_completed, {"Chef": 3})
+
+    def test_blocked_time_is_charged_per_equipment(self):
+        """Test that waiting time is charged to each missing equipment type"""
+        both = CompiledScenario.mask_of([0, 1])
+        self.metrics.waiting(0, both, 2)
+        self.metrics.waiting(0, both, 3)
+        self.metrics.waiting(0, 0b01, 5)
+        self.metrics.waiting(0, 0, 9)
+
+        self.assertEqual(self.metrics.blocked_time(0, 20), 7)
+        self.assertEqual(self.metrics.blocked_time(1, 20), 3)
+
+    def test_blocked_time_includes_open_waits(self):
+        """Test that a wait still in progress counts up to the query step"""
+        self.metrics.waiting(2, 0b10, 4)
+
+        self.assertEqual(self.metrics.blocked_time(1, 10), 6)
+        self.assertEqual(self.metrics.blocked_time(0, 10), 0)
+
+    def test_time_weighted_utilization(self):
+        """Test utilization integrated over allocation and capacity changes"""
+        # Stove: 1 of 2 in use for steps 0-4, 2 of 2 for steps 4-8
+        self.metrics.allocation_changed(0, 2, 4)
+        self.assertAlmostEqual(self.metrics.utilization(0, 8), 0.75)
+
+        # A third stove arrives at step 8, still 2 in use until step 12
+        self.metrics.capacity_changed(0, 3, 8)
+        self.assertAlmostEqual(self.metrics.utilization(0, 12), 20 / 28)
+        self.assertEqual(self.metrics.utilization(1, 0), 0.0)
+
+    def test_copy_is_independent(self):
+        """Test that a copy does not share mutable state"""
+        self.metrics.request("Request granted")
+        clone = self.metrics.copy()
+        clone.task_completed(0)
+        clone.request("Request granted")
+
+        self.assertEqual(self.metrics.tasks_completed, [0, 0, 0])
+        self.assertEqual(self.metrics.request_outcomes, {"Request granted": 1})
+        self.assertEqual(clone.request_outcomes, {"Request granted": 2})
+
+    def test_format_summary(self):
+        """Test that the summary table lists staff, equipment and requests"""
+        self.metrics.task_completed(2)
+        text = self.metrics.format_summary(10)
+
+        self.assertIn("Simulation Metrics (10 steps)", text)
+        self.assertIn("Dishwasher", text)
+        self.assertIn("Oven", text)
+        self.assertIn("None", text)
+
+
+class TestEngineMetrics(unittest.TestCase):
+    """Test cases for metrics collected by the simulation engine"""
+
+    def test_engine_metrics_match_state(self):
+        """Test that engine events keep metrics consistent with the manager"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=4)
+        engine.run(120)
+        metrics = engine.metrics
+        manager = engine.kitchen_manager
+
+        in_use = [total - free for total, free in zip(engine.equipment_totals, manager.available)]
+        self.assertEqual(metrics.in_use, in_use)
+        self.assertGreater(sum(metrics.tasks_completed), 0)
+        self.assertGreater(sum(metrics.request_outcomes.values()), 0)
+        for j in range(engine.compiled.num_equipment):
+            self.assertLessEqual(metrics.utilization(j, engine.current_step), 1.0)
+
+    def test_metrics_follow_checkpoints(self):
+        """Test that restoring a checkpoint restores the metrics"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=4)
+        engine.run(30)
+        checkpoint = engine.checkpoint()
+        completed = engine.metrics.tasks_completed[:]
+
+        engine.run(60)
+        engine.restore(checkpoint)
+
+        self.assertEqual(engine.metrics.tasks_completed, completed)
+        self.assertIsNot(engine.metrics, checkpoint.metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for Chrome trace export of the simulation.
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.simulation_trace import ChromeTraceWriter, SimulationTracer
+from smart_kitchen.core.simulation_engine import (
+    KitchenSimulationEngine, MODE_NORMAL, MODE_BANKERS
+)
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestSimulationTrace(unittest.TestCase):
+    """Test cases for the trace writer and simulation tracer"""
+
+    def setUp(self):
+        """Set up a temporary trace file"""
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+
+    def tearDown(self):
+        """Remove the temporary trace file"""
+        os.remove(self.path)
+
+    def load(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def trace_run(self, scenario, mode, steps, seed=3):
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS[scenario], mode, seed=seed)
+        engine.attach_tracer(SimulationTracer(ChromeTraceWriter(self.path)))
+        engine.run(steps)
+        engine.detach_tracer()
+        return engine
+
+    def test_empty_trace_is_valid_json(self):
+        """Test that a trace with no events is still a JSON array"""
+        with ChromeTraceWriter(self.path):
+            pass
+        self.assertEqual(self.load(), [])
+
+    def test_one_track_per_staff(self):
+        """Test that every staff member gets a named track"""
+        engine = self.trace_run("busy_restaurant", MODE_BANKERS, 10)
+        events = self.load()
+
+        threads = [e for e in events if e["ph"] == "M" and e["name"] == "thread_name"]
+        self.assertEqual(len(threads), engine.compiled.num_staff)
+        self.assertEqual(threads[0]["args"]["name"], "Head Chef #1")
+
+    def test_holds_nest_inside_tasks(self):
+        """Test that equipment hold slices lie within a task slice on the same track"""
+        self.trace_run("busy_restaurant", MODE_BANKERS, 150)
+        events = self.load()
+
+        tasks = [e for e in events if e["ph"] == "X" and e["cat"] == "task"]
+        holds = [e for e in events if e["ph"] == "X" and e["cat"] == "equipment"]
+        self.assertTrue(tasks)
+        self.assertTrue(holds)
+        for hold in holds:
+            self.assertTrue(any(
+                task["tid"] == hold["tid"]
+                and task["ts"] <= hold["ts"]
+                and hold["ts"] + hold["dur"] <= task["ts"] + task["dur"]
+                for task in tasks
+            ), hold)
+
+    def test_deadlock_instant_event(self):
+        """Test that a detected deadlock is written as a global instant event"""
+        engine = self.trace_run("deadlock_scenario", MODE_NORMAL, 50)
+        events = self.load()
+
+        self.assertTrue(engine.deadlock_detected)
+        deadlocks = [e for e in events if e["name"] == "Deadlock"]
+        self.assertEqual(len(deadlocks), 1)
+        self.assertEqual(deadlocks[0]["s"], "g")
+
+    def test_restore_ends_trace(self):
+        """Test that restoring a checkpoint finishes the trace"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["small_kitchen"], MODE_BANKERS, seed=1)
+        checkpoint = engine.checkpoint()
+        engine.attach_tracer(SimulationTracer(ChromeTraceWriter(self.path)))
+        engine.run(20)
+        engine.restore(checkpoint)
+
+        self.assertIsNone(engine.tracer)
+        self.assertTrue(self.load())
+
+
+if __name__ == "__main__":
+    unittest.main()
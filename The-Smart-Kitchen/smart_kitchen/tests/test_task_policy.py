@@ -0,0 +1,90 @@
+"""
+Unit tests for the task-assignment policies.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.task_policy import (
+    RandomTaskPolicy, LeastBlockedTaskPolicy, LookaheadTaskPolicy,
+    compare_task_policies, format_policy_comparison
+)
+from smart_kitchen.core.simulation_engine import (
+    KitchenSimulationEngine, MODE_BANKERS, MODE_RECOVERY
+)
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+# A line cook and a prep cook; the single stove is in use by the prep cook
+STOVE_IN_USE = {
+    "name": "Busy Stove",
+    "staff": ["Line Cook", "Prep Cook"],
+    "equipment": ["Stove", "Cutting Board", "Knife Set"],
+    "available": [0, 1, 1],
+    "max_needs": [[1, 1, 1], [1, 1, 1]],
+    "allocated": [[0, 0, 0], [1, 0, 0]],
+}
+
+
+class TestTaskPolicies(unittest.TestCase):
+    """Test cases for the task-assignment policies"""
+
+    def test_random_policy_matches_default(self):
+        """Test that the random policy reproduces the engine's original task draws"""
+        scenario = KITCHEN_SCENARIOS["busy_restaurant"]
+        default = KitchenSimulationEngine(scenario, MODE_BANKERS, seed=9)
+        policy = KitchenSimulationEngine(scenario, MODE_BANKERS, seed=9, task_policy=RandomTaskPolicy())
+        default.run(300)
+        policy.run(300)
+
+        self.assertEqual(default.staff_tasks, policy.staff_tasks)
+        self.assertEqual(default.metrics.tasks_completed, policy.metrics.tasks_completed)
+
+    def test_least_blocked_avoids_equipment_in_use(self):
+        """Test that the least-blocked policy picks a task it can be granted now"""
+        engine = KitchenSimulationEngine(STOVE_IN_USE, MODE_BANKERS, seed=1)
+        appetizers = engine.compiled.task_index["Preparing Appetizers"]
+        policy = LeastBlockedTaskPolicy()
+
+        for _ in range(20):
+            self.assertEqual(policy.choose(engine, 0), appetizers)
+
+    def test_nothing_is_grantable_without_requests(self):
+        """Test that modes which never hand out equipment treat all of it as blocked"""
+        engine = KitchenSimulationEngine(STOVE_IN_USE, seed=1)
+        self.assertEqual(LeastBlockedTaskPolicy.grantable_mask(engine, 0), 0)
+
+    def test_lookahead_waits_for_earliest_release(self):
+        """Test that the lookahead policy estimates when held equipment comes back"""
+        engine = KitchenSimulationEngine(STOVE_IN_USE, MODE_RECOVERY, seed=1)
+        engine.task_progress[1] = 75
+        policy = LookaheadTaskPolicy()
+
+        self.assertEqual(policy.release_estimates(engine)[0], 3)
+        self.assertEqual(policy.choose(engine, 0), engine.compiled.task_index["Preparing Appetizers"])
+
+    def test_policies_only_pick_own_tasks(self):
+        """Test that every policy picks from the staff member's own task list"""
+        for policy in (RandomTaskPolicy, LeastBlockedTaskPolicy, LookaheadTaskPolicy):
+            engine = KitchenSimulationEngine(
+                KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=2, task_policy=policy()
+            )
+            for _ in range(200):
+                engine.step()
+                for i, task_id in enumerate(engine.staff_tasks):
+                    self.assertIn(task_id, engine.compiled.staff_task_ids[i])
+
+    def test_compare_task_policies(self):
+        """Test the comparison runner and its table"""
+        results = compare_task_policies(KITCHEN_SCENARIOS["busy_restaurant"], 500, seed=4)
+
+        self.assertEqual([r["policy"] for r in results], ["Random", "Least Blocked", "Lookahead"])
+        self.assertTrue(all(r["steps"] == 500 for r in results))
+        self.assertGreater(results[1]["tasks"], results[0]["tasks"])
+        self.assertIn("+0.0%", format_policy_comparison(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Unit tests for trace-driven simulation from recorded kitchen logs.
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.trace_replay import (
+    KitchenLogReplay, read_kitchen_log, FINDING_DELAY, FINDING_CONFLICT, FINDING_CLAIM
+)
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine
+
+# Two line cooks who may each claim both stoves
+TWO_STOVES = {
+    "name": "Grill Line",
+    "staff": ["Line Cook", "Line Cook"],
+    "equipment": ["Stove"],
+    "available": [2],
+    "max_needs": [[2], [2]],
+    "allocated": [[0], [0]],
+}
+
+# Two line cooks sharing a single stove
+ONE_STOVE = {
+    "name": "Small Line",
+    "staff": ["Line Cook", "Line Cook"],
+    "equipment": ["Stove"],
+    "available": [1],
+    "max_needs": [[1], [1]],
+    "allocated": [[0], [0]],
+}
+
+# A single stove the first line cook never declared a need for
+UNCLAIMED_STOVE = {
+    "name": "Small Line",
+    "staff": ["Line Cook", "Line Cook"],
+    "equipment": ["Stove"],
+    "available": [1],
+    "max_needs": [[0], [1]],
+    "allocated": [[0], [0]],
+}
+
+
+class TestKitchenLogReplay(unittest.TestCase):
+    """Test cases for the log reader and KitchenLogReplay"""
+
+    def write_log(self, suffix, text):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "w") as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_read_csv_and_jsonl(self):
+        """Test that CSV and JSON Lines logs yield the same events"""
+        csv_path = self.write_log(".csv", (
+            "timestamp,staff,task,event\n"
+            "0,Line Cook #1,Grilling,start\n"
+            "2024-05-01T12:00:30,Line Cook,Grilling,END\n"
+        ))
+        jsonl_path = self.write_log(".jsonl", "\n".join([
+            json.dumps({"timestamp": 0, "staff": "Line Cook #1", "task": "Grilling", "event": "start"}),
+            "",
+            json.dumps({"timestamp": "2024-05-01T12:00:30", "staff": "Line Cook",
+                        "task": "Grilling", "event": "end"}),
+        ]))
+
+        csv_events = list(read_kitchen_log(csv_path))
+        self.assertEqual(csv_events, list(read_kitchen_log(jsonl_path)))
+        self.assertEqual(csv_events[0], (0.0, "Line Cook #1", "Grilling", "start"))
+        self.assertEqual(csv_events[1][3], "end")
+
+    def test_missing_field(self):
+        """Test that a record without a required field is rejected"""
+        path = self.write_log(".csv", "timestamp,staff,task\n0,Line Cook,Grilling\n")
+        with self.assertRaises(ValueError):
+            list(read_kitchen_log(path))
+
+    def test_tasks_follow_the_log(self):
+        """Test that tasks start and end when logged and release their equipment"""
+        engine = KitchenSimulationEngine(ONE_STOVE)
+        replay = KitchenLogReplay(engine, seconds_per_step=60)
+        stove = engine.compiled.task_index["Grilling"]
+
+        self.assertEqual(engine.staff_tasks, [CompiledScenario.NO_TASK] * 2)
+        replay.feed(0, "Line Cook", "Grilling", "start")
+        self.assertEqual(engine.staff_tasks[0], stove)
+        self.assertEqual(engine.kitchen_manager.allocated[0], [1])
+
+        replay.feed(150, "Line Cook", "Grilling", "end")
+        replay.finish()
+        self.assertEqual(engine.current_step, 2)
+        self.assertEqual(engine.kitchen_manager.available, [1])
+        self.assertEqual(engine.metrics.tasks_completed, [1, 0])
+
+    def test_conflict(self):
+        """Test that starting on equipment already in use is a conflict"""
+        engine = KitchenSimulationEngine(ONE_STOVE)
+        summary = KitchenLogReplay(engine).run([
+            (0, "Line Cook #1", "Grilling", "start"),
+            (60, "Line Cook #2", "Frying", "start"),
+            (120, "Line Cook #1", "Grilling", "end"),
+            (180, "Line Cook #2", "Frying", "end"),
+        ])
+
+        self.assertEqual(summary["tasks_with_findings"][FINDING_CONFLICT], 1)
+        self.assertEqual(summary["equipment"][0], ("Stove", {
+            FINDING_DELAY: 0, FINDING_CONFLICT: 1, FINDING_CLAIM: 0
+        }))
+        self.assertEqual(summary["examples"], [(1, "Line Cook #2", "Frying", "Stove", FINDING_CONFLICT)])
+        self.assertEqual(engine.kitchen_manager.available, [1])
+
+    def test_bankers_delay(self):
+        """Test that a start taking the kitchen to an unsafe state is a Banker's delay"""
+        engine = KitchenSimulationEngine(TWO_STOVES)
+        found = []
+        replay = KitchenLogReplay(engine, on_finding=lambda *finding: found.append(finding))
+        replay.feed(0, "Line Cook", "Grilling", "start")
+        replay.feed(30, "Line Cook", "Frying", "start")
+
+        # The second stove was free, so the kitchen still took it
+        self.assertEqual(engine.kitchen_manager.available, [0])
+        self.assertEqual(found, [(0, 1, engine.compiled.task_index["Frying"], 0, FINDING_DELAY)])
+        self.assertEqual(replay.tasks_with_findings[FINDING_DELAY], 1)
+
+    def test_claim_exceeded_still_takes_the_unit(self):
+        """Test that a unit taken beyond the claim is held until the task ends"""
+        engine = KitchenSimulationEngine(UNCLAIMED_STOVE)
+        replay = KitchenLogReplay(engine)
+        replay.feed(0, "Line Cook #1", "Grilling", "start")
+        self.assertEqual(engine.kitchen_manager.allocated[0], [1])
+        self.assertEqual(engine.kitchen_manager.available, [0])
+
+        # The second cook finds the stove taken
+        replay.feed(60, "Line Cook #2", "Frying", "start")
+        self.assertEqual(replay.staff_findings[FINDING_CLAIM], [1, 0])
+        self.assertEqual(replay.staff_findings[FINDING_CONFLICT], [0, 1])
+
+        replay.feed(120, "Line Cook #1", "Grilling", "end")
+        self.assertEqual(engine.kitchen_manager.available, [1])
+
+    def test_unmapped_events_are_counted(self):
+        """Test that events outside the kitchen are skipped and counted"""
+        engine = KitchenSimulationEngine(ONE_STOVE)
+        replay = KitchenLogReplay(engine)
+        replay.run([
+            (0, "Pastry Chef", "Grilling", "start"),
+            (0, "Line Cook #3", "Grilling", "start"),
+            (0, "Line Cook", "Baking Bread", "start"),
+            (0, "Line Cook", "Grilling", "end"),
+            (0, "Line Cook", "Grilling", "paused"),
+        ])
+
+        self.assertEqual(replay.anomalies, {
+            "Unknown staff": 2, "Unknown task": 1, "End without start": 1, "Unknown event": 1
+        })
+        self.assertEqual(replay.tasks_started, 0)
+        self.assertIn("Log Anomalies:", replay.format_summary())
+
+    def test_memory_does_not_grow_with_the_log(self):
+        """Test that only the first examples are kept however long the log is"""
+        engine = KitchenSimulationEngine(ONE_STOVE)
+        replay = KitchenLogReplay(engine, max_examples=5)
+
+        def events():
+            for n in range(1000):
+                yield (n * 60, "Line Cook #1", "Grilling", "start")
+                yield (n * 60, "Line Cook #2", "Frying", "start")
+                yield (n * 60 + 30, "Line Cook #1", "Grilling", "end")
+                yield (n * 60 + 30, "Line Cook #2", "Frying", "end")
+
+        summary = replay.run(events())
+        self.assertEqual(summary["events"], 4000)
+        self.assertEqual(summary["tasks_with_findings"][FINDING_CONFLICT], 1000)
+        self.assertEqual(len(summary["examples"]), 5)
+        self.assertEqual(sum(tasks for _, tasks in summary["metrics"]["tasks_per_staff"]), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for the ring-buffered utilization history.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.utilization_history import UtilizationSeries, UtilizationHistory
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine, MODE_BANKERS
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestUtilizationSeries(unittest.TestCase):
+    """Test cases for the UtilizationSeries class"""
+
+    def test_raw_samples_when_short(self):
+        """Test that short runs are returned sample by sample"""
+        series = UtilizationSeries()
+        for step in range(1, 6):
+            series.add(step, step, 10 - step)
+
+        buckets = series.buckets(100)
+
+        self.assertEqual([b[0] for b in buckets], [1, 2, 3, 4, 5])
+        self.assertEqual(buckets[2], (3, 3, 3, 3.0, 7.0))
+
+    def test_downsampled_buckets_keep_min_max_mean(self):
+        """Test that coarser buckets aggregate min, max and mean"""
+        series = UtilizationSeries(capacity=8, levels=3, factor=4)
+        for step in range(1, 11):
+            series.add(step, step, 0)
+
+        buckets = series.buckets(4)
+
+        # Two closed buckets of four samples plus the partial tail
+        self.assertEqual(buckets, [
+            (1, 1, 4, 2.5, 0.0),
+            (5, 5, 8, 6.5, 0.0),
+            (9, 9, 10, 9.5, 0.0),
+        ])
+
+    def test_memory_is_bounded(self):
+        """Test that long runs still return a bounded number of buckets"""
+        series = UtilizationSeries(capacity=16, levels=6, factor=4)
+        for step in range(1, 50001):
+            series.add(step, step % 3, 3 - step % 3)
+
+        buckets = series.buckets(200)
+
+        self.assertLessEqual(len(buckets), 17)
+        self.assertEqual(min(b[1] for b in buckets), 0)
+        self.assertEqual(max(b[2] for b in buckets), 2)
+        self.assertEqual(series.samples, 50000)
+
+    def test_coarsest_level_keeps_latest_when_full(self):
+        """Test that a run longer than the coarsest level keeps the newest buckets"""
+        series = UtilizationSeries(capacity=4, levels=2, factor=2)
+        for step in range(1, 101):
+            series.add(step, 1, 1)
+
+        buckets = series.buckets(1000)
+
+        self.assertEqual([b[0] for b in buckets], [93, 95, 97, 99])
+
+
+class TestUtilizationHistory(unittest.TestCase):
+    """Test cases for engine-level utilization recording"""
+
+    def test_record_per_equipment(self):
+        """Test that one series is kept per equipment type"""
+        history = UtilizationHistory(2)
+        history.record(1, [1, 0], [2, 3])
+
+        self.assertEqual(history.series[0].buckets(10), [(1, 1, 1, 1.0, 2.0)])
+        self.assertEqual(history.series[1].buckets(10), [(1, 0, 0, 0.0, 3.0)])
+
+    def test_engine_records_every_step(self):
+        """Test that the engine samples utilization once per step"""
+        engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["small_kitchen"], MODE_BANKERS, seed=2)
+        engine.run(25)
+
+        for j, series in enumerate(engine.utilization.series):
+            self.assertEqual(series.samples, 25)
+            for _, low, high, mean, available in series.buckets(100):
+                self.assertLessEqual(high, engine.equipment_totals[j])
+                self.assertAlmostEqual(mean + available, engine.equipment_totals[j])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for the wait-for graph derived from the kitchen manager.
+"""
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.wait_for_graph import KitchenWaitForGraph
+
+
+class TestKitchenWaitForGraph(unittest.TestCase):
+    """Test cases for live deadlock diagnosis"""
+
+    def setUp(self):
+        """Two cooks, one stove and one oven, nothing allocated"""
+        self.manager = KitchenResourceManager([1, 1], [[1, 1], [1, 1]], [[0, 0], [0, 0]])
+        self.graph = KitchenWaitForGraph(self.manager, ["Chef", "Cook"], ["Stove", "Oven"])
+
+    def test_circular_wait(self):
+        """Test that crossed first-come first-served grants deadlock"""
+        graph = self.graph
+        self.assertTrue(graph.request(0, [1, 0], check_safety=False)[0])
+        self.assertTrue(graph.request(1, [0, 1], check_safety=False)[0])
+        self.assertFalse(graph.diagnose()["deadlocked"])
+
+        self.assertEqual(graph.request(0, [0, 1], check_safety=False), (False, "Insufficient resources available"))
+        self.assertFalse(graph.diagnose()["deadlocked"])
+        graph.request(1, [1, 0], check_safety=False)
+        diagnosis = graph.diagnose()
+        self.assertTrue(diagnosis["deadlocked"])
+        self.assertEqual(diagnosis["deadlocked_staff"], [0, 1])
+        self.assertEqual(diagnosis["cycles"], [["Chef", "Oven", "Cook", "Stove", "Chef"]])
+
+        # The chef gives up the stove: the cook can go ahead
+        self.assertTrue(graph.release(0, [1, 0])[0])
+        self.assertFalse(graph.diagnose()["deadlocked"])
+        self.assertEqual(graph.request(1, [1, 0], check_safety=False), (True, "Request granted"))
+        self.assertEqual(graph.requests, {0: [0, 1]})
+
+    def test_bankers_check_prevents_deadlock(self):
+        """Test that requests denied as unsafe wait without deadlocking"""
+        graph = self.graph
+        self.assertTrue(graph.request(0, [1, 0])[0])
+        self.assertEqual(graph.request(1, [0, 1]), (False, "Request would lead to unsafe state"))
+        self.assertEqual(graph.requests, {1: [0, 1]})
+        self.assertFalse(graph.diagnose()["deadlocked"])
+
+    def test_invalid_requests_do_not_wait(self):
+        """Test that requests no release could satisfy are not recorded"""
+        graph = self.graph
+        self.assertFalse(graph.request(0, [2, 0], check_safety=False)[0])
+        self.assertEqual(graph.requests, {})
+
+    def test_multi_instance_escape(self):
+        """Test a cycle through a resource with a unit held outside it"""
+        manager = KitchenResourceManager([0, 0], [[2, 1], [2, 1], [1, 1]], [[1, 0], [0, 1], [1, 0]])
+        graph = KitchenWaitForGraph(manager)
+        graph.request(0, [0, 1], check_safety=False)
+        graph.request(1, [1, 0], check_safety=False)
+        self.assertTrue(graph.graph.has_cycle)
+        self.assertFalse(graph.diagnose()["deadlocked"])
+
+        # Once the third cook also waits, nobody can return a stove
+        graph.request(2, [0, 1], check_safety=False)
+        diagnosis = graph.diagnose()
+        self.assertEqual(diagnosis["deadlocked_staff"], [0, 1, 2])
+        self.assertEqual(diagnosis["blocked_staff"], [])
+
+    def test_sync_after_direct_changes(self):
+        """Test that sync picks up allocations made around the adapter"""
+        self.manager.allocate_resources(0, [1, 1])
+        self.graph.sync()
+        self.assertEqual(self.graph.held_totals, [1, 1])
+        self.graph.request(1, [1, 0], check_safety=False)
+        self.assertFalse(self.graph.diagnose()["deadlocked"])
+
+    def test_wait_carries_requests_to_a_new_graph(self):
+        """Test that recorded waiting requests rebuild the same diagnosis"""
+        graph = self.graph
+        graph.request(0, [1, 0], check_safety=False)
+        graph.request(1, [0, 1], check_safety=False)
+        graph.request(0, [0, 1], check_safety=False)
+        graph.request(1, [1, 0], check_safety=False)
+
+        manager = KitchenResourceManager(self.manager.available[:], self.manager.max_resources,
+                                         [row[:] for row in self.manager.allocated])
+        rebuilt = KitchenWaitForGraph(manager, ["Chef", "Cook"], ["Stove", "Oven"])
+        for staff_id, request in graph.requests.items():
+            rebuilt.wait(staff_id, request)
+
+        self.assertEqual(rebuilt.requests, graph.requests)
+        self.assertEqual(manager.allocated, self.manager.allocated)
+        self.assertEqual(rebuilt.diagnose(), graph.diagnose())
+
+    def test_matches_detection_algorithm(self):
+        """Test random requests and releases against the manager's detection"""
+        rng = random.Random(7)
+        n, m = 8, 3
+        manager = KitchenResourceManager(
+            [2, 1, 3], [[2, 1, 3] for _ in range(n)], [[0] * m for _ in range(n)]
+        )
+        graph = KitchenWaitForGraph(manager)
+        for _ in range(2000):
+            staff_id = rng.randrange(n)
+            if rng.random() < 0.3:
+                graph.release(staff_id, manager.allocated[staff_id][:])
+            else:
+                request = [0] * m
+                request[rng.randrange(m)] = rng.randint(1, 2)
+                graph.request(staff_id, request, check_safety=rng.random() < 0.2)
+
+            diagnosis = graph.diagnose()
+            stuck = manager.find_deadlocked_staff(graph.requests)
+            self.assertEqual(sorted(diagnosis["deadlocked_staff"] + diagnosis["blocked_staff"]), stuck)
+            self.assertEqual(graph.held, manager.allocated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for order-arrival workloads.
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import local modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import KitchenSimulationEngine, MODE_BANKERS
+from smart_kitchen.core.workload import (
+    PoissonOrderStream, TimeOfDayOrderStream, ReplayOrderStream, Workload,
+    percentile, histogram_percentile, load_sweep, saturation_point, format_load_sweep
+)
+from smart_kitchen.data.kitchen_data import KITCHEN_SCENARIOS
+
+
+class TestOrderStreams(unittest.TestCase):
+    """Test cases for order streams"""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles"""
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 95), 5)
+        self.assertEqual(percentile(values, 1), 1)
+        self.assertIsNone(percentile([], 50))
+
+    def test_histogram_percentile_matches_list(self):
+        """Test that percentiles of a histogram equal those of the values"""
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+        counts = {}
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+        for q in (1, 25, 50, 90, 99, 100):
+            self.assertEqual(histogram_percentile(counts, len(values), q), percentile(values, q))
+        self.assertIsNone(histogram_percentile({}, 0, 50))
+
+    def test_poisson_mean(self):
+        """Test that Poisson arrivals average out to the requested rate"""
+        stream = PoissonOrderStream(0.3, seed=4)
+        arrivals = sum(stream.poisson(stream.rate_at(step)) for step in range(20000))
+        self.assertAlmostEqual(arrivals / 20000, 0.3, delta=0.02)
+
+    def test_time_of_day_curve(self):
+        """Test that the rate follows the repeating curve"""
+        stream = TimeOfDayOrderStream([0.0, 0.5, 0.1], steps_per_period=10)
+        self.assertEqual([stream.rate_at(s) for s in (0, 9, 10, 25, 30)], [0.0, 0.0, 0.5, 0.1, 0.0])
+
+
+class TestWorkload(unittest.TestCase):
+    """Test cases for driving the engine from order queues"""
+
+    def setUp(self):
+        """Set up test cases"""
+        self.engine = KitchenSimulationEngine(KITCHEN_SCENARIOS["busy_restaurant"], MODE_BANKERS, seed=1)
+
+    def test_replayed_orders_complete(self):
+        """Test that replayed orders are queued by role and completed"""
+        orders = [
+            {"step": 1, "tasks": ["Grilling", "Washing Dishes"]},
+            {"step": 1, "tasks": ["Grilling"]},
+            {"step": 5, "random": True},
+        ]
+        workload = Workload(ReplayOrderStream(orders, seed=2))
+        self.engine.attach_workload(workload)
+        self.engine.run(400)
+
+        self.assertEqual(workload.orders_arrived, 3)
+        self.assertEqual(workload.orders_completed, 3)
+        self.assertEqual(sum(workload.latency_counts.values()), 3)
+        self.assertEqual(workload.backlog, 0)
+        self.assertIn(CompiledScenario.NO_TASK, self.engine.staff_tasks)
+
+    def test_replay_rejects_unknown_tasks(self):
+        """Test that replaying a task nobody in the kitchen performs fails early"""
+        workload = Workload(ReplayOrderStream([{"step": 1, "tasks": ["Baking Desserts"]}]))
+        with self.assertRaises(ValueError):
+            self.engine.attach_workload(workload)
+
+    def test_random_orders_use_distinct_roles(self):
+        """Test that a random order takes one task from each of several roles"""
+        stream = PoissonOrderStream(1.0, tasks_per_order=3, seed=3)
+        self.engine.attach_workload(Workload(stream))
+        compiled = self.engine.compiled
+
+        for _ in range(20):
+            tasks = stream.expand()
+            roles = {role for role, menu in stream.menu.items() for task in tasks if task in menu}
+            self.assertEqual(len(tasks), 3)
+            self.assertEqual(len(roles), 3)
+            for task in tasks:
+                self.assertIn(task, compiled.task_index)
+
+    def test_load_sweep_finds_saturation(self):
+        """Test that latency grows with load and saturation is detected"""
+        results = load_sweep(KITCHEN_SCENARIOS["busy_restaurant"], [0.01, 0.4], 1500, MODE_BANKERS, seed=1)
+        light, heavy = results
+
+        self.assertEqual(saturation_point(results), 0.4)
+        self.assertLess(light["latency"][50], heavy["latency"][50])
+        self.assertIn("Saturation point: 0.4", format_load_sweep(results))
+
+
+if __name__ == "__main__":
+    unittest.main()
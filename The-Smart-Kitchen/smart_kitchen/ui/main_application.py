@@ -7,17 +7,29 @@ import sys
 import os
 import sqlite3
 import json
+import time
 
 # Add parent directory to path to import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.scheduling import (
+    FCFSScheduler, MultiServerFCFSScheduler, generate_jobs, compare_schedulers,
+    default_policies, format_scheduler_comparison
+)
+from smart_kitchen.core.page_replacement import FIFOReplacer, simulate_replacement
+from smart_kitchen.core.resource_graph import ResourceAllocationGraph
+from smart_kitchen.core.wait_for_graph import KitchenWaitForGraph
+from smart_kitchen.core.gantt import GanttTimeline
+from smart_kitchen.core.bulk_import import (
+    IMPORT_FILETYPES, load_banker_input, load_reference_string, load_jobs, load_rag_input
+)
 from smart_kitchen.data.kitchen_data import (
     STAFF_TYPES, EQUIPMENT_TYPES, STAFF_ICONS, EQUIPMENT_ICONS,
     KITCHEN_SCENARIOS, FOOD_TASKS, TASK_EQUIPMENT_NEEDS
 )
 from smart_kitchen.ui.visualization import (
-    KitchenVisualization, create_resource_allocation_canvas
+    KitchenVisualization, GanttChartRenderer, create_resource_allocation_canvas
 )
 from smart_kitchen.ui.simulation import KitchenSimulation
 from smart_kitchen.data.user_database import UserDatabase
@@ -26,6 +38,9 @@ SCENARIO_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data',
 if not os.path.exists(SCENARIO_DIR):
     os.makedirs(SCENARIO_DIR)
 
+# Rows listed in demonstration output before the rest are only counted
+DEMO_ROW_LIMIT = 200
+
 class SmartKitchenApp:
     """Main application for the Smart Kitchen Resource Management System"""
     
@@ -71,6 +86,8 @@ class SmartKitchenApp:
         self.max_resources = []
         self.allocated = []
         self.kitchen_manager = None
+        # Live wait-for graph of the manager, rebuilt whenever the manager is replaced
+        self.wait_for_graph = None
         self.scenario_var = tk.StringVar()
         
         # Create and setup UI components
@@ -366,7 +383,7 @@ class SmartKitchenApp:
         self.new_staff_entry.pack(side=tk.LEFT, padx=5)
         ttk.Button(staff_input_frame, text="Add Staff", command=self.add_staff).pack(side=tk.LEFT, padx=5)
         ttk.Button(staff_input_frame, text="Remove Selected", command=self.remove_staff).pack(side=tk.LEFT, padx=5)
-        self.staff_listbox = tk.Listbox(staff_frame, height=6, selectmode=tk.SINGLE)
+        self.staff_listbox = tk.Listbox(staff_frame, height=6, selectmode=tk.SINGLE, exportselection=False)
         self.staff_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         staff_scrollbar = ttk.Scrollbar(staff_frame, orient=tk.VERTICAL, command=self.staff_listbox.yview)
         staff_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -391,7 +408,7 @@ class SmartKitchenApp:
         equipment_quantity_spinbox.pack(side=tk.LEFT, padx=5)
         ttk.Button(equipment_input_frame, text="Add Equipment", command=self.add_equipment).pack(side=tk.LEFT, padx=5)
         ttk.Button(equipment_input_frame, text="Remove Selected", command=self.remove_equipment).pack(side=tk.LEFT, padx=5)
-        self.equipment_listbox = tk.Listbox(equipment_frame, height=6, selectmode=tk.SINGLE)
+        self.equipment_listbox = tk.Listbox(equipment_frame, height=6, selectmode=tk.SINGLE, exportselection=False)
         self.equipment_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         equipment_scrollbar = ttk.Scrollbar(equipment_frame, orient=tk.VERTICAL, command=self.equipment_listbox.yview)
         equipment_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -424,6 +441,19 @@ class SmartKitchenApp:
         ttk.Button(safety_frame, text="Check Safety", command=self.check_safety).pack(side=tk.LEFT, padx=5)
         ttk.Button(safety_frame, text="Detect Deadlock", command=self.detect_deadlock).pack(side=tk.LEFT, padx=5)
         ttk.Button(safety_frame, text="Show Safe Sequence", command=self.show_safe_sequence).pack(side=tk.LEFT, padx=5)
+        # Equipment requests: one unit of the selected equipment for the selected staff member
+        request_frame = ttk.LabelFrame(right_panel, text="Equipment Requests")
+        request_frame.pack(fill=tk.X, padx=5, pady=(0, 10))
+        ttk.Button(request_frame, text="Request Unit", command=self.request_equipment).pack(side=tk.LEFT, padx=5, pady=5)
+        ttk.Button(request_frame, text="Release Unit", command=self.release_equipment).pack(side=tk.LEFT, padx=5, pady=5)
+        self.bankers_check_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            request_frame,
+            text="Banker's check",
+            variable=self.bankers_check_var
+        ).pack(side=tk.LEFT, padx=5, pady=5)
+        self.deadlock_status_var = tk.StringVar(value="")
+        ttk.Label(request_frame, textvariable=self.deadlock_status_var).pack(side=tk.LEFT, padx=10, pady=5)
     
     def setup_simulation_tab(self):
         """Set up the kitchen simulation tab."""
@@ -449,7 +479,9 @@ class SmartKitchenApp:
         ttk.Radiobutton(algo_frame, text="FIFO (First-In-First-Out)", variable=self.algo_var, value="fifo").pack(side=tk.LEFT, padx=10, pady=5)
         ttk.Radiobutton(algo_frame, text="FCFS (First-Come-First-Served)", variable=self.algo_var, value="fcfs").pack(side=tk.LEFT, padx=10, pady=5)
         ttk.Radiobutton(algo_frame, text="RAG (Resource Allocation Graph)", variable=self.algo_var, value="rag").pack(side=tk.LEFT, padx=10, pady=5)
+        ttk.Radiobutton(algo_frame, text="Scheduler Comparison", variable=self.algo_var, value="schedulers").pack(side=tk.LEFT, padx=10, pady=5)
         ttk.Button(algo_frame, text="Demonstrate", command=self.demonstrate_algorithm).pack(side=tk.LEFT, padx=20, pady=5)
+        ttk.Button(algo_frame, text="Import File...", command=self.import_demo_input).pack(side=tk.LEFT, pady=5)
         # Add demonstration results area (text area)
         demo_frame = ttk.LabelFrame(demonstration_frame, text="Demonstration Output")
         demo_frame.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -545,6 +577,7 @@ The application is divided into several tabs:
     -   **Safety Check:** Determine if the current state is safe.
     -   **Detect Deadlock:** Check specifically for deadlock conditions using the RAG concept.
     -   **Show Safe Sequence:** If the state is safe, visualize a possible order of staff completion.
+    -   **Equipment Requests:** Select a staff member and equipment, then request or release one unit. With the Banker's check off, requests are granted first-come first-served; requests that must wait are kept in a live wait-for graph, and the deadlock status next to the buttons updates after every change.
 
 2.  Kitchen Simulation:
     -   (Coming Soon) This tab will allow step-by-step simulation of kitchen tasks and resource requests to observe the resource allocation process dynamically.
@@ -658,6 +691,136 @@ Getting Started:
             self.kitchen_manager.allocated,
             self.kitchen_manager.calculate_need()
         )
+        
+        self.update_deadlock_status()
+    
+    def build_wait_for_graph(self):
+        """Create the wait-for graph of the current kitchen manager."""
+        manager = self.kitchen_manager
+        # Names only when they still line up with the manager's matrices
+        names_match = (
+            len(self.staff_names) == manager.num_staff
+            and len(self.equipment_names) == manager.num_equipment
+        )
+        try:
+            self.wait_for_graph = KitchenWaitForGraph(
+                manager,
+                self.staff_names if names_match else None,
+                self.equipment_names if names_match else None
+            )
+        except ValueError:
+            # Staff and equipment sharing a name cannot be told apart in the graph
+            self.wait_for_graph = KitchenWaitForGraph(manager)
+    
+    def rebuild_kitchen_manager(self, staff_ids=None, equipment_ids=None):
+        """
+        Recreate the kitchen manager from the resource lists, keeping waiting requests.
+        
+        Args:
+            staff_ids: Previous index of each staff member still in the kitchen,
+                or None if no staff member was removed
+            equipment_ids: Previous index of each equipment type (None for new
+                equipment), or None if the equipment is unchanged
+        """
+        waiting = {}
+        if self.wait_for_graph is not None and self.wait_for_graph.manager is self.kitchen_manager:
+            waiting = self.wait_for_graph.requests
+        
+        self.kitchen_manager = KitchenResourceManager(
+            self.available.copy(),
+            [row[:] for row in self.max_resources],
+            [row[:] for row in self.allocated]
+        )
+        self.build_wait_for_graph()
+        
+        new_index = None
+        if staff_ids is not None:
+            new_index = {old: new for new, old in enumerate(staff_ids)}
+        for staff_idx, request in waiting.items():
+            if new_index is not None:
+                staff_idx = new_index.get(staff_idx)
+                if staff_idx is None:
+                    continue
+            if equipment_ids is not None:
+                request = [request[j] if j is not None else 0 for j in equipment_ids]
+            if any(request):
+                self.wait_for_graph.wait(staff_idx, request)
+    
+    def sync_resource_lists(self):
+        """Copy the manager's available and allocated equipment back into the resource lists."""
+        manager = self.kitchen_manager
+        self.available = manager.available[:]
+        self.allocated = [row[:] for row in manager.allocated]
+    
+    def update_deadlock_status(self):
+        """Refresh the live deadlock diagnosis from the wait-for graph."""
+        if self.wait_for_graph is None or self.wait_for_graph.manager is not self.kitchen_manager:
+            self.build_wait_for_graph()
+        
+        diagnosis = self.wait_for_graph.diagnose()
+        waiting = len(self.wait_for_graph.requests)
+        if diagnosis["deadlocked"]:
+            self.deadlock_status_var.set(
+                "Deadlock: " + " -> ".join(diagnosis["cycles"][0])
+            )
+        elif waiting:
+            self.deadlock_status_var.set(f"No deadlock ({waiting} waiting)")
+        else:
+            self.deadlock_status_var.set("No deadlock")
+    
+    def selected_staff_and_equipment(self):
+        """Return the selected staff and equipment indices, or None after an error message."""
+        staff_selection = self.staff_listbox.curselection()
+        equipment_selection = self.equipment_listbox.curselection()
+        if not staff_selection or not equipment_selection:
+            messagebox.showerror("Error", "Please select a staff member and equipment")
+            return None
+        staff_idx, equipment_idx = staff_selection[0], equipment_selection[0]
+        if staff_idx >= self.kitchen_manager.num_staff or equipment_idx >= self.kitchen_manager.num_equipment:
+            messagebox.showerror("Error", "The selected staff member or equipment is not in the resource matrix")
+            return None
+        return staff_idx, equipment_idx
+    
+    def request_equipment(self):
+        """Request one unit of the selected equipment for the selected staff member."""
+        selection = self.selected_staff_and_equipment()
+        if selection is None:
+            return
+        staff_idx, equipment_idx = selection
+        request = [0] * self.kitchen_manager.num_equipment
+        request[equipment_idx] = 1
+        success, reason = self.wait_for_graph.request(
+            staff_idx, request, check_safety=self.bankers_check_var.get()
+        )
+        staff_name = self.staff_names[staff_idx]
+        equipment_name = self.equipment_names[equipment_idx]
+        if success:
+            self.sync_resource_lists()
+            self.log_activity(f"{staff_name} was granted {equipment_name}")
+        elif staff_idx in self.wait_for_graph.requests:
+            self.log_activity(f"{staff_name} is waiting for {equipment_name}: {reason}")
+        else:
+            self.log_activity(f"{staff_name} was refused {equipment_name}: {reason}")
+        self.update_ui()
+    
+    def release_equipment(self):
+        """Release one unit of the selected equipment held by the selected staff member."""
+        selection = self.selected_staff_and_equipment()
+        if selection is None:
+            return
+        staff_idx, equipment_idx = selection
+        release = [0] * self.kitchen_manager.num_equipment
+        release[equipment_idx] = 1
+        success, reason = self.wait_for_graph.release(staff_idx, release)
+        staff_name = self.staff_names[staff_idx]
+        equipment_name = self.equipment_names[equipment_idx]
+        if success:
+            self.sync_resource_lists()
+            self.log_activity(f"{staff_name} released {equipment_name}")
+        else:
+            messagebox.showerror("Error", reason)
+            return
+        self.update_ui()
     
     def add_staff(self):
         """Add new staff member"""
@@ -677,6 +840,7 @@ Getting Started:
         # Update max resources matrix
         self.max_resources.append([0] * self.num_equipment)
         self.allocated.append([0] * self.num_equipment)
+        self.rebuild_kitchen_manager()
         
         # Update UI
         self.update_ui()
@@ -697,13 +861,17 @@ Getting Started:
         staff_name = self.staff_names[selection[0]]
         
         if messagebox.askyesno("Confirm", f"Remove staff member {staff_name}?"):
+            staff_ids = [i for i in range(self.num_staff) if i != selection[0]]
+            
             # Remove from staff list
             self.staff_names.pop(selection[0])
             self.num_staff -= 1
             
-            # Update matrices
+            # Update matrices, returning the equipment the staff member held
             self.max_resources.pop(selection[0])
-            self.allocated.pop(selection[0])
+            held = self.allocated.pop(selection[0])
+            self.available = [free + units for free, units in zip(self.available, held)]
+            self.rebuild_kitchen_manager(staff_ids=staff_ids)
             
             # Update UI
             self.update_ui()
@@ -726,6 +894,7 @@ Getting Started:
             return
         
         # Add to equipment list
+        equipment_ids = list(range(self.num_equipment)) + [None]
         self.equipment_names.append(equipment_name)
         self.num_equipment += 1
         self.available.append(quantity)
@@ -734,11 +903,7 @@ Getting Started:
             self.allocated[i].append(0)
         
         # Recreate kitchen manager with updated resources
-        self.kitchen_manager = KitchenResourceManager(
-            self.available.copy(),
-            [row[:] for row in self.max_resources],
-            [row[:] for row in self.allocated]
-        )
+        self.rebuild_kitchen_manager(equipment_ids=equipment_ids)
         
         self.update_ui()
         self.log_activity(f"Added equipment: {equipment_name} (Quantity: {quantity})")
@@ -754,6 +919,7 @@ Getting Started:
         
         equipment_name = self.equipment_names[selection[0]]
         if messagebox.askyesno("Confirm", f"Remove equipment {equipment_name}?"):
+            equipment_ids = [j for j in range(self.num_equipment) if j != selection[0]]
             self.equipment_names.pop(selection[0])
             self.num_equipment -= 1
             self.available.pop(selection[0])
@@ -761,11 +927,7 @@ Getting Started:
                 self.max_resources[i].pop(selection[0])
                 self.allocated[i].pop(selection[0])
             # Recreate kitchen manager with updated resources
-            self.kitchen_manager = KitchenResourceManager(
-                self.available.copy(),
-                [row[:] for row in self.max_resources],
-                [row[:] for row in self.allocated]
-            )
+            self.rebuild_kitchen_manager(equipment_ids=equipment_ids)
             self.update_ui()
             self.log_activity(f"Removed equipment: {equipment_name}")
     
@@ -794,7 +956,19 @@ Getting Started:
     
     def detect_deadlock(self):
         """Detect if there is a deadlock in the current state."""
-        if self.kitchen_manager.detect_deadlock():
+        diagnosis = self.wait_for_graph.diagnose()
+        if diagnosis["deadlocked"]:
+            deadlocked = ", ".join(self.wait_for_graph.graph.processes[i] for i in diagnosis["deadlocked_staff"])
+            message = (
+                "A deadlock has been detected in the kitchen!\n\n"
+                f"Deadlocked staff: {deadlocked}\n"
+                f"Cycle: {' -> '.join(diagnosis['cycles'][0])}"
+            )
+            if diagnosis["blocked_staff"]:
+                blocked = ", ".join(self.wait_for_graph.graph.processes[i] for i in diagnosis["blocked_staff"])
+                message += f"\nAlso waiting behind them: {blocked}"
+            messagebox.showwarning("Deadlock Detected", message)
+        elif self.kitchen_manager.detect_deadlock():
             messagebox.showwarning(
                 "Deadlock Detected",
                 "A deadlock has been detected in the kitchen!\n\n"
@@ -847,7 +1021,65 @@ Getting Started:
             self.run_fcfs_demo()
         elif algo == "rag":
             self.run_rag_demo()
+        elif algo == "schedulers":
+            self.run_scheduler_comparison()
         self.demo_output.config(state=tk.NORMAL)
+    
+    def import_demo_input(self):
+        """Load the selected demonstration's input from a CSV, JSON or text file and run it."""
+        import tkinter.simpledialog as sd
+        
+        algo = self.algo_var.get()
+        loaders = {
+            "banker": load_banker_input,
+            "fifo": load_reference_string,
+            "fcfs": load_jobs,
+            "rag": load_rag_input,
+        }
+        if algo not in loaders:
+            messagebox.showinfo("Import", "The scheduler comparison generates its own workload.")
+            return
+        file_path = filedialog.askopenfilename(title="Select Input File", filetypes=IMPORT_FILETYPES)
+        if not file_path:
+            return
+        
+        started = time.perf_counter()
+        try:
+            data = loaders[algo](file_path)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            messagebox.showerror("Import Error", f"Could not load {os.path.basename(file_path)}:\n{e}")
+            return
+        elapsed = time.perf_counter() - started
+        
+        self.demo_output.config(state=tk.NORMAL)
+        self.demo_output.delete("1.0", tk.END)
+        if algo == "banker":
+            available, max_matrix, alloc_matrix = data
+            self.show_banker_result(available, max_matrix, alloc_matrix)
+            size = f"{len(max_matrix)} processes x {len(available)} resources"
+        elif algo == "fifo":
+            references, frames = data
+            if frames is None:
+                frames = sd.askinteger("FIFO", "Enter number of frames:", initialvalue=3, minvalue=1)
+                if not frames:
+                    return
+            self.show_fifo_result(frames, references)
+            size = f"{len(references)} page references"
+        elif algo == "fcfs":
+            processes, stations = data
+            if stations is None:
+                stations = sd.askinteger("FCFS", "Enter number of parallel stations:", initialvalue=1, minvalue=1)
+                if not stations:
+                    return
+            self.show_fcfs_result(processes, stations)
+            size = f"{len(processes)} processes"
+        else:
+            self.show_rag_result(
+                data["processes"], data["resources"], data["instances"],
+                data["requests"], data["assignments"]
+            )
+            size = f"{len(data['requests']) + len(data['assignments'])} edges"
+        self.log_activity(f"Imported {size} from {os.path.basename(file_path)} in {elapsed:.2f}s")
 
     def run_banker_demo(self):
         import tkinter.simpledialog as sd
@@ -908,10 +1140,25 @@ Getting Started:
         if not hasattr(dialog, 'n'):
             self.demo_output.insert(tk.END, "Input cancelled or invalid.\n")
             return
-        n, m = dialog.n, dialog.m
-        available = dialog.available
-        max_matrix = dialog.max_matrix
-        alloc_matrix = dialog.alloc_matrix
+        self.show_banker_result(dialog.available, dialog.max_matrix, dialog.alloc_matrix)
+    
+    def show_banker_result(self, available, max_matrix, alloc_matrix):
+        """Run the Banker's safety algorithm on the given state and show each step."""
+        import tkinter as tk
+        n, m = len(max_matrix), len(available)
+        # Large imports are summarized instead of listed step by step
+        if n > DEMO_ROW_LIMIT:
+            manager = KitchenResourceManager(available[:], max_matrix, alloc_matrix)
+            safe, sequence = manager.find_safe_sequence()
+            self.demo_output.insert(tk.END, f"Banker's Algorithm on {n} processes x {m} resource types\n")
+            self.demo_output.insert(tk.END, f"Available:   " + "  ".join(f"{x:>2}" for x in available) + "\n")
+            if safe:
+                shown = '  →  '.join(f"P{idx}" for idx in sequence[:DEMO_ROW_LIMIT])
+                self.demo_output.insert(tk.END, f"\nSystem is in a SAFE state!\nSafe sequence: {shown}")
+                self.demo_output.insert(tk.END, f"  … ({n - DEMO_ROW_LIMIT} more)\n")
+            else:
+                self.demo_output.insert(tk.END, "\nSystem is in an UNSAFE state! Potential deadlock detected.\n")
+            return
         # Compute need matrix
         need_matrix = [[max_matrix[i][j] - alloc_matrix[i][j] for j in range(m)] for i in range(n)]
         # Pretty print matrices
@@ -1007,32 +1254,32 @@ Getting Started:
         except:
             self.demo_output.insert(tk.END, "Invalid page reference string.\n")
             return
-        frame_list = []
-        page_faults = 0
-        steps = []
-        for idx, page in enumerate(ref_str):
-            fault = False
-            if page not in frame_list:
-                page_faults += 1
-                fault = True
-                if len(frame_list) < frames:
-                    frame_list.append(page)
-                else:
-                    frame_list.pop(0)
-                    frame_list.append(page)
-            steps.append((idx+1, page, list(frame_list), fault))
+        self.show_fifo_result(frames, ref_str)
+    
+    def show_fifo_result(self, frames, ref_str):
+        """Run FIFO page replacement over a reference string and show each step."""
+        # Per-reference detail is only recorded for strings short enough to list
+        record_steps = len(ref_str) <= DEMO_ROW_LIMIT
+        result = simulate_replacement(FIFOReplacer(frames), ref_str, record_steps=record_steps)
+        steps = result["steps"]
+        page_faults = result["faults"]
+        frame_list = result["final_frames"]
         # Build output
         out = []
         out.append("FIFO Page Replacement Demonstration\n----------------------------------")
         out.append(f"Number of frames: {frames}")
-        out.append(f"Page reference string: {', '.join(str(x) for x in ref_str)}\n")
-        out.append(f"{'Step':<5}{'Page':<6}{'Frames':<20}{'Fault'}")
-        out.append("-"*40)
-        for step, page, frs, fault in steps:
-            fr_str = ', '.join(str(x) for x in frs)
-            out.append(f"{step:<5}{page:<6}{fr_str:<20}{'Yes' if fault else ''}")
+        if record_steps:
+            out.append(f"Page reference string: {', '.join(str(x) for x in ref_str)}\n")
+            out.append(f"{'Step':<5}{'Page':<6}{'Frames':<20}{'Fault'}")
+            out.append("-"*40)
+            for step, page, frs, fault in steps:
+                fr_str = ', '.join(str(x) for x in frs)
+                out.append(f"{step:<5}{page:<6}{fr_str:<20}{'Yes' if fault else ''}")
+        else:
+            out.append(f"Page references: {len(ref_str)} (steps not listed)")
         out.append("\nSummary:")
         out.append(f"  Total Page Faults: {page_faults}")
+        out.append(f"  Fault Rate: {result['fault_rate'] * 100:.2f}%")
         out.append(f"  Final Frame Contents: {', '.join(str(x) for x in frame_list)}")
         self.demo_output.insert('1.0', '\n'.join(out))
     
@@ -1047,6 +1294,11 @@ Getting Started:
         if not n or n < 1:
             self.demo_output.insert(tk.END, "Invalid number of processes.\n")
             return
+        
+        stations = sd.askinteger("FCFS", "Enter number of parallel stations:", initialvalue=1, minvalue=1)
+        if not stations:
+            self.demo_output.insert(tk.END, "Invalid number of stations.\n")
+            return
             
         # Step 2: Get process details
         processes = []
@@ -1064,28 +1316,19 @@ Getting Started:
                 except:
                     messagebox.showerror("Input Error", "Invalid input. Please enter two positive numbers separated by space.")
         
-        # Sort processes by arrival time
-        processes.sort(key=lambda x: x[1])
-        
-        # Calculate completion times and other metrics
-        completion_times = []
-        current_time = 0
-        for p, arrival, burst in processes:
-            if arrival > current_time:
-                current_time = arrival
-            completion_times.append((p, arrival, burst, current_time, current_time + burst))
-            current_time += burst
-        
-        # Calculate metrics
-        total_tat = 0
-        total_wt = 0
-        metrics = []
-        for p, arrival, burst, start, completion in completion_times:
-            tat = completion - arrival
-            wt = tat - burst
-            total_tat += tat
-            total_wt += wt
-            metrics.append((p, arrival, burst, start, completion, tat, wt))
+        self.show_fcfs_result(processes, stations)
+    
+    def show_fcfs_result(self, processes, stations=1):
+        """Schedule (id, arrival, burst) processes first-come first-served and show the result."""
+        if stations > 1:
+            self.show_multi_station_fcfs(processes, stations)
+            return
+        
+        # Schedule in arrival order
+        scheduler = FCFSScheduler()
+        metrics = list(scheduler.schedule(processes))
+        summary = scheduler.summary()
+        completion_times = [row[:5] for row in metrics]
         
         # Build output
         out = []
@@ -1093,34 +1336,37 @@ Getting Started:
         out.append("\nProcess Details:")
         out.append(f"{'Process':<10}{'Arrival':<10}{'Burst':<10}{'Start':<10}{'Completion':<12}{'TAT':<10}{'WT':<10}")
         out.append("-" * 72)
-        for p, arrival, burst, start, completion, tat, wt in metrics:
+        for p, arrival, burst, start, completion, tat, wt in metrics[:DEMO_ROW_LIMIT]:
             out.append(f"{p:<10}{arrival:<10}{burst:<10}{start:<10}{completion:<12}{tat:<10}{wt:<10}")
+        if len(metrics) > DEMO_ROW_LIMIT:
+            out.append(f"… {len(metrics) - DEMO_ROW_LIMIT} more processes")
         
         # Add summary
         out.append("\nSummary:")
-        out.append(f"Average Turnaround Time: {total_tat/n:.2f} ms")
-        out.append(f"Average Waiting Time: {total_wt/n:.2f} ms")
-        
-        # Create Gantt chart
-        out.append("\nGantt Chart:")
-        gantt_line = "|"
-        time_line = "0"
-        current_pos = 0
-        
-        for p, arrival, burst, start, completion, _, _ in metrics:
-            # Add waiting time if needed
-            if arrival > current_pos:
-                gantt_line += " " * (arrival - current_pos) + "|"
-                time_line += " " * (arrival - current_pos) + str(arrival)
-                current_pos = arrival
+        out.append(f"Average Turnaround Time: {summary['average_turnaround']:.2f} ms")
+        out.append(f"Average Waiting Time: {summary['average_waiting']:.2f} ms")
+        
+        # Text Gantt chart, one character per time unit, for short integer schedules
+        if summary["makespan"] <= DEMO_ROW_LIMIT and all(isinstance(row[4], int) for row in metrics):
+            out.append("\nGantt Chart:")
+            gantt_line = "|"
+            time_line = "0"
+            current_pos = 0
             
-            # Add process execution
-            gantt_line += f"{p:^{burst}}|"
-            time_line += " " * (burst - len(str(completion))) + str(completion)
-            current_pos = completion
-        
-        out.append(gantt_line)
-        out.append(time_line)
+            for p, arrival, burst, start, completion, _, _ in metrics:
+                # Add waiting time if needed
+                if arrival > current_pos:
+                    gantt_line += " " * (arrival - current_pos) + "|"
+                    time_line += " " * (arrival - current_pos) + str(arrival)
+                    current_pos = arrival
+                
+                # Add process execution
+                gantt_line += f"{p:^{burst}}|"
+                time_line += " " * (burst - len(str(completion))) + str(completion)
+                current_pos = completion
+            
+            out.append(gantt_line)
+            out.append(time_line)
         
         # Show the output
         self.demo_output.insert('1.0', '\n'.join(out))
@@ -1128,7 +1374,63 @@ Getting Started:
         # Create visual representation
         self.show_fcfs_visualization(completion_times)
     
-    def show_fcfs_visualization(self, completion_times):
+    def show_multi_station_fcfs(self, processes, stations):
+        """Schedule processes FCFS over several identical stations and show the result."""
+        scheduler = MultiServerFCFSScheduler(stations)
+        metrics = list(scheduler.schedule(processes))
+        summary = scheduler.summary()
+        
+        out = []
+        out.append(f"Multi-Station FCFS Scheduling ({stations} stations)\n----------------------------------------")
+        out.append("\nProcess Details:")
+        out.append(f"{'Process':<10}{'Arrival':<10}{'Burst':<10}{'Station':<10}{'Start':<10}{'Completion':<12}{'TAT':<10}{'WT':<10}")
+        out.append("-" * 82)
+        for p, arrival, burst, station, start, completion, tat, wt in metrics[:DEMO_ROW_LIMIT]:
+            out.append(f"{p:<10}{arrival:<10}{burst:<10}{'S' + str(station + 1):<10}{start:<10}{completion:<12}{tat:<10}{wt:<10}")
+        if len(metrics) > DEMO_ROW_LIMIT:
+            out.append(f"… {len(metrics) - DEMO_ROW_LIMIT} more processes")
+        
+        out.append("\nSummary:")
+        out.append(f"Average Turnaround Time: {summary['average_turnaround']:.2f} ms")
+        out.append(f"Average Waiting Time: {summary['average_waiting']:.2f} ms")
+        out.append(f"Mean Queue Length: {summary['mean_queue_length']:.2f}  (max {summary['max_queue_length']})")
+        out.append("\nStation Utilization:")
+        for station, (jobs, utilization) in enumerate(zip(summary["station_jobs"], summary["station_utilization"])):
+            out.append(f"  S{station + 1}: {jobs} jobs, {utilization * 100:.1f}% busy")
+        
+        self.demo_output.insert('1.0', '\n'.join(out))
+        self.show_fcfs_visualization([
+            (p, arrival, burst, start, completion, station)
+            for p, arrival, burst, station, start, completion, _, _ in metrics
+        ], stations)
+    
+    def run_scheduler_comparison(self):
+        import tkinter.simpledialog as sd
+        import tkinter as tk
+        
+        count = sd.askinteger("Scheduler Comparison", "Number of generated order tickets:",
+                              initialvalue=10000, minvalue=1)
+        if not count:
+            self.demo_output.insert(tk.END, "Invalid number of tickets.\n")
+            return
+        quantum = sd.askinteger("Scheduler Comparison", "Round Robin time quantum:",
+                                initialvalue=4, minvalue=1)
+        if not quantum:
+            self.demo_output.insert(tk.END, "Invalid time quantum.\n")
+            return
+        
+        jobs = generate_jobs(count)
+        results = compare_schedulers(jobs, default_policies(quantum=quantum))
+        
+        out = []
+        out.append("CPU Scheduling Policies on Order Tickets\n----------------------------------------")
+        out.append(f"Tickets: {count}  Round Robin quantum: {quantum}  Priority aging: 0.1/unit\n")
+        out.append(format_scheduler_comparison(results))
+        best = min(results, key=lambda r: r["average_waiting"])
+        out.append(f"\nLowest average waiting time: {best['policy']}")
+        self.demo_output.insert('1.0', '\n'.join(out))
+    
+    def show_fcfs_visualization(self, completion_times, stations=0):
         import tkinter as tk
         from tkinter import ttk
         
@@ -1136,46 +1438,42 @@ Getting Started:
         popup.title("FCFS Scheduling Visualization")
         popup.geometry("800x400")
         
-        # Create canvas for visualization
-        canvas = tk.Canvas(popup, width=700, height=300, bg="white")
-        canvas.pack(pady=20)
-        
-        # Draw timeline
-        canvas.create_line(50, 250, 650, 250, width=2)  # Main timeline
-        for i in range(0, 11):  # Time markers
-            x = 50 + i * 60
-            canvas.create_line(x, 245, x, 255, width=2)
-            canvas.create_text(x, 265, text=str(i))
-        
-        # Draw process bars
-        colors = ["#FF9999", "#99FF99", "#9999FF", "#FFFF99", "#FF99FF"]
-        y = 150
-        bar_height = 30
-        spacing = 40
-        
-        for i, (p, arrival, burst, start, completion) in enumerate(completion_times):
-            # Draw process bar
-            x1 = 50 + start * 60
-            x2 = 50 + completion * 60
-            canvas.create_rectangle(x1, y, x2, y + bar_height, fill=colors[i % len(colors)])
-            canvas.create_text((x1 + x2) / 2, y + bar_height/2, text=p)
-            
-            # Draw arrival time marker
-            if arrival > 0:
-                canvas.create_line(50 + arrival * 60, y - 10, 50 + arrival * 60, y + bar_height + 10, dash=(4, 2))
-            
-            y += spacing
-        
-        # Add legend
-        legend_y = 20
-        for i, (p, _, _, _, _) in enumerate(completion_times):
-            canvas.create_rectangle(50, legend_y, 70, legend_y + 20, fill=colors[i % len(colors)])
-            canvas.create_text(90, legend_y + 10, text=p, anchor="w")
-            legend_y += 30
-        
-        # Add labels
-        canvas.create_text(350, 280, text="Time (ms)")
-        canvas.create_text(20, 150, text="Processes", angle=90)
+        # One row per process, or one per station when several share the work
+        if stations:
+            rows = [f"Station {s + 1}" for s in range(stations)]
+            slices = (
+                (station, start, completion, p, arrival)
+                for p, arrival, _, start, completion, station in completion_times
+            )
+        else:
+            rows = [row[0] for row in completion_times]
+            slices = (
+                (i, start, completion, p, arrival)
+                for i, (p, arrival, _, start, completion) in enumerate(completion_times)
+            )
+        timeline = GanttTimeline.from_slices(rows, slices)
+        
+        controls = ttk.Frame(popup)
+        controls.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(10, 0))
+        ttk.Label(
+            controls,
+            text="Wheel: scroll rows  ·  Shift+wheel or drag: pan  ·  Ctrl+wheel: zoom  ·  Double-click: fit"
+        ).pack(side=tk.LEFT)
+        
+        # Canvas with scrollbars driven by the renderer's virtual viewport
+        frame = ttk.Frame(popup)
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        canvas = tk.Canvas(frame, width=700, height=300, bg="white")
+        renderer = GanttChartRenderer(canvas)
+        renderer.xscrollbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=renderer.xview)
+        renderer.yscrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=renderer.yview)
+        renderer.yscrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        renderer.xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        ttk.Button(controls, text="Fit", command=renderer.fit).pack(side=tk.RIGHT)
+        
+        renderer.bind_navigation()
+        renderer.load(timeline)
     
     def run_rag_demo(self):
         import tkinter.simpledialog as sd
@@ -1241,36 +1539,74 @@ Getting Started:
                 assign_edges.append((r, p))
             except:
                 messagebox.showerror("Input Error", "Invalid assignment edge format or unknown names.")
-        # Step 6: Build adjacency list for cycle detection
-        adj = {name: [] for name in proc_names + res_names}
-        for p, r in req_edges:
-            adj[p].append(r)
-        for r, p in assign_edges:
-            adj[r].append(p)
-        # Step 7: Detect cycles (deadlock)
-        def find_cycle():
-            visited = set()
-            stack = []
-            def dfs(node, path):
-                if node in path:
-                    return path[path.index(node):] + [node]
-                path.append(node)
-                for neighbor in adj[node]:
-                    cycle = dfs(neighbor, path.copy())
-                    if cycle:
-                        return cycle
-                return None
-            for node in adj:
-                cycle = dfs(node, [])
-                if cycle:
-                    return cycle
-            return None
-        cycle = find_cycle()
-        # Step 8: Show improved ASCII art and results
+        self.show_rag_result(proc_names, res_names, instances, req_edges, assign_edges)
+    
+    def show_rag_result(self, proc_names, res_names, instances, req_edges, assign_edges):
+        """Reduce a resource allocation graph and show the graph and any deadlock."""
+        # Step 6: Build the graph, find one cycle per cyclic component and
+        # reduce it over the instance counts: with multi-instance resources
+        # a cycle is only a deadlock if no process can break it
+        graph = ResourceAllocationGraph.from_edges(proc_names, res_names, instances, req_edges, assign_edges)
+        cycles = graph.find_cycles()
+        try:
+            reduction = graph.reduce()
+        except ValueError as e:
+            self.demo_output.insert(tk.END, f"Invalid graph: {e}\n")
+            return
+        # Step 7: Show improved ASCII art and results
         out = []
         out.append("Resource Allocation Graph (RAG)\n-----------------------------")
-        out.append(f"Processes: {' '.join(proc_names)}")
-        out.append(f"Resources: {' '.join(res_names)} (Instances: {' '.join(str(x) for x in instances)})\n")
+        if len(proc_names) + len(res_names) > DEMO_ROW_LIMIT:
+            out.append(f"Processes: {len(proc_names)}")
+            out.append(f"Resources: {len(res_names)} ({sum(instances)} instances)\n")
+        else:
+            out.append(f"Processes: {' '.join(proc_names)}")
+            out.append(f"Resources: {' '.join(res_names)} (Instances: {' '.join(str(x) for x in instances)})\n")
+        if len(req_edges) + len(assign_edges) > DEMO_ROW_LIMIT:
+            # Too large to draw: list the first edges only
+            out.append(f"Request Edges: {len(req_edges)}  Assignment Edges: {len(assign_edges)}")
+            out.append("\nEdges:")
+            for p, r in req_edges[:DEMO_ROW_LIMIT]:
+                out.append(f"  {p}  --request-->  {r}")
+            for r, p in assign_edges[:max(0, DEMO_ROW_LIMIT - len(req_edges))]:
+                out.append(f"  {r}  --assigned-->  {p}")
+            out.append(f"  … {len(req_edges) + len(assign_edges) - DEMO_ROW_LIMIT} more edges")
+        else:
+            self._append_rag_drawing(out, proc_names, res_names, req_edges, assign_edges)
+        if reduction["deadlocked"]:
+            deadlocked = reduction["deadlocked_processes"]
+            blocked = reduction["blocked_processes"]
+            cycles = reduction["cycles"]
+            cycle = cycles[0]
+            out.append("\nDeadlock Detected! Cycle: " + ' -> '.join(cycle))
+            out.append(f"Deadlocked processes ({len(deadlocked)}): " + self._name_list(deadlocked))
+            if blocked:
+                out.append(f"Blocked behind them ({len(blocked)}): " + self._name_list(blocked))
+            if len(cycles) > 1:
+                out.append(f"Other independent cycles ({len(cycles) - 1}):")
+                for other in cycles[1:DEMO_ROW_LIMIT]:
+                    out.append("  " + ' -> '.join(other))
+                if len(cycles) > DEMO_ROW_LIMIT:
+                    out.append(f"  … {len(cycles) - DEMO_ROW_LIMIT} more")
+            out.append("\nResolution Options:\n  - Resource Preemption\n  - Process Termination\n  - Request Reordering")
+        elif cycles:
+            out.append(f"\nNo deadlock detected: {len(cycles)} cycle(s) found, but each has an escape")
+            out.append("through a multi-instance resource. Cycle: " + ' -> '.join(cycles[0]))
+            out.append("Reduction order: " + self._name_list(reduction["sequence"]))
+        else:
+            out.append("\nNo deadlock detected (no cycle found).")
+        self.demo_output.insert('1.0', '\n'.join(out))
+
+    @staticmethod
+    def _name_list(names):
+        """Join names for the demo output, shortening long lists."""
+        if len(names) > DEMO_ROW_LIMIT:
+            return ' '.join(names[:DEMO_ROW_LIMIT]) + f" … {len(names) - DEMO_ROW_LIMIT} more"
+        return ' '.join(names)
+    
+    @staticmethod
+    def _append_rag_drawing(out, proc_names, res_names, req_edges, assign_edges):
+        """Append the edge lists and an ASCII drawing of a small graph to the output lines."""
         out.append("Request Edges:")
         for p, r in req_edges:
             out.append(f"  {p} -> {r}")
@@ -1304,12 +1640,6 @@ Getting Started:
             out.append(f"  {p}  --request-->  {r}")
         for r, p in assign_edges:
             out.append(f"  {r}  --assigned-->  {p}")
-        if cycle:
-            out.append("\nDeadlock Detected! Cycle: " + ' -> '.join(cycle))
-            out.append("\nResolution Options:\n  - Resource Preemption\n  - Process Termination\n  - Request Reordering")
-        else:
-            out.append("\nNo deadlock detected (no cycle found).")
-        self.demo_output.insert('1.0', '\n'.join(out))
     
     def browse_and_load_scenario(self):
         """Open a file dialog to load a scenario from any .json file on the system."""
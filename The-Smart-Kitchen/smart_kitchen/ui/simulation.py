@@ -2,39 +2,60 @@
 Kitchen simulation components for visualizing kitchen workflows and resource utilization
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import time
-import random
 import sys
 import os
 
 # Add parent directory to path to import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from smart_kitchen.core.kitchen_algorithm import KitchenResourceManager
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.simulation_engine import (
+    KitchenSimulationEngine, SIMULATION_MODES, MODE_NORMAL
+)
+from smart_kitchen.core.simulation_trace import ChromeTraceWriter, SimulationTracer
+from smart_kitchen.core.task_policy import TASK_POLICIES, RandomTaskPolicy
+from smart_kitchen.ui.visualization import (
+    KitchenVisualization, KitchenLayoutRenderer, KitchenAggregateRenderer
+)
 from smart_kitchen.data.kitchen_data import (
-    STAFF_TYPES, EQUIPMENT_TYPES, STAFF_ICONS, EQUIPMENT_ICONS,
-    KITCHEN_SCENARIOS, FOOD_TASKS, TASK_EQUIPMENT_NEEDS
+    STAFF_TYPES, EQUIPMENT_TYPES, KITCHEN_SCENARIOS
 )
 
 
 class KitchenSimulation:
     """Simulates kitchen workflows and resource utilization"""
     
+    # Rendering is capped independently of the step rate
+    FRAME_RATE = 30
+    # Milliseconds of engine work per scheduler tick in turbo mode
+    TURBO_BUDGET_MS = 25
+    # Activity rows only refresh when progress crosses a bucket boundary
+    PROGRESS_BUCKET = 10
+    # Beyond this many staff the layout switches to the aggregated LOD view
+    LARGE_KITCHEN_STAFF = 24
+    
     def __init__(self, parent):
         """Initialize the kitchen simulation UI"""
         self.parent = parent
         
         # Initialize simulation variables
         self.running = False
-        self.current_step = 0
         self.scenario = None
-        self.kitchen_manager = None
+        self.engine = None
         self.staff_names = []
         self.equipment_names = []
-        self.staff_tasks = {}
-        self.task_progress = {}
-        self.deadlock_detected = False
+        self.render_pending = False
+        self.checkpoint = None
+        self.step_job = None
+        self.render_job = None
+        
+        # Activity tree rows: one slot per visible staff member
+        self.activity_rows = []
+        self.activity_offset = 0
+        self.activity_virtual = False
+        self.equipment_labels = {}
         
         # Create UI components
         self.create_ui()
@@ -70,32 +91,53 @@ class KitchenSimulation:
         
         # Simulation mode
         ttk.Label(controls_frame, text="Mode:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
-        self.mode_var = tk.StringVar(value="Normal")
+        self.mode_var = tk.StringVar(value=MODE_NORMAL)
         mode_combobox = ttk.Combobox(
             controls_frame,
             textvariable=self.mode_var,
-            values=["Normal(FCFS)", "Deadlock Scenario", "Banker's Method of Prevention"],
+            values=SIMULATION_MODES,
             state="readonly",
             width=20
         )
         mode_combobox.grid(row=0, column=3, padx=5, pady=5, sticky="w")
         
-        # Simulation speed
+        # Task-assignment policy
+        ttk.Label(controls_frame, text="Tasks:").grid(row=1, column=2, padx=5, pady=5, sticky="w")
+        self.policy_var = tk.StringVar(value=RandomTaskPolicy.name)
+        policy_combobox = ttk.Combobox(
+            controls_frame,
+            textvariable=self.policy_var,
+            values=list(TASK_POLICIES.keys()),
+            state="readonly",
+            width=20
+        )
+        policy_combobox.grid(row=1, column=3, padx=5, pady=5, sticky="w")
+        policy_combobox.bind("<<ComboboxSelected>>", lambda _: self.change_task_policy())
+        
+        # Simulation speed (steps per second)
         ttk.Label(controls_frame, text="Speed:").grid(row=0, column=4, padx=5, pady=5, sticky="w")
         self.speed_var = tk.DoubleVar(value=1.0)
         speed_scale = ttk.Scale(
             controls_frame,
             from_=0.5,
-            to=2.0,
+            to=20.0,
             variable=self.speed_var,
             orient=tk.HORIZONTAL,
             length=100
         )
         speed_scale.grid(row=0, column=5, padx=5, pady=5, sticky="w")
         
+        # Turbo mode runs steps unthrottled while rendering stays capped
+        self.turbo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            controls_frame,
+            text="Turbo",
+            variable=self.turbo_var
+        ).grid(row=0, column=6, padx=5, pady=5, sticky="w")
+        
         # Simulation controls
         buttons_frame = ttk.Frame(controls_frame)
-        buttons_frame.grid(row=0, column=6, padx=20, pady=5, sticky="e")
+        buttons_frame.grid(row=0, column=7, padx=20, pady=5, sticky="e")
         
         self.start_button = ttk.Button(buttons_frame, text="Start", command=self.start_simulation)
         self.start_button.pack(side=tk.LEFT, padx=5)
@@ -106,6 +148,13 @@ class KitchenSimulation:
         self.reset_button = ttk.Button(buttons_frame, text="Reset", command=self.reset_simulation)
         self.reset_button.pack(side=tk.LEFT, padx=5)
         
+        ttk.Button(buttons_frame, text="Checkpoint", command=self.save_checkpoint).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Restore", command=self.restore_checkpoint).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Metrics", command=self.show_metrics).pack(side=tk.LEFT, padx=5)
+        
+        self.trace_button = ttk.Button(buttons_frame, text="Trace", command=self.toggle_trace)
+        self.trace_button.pack(side=tk.LEFT, padx=5)
+        
         # Create simulation display
         self.simulation_frame = ttk.Frame(self.parent)
         self.simulation_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -123,6 +172,14 @@ class KitchenSimulation:
         
         self.kitchen_canvas = tk.Canvas(kitchen_frame, bg="white", height=300)
         self.kitchen_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.layout_renderer = KitchenLayoutRenderer(self.kitchen_canvas)
+        self.aggregate_renderer = KitchenAggregateRenderer(self.kitchen_canvas)
+        self.kitchen_renderer = self.layout_renderer
+        
+        # Mouse wheel scrolls the large-kitchen view, Ctrl+wheel zooms it
+        for sequence in ("<MouseWheel>", "<Control-MouseWheel>", "<Button-4>", "<Button-5>",
+                         "<Control-Button-4>", "<Control-Button-5>"):
+            self.kitchen_canvas.bind(sequence, self.on_kitchen_wheel)
         
         # Staff activity display
         activity_frame = ttk.LabelFrame(right_panel, text="Staff Activity")
@@ -149,13 +206,27 @@ class KitchenSimulation:
         self.activity_tree.column("Progress", width=100)
         self.activity_tree.column("Status", width=100)
         
+        # The scrollbar drives the virtual row window, not the tree itself
+        self.activity_scrollbar = ttk.Scrollbar(
+            activity_frame,
+            orient=tk.VERTICAL,
+            command=self.scroll_activity
+        )
+        self.activity_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
         self.activity_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        self.activity_tree.bind(
+            "<MouseWheel>",
+            lambda e: self.scroll_activity("scroll", -1 if e.delta > 0 else 1, "units")
+        )
+        self.activity_tree.bind("<Button-4>", lambda _: self.scroll_activity("scroll", -1, "units"))
+        self.activity_tree.bind("<Button-5>", lambda _: self.scroll_activity("scroll", 1, "units"))
+        
         # Resource utilization
         utilization_frame = ttk.LabelFrame(right_panel, text="Resource Utilization")
         utilization_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.utilization_canvas = tk.Canvas(utilization_frame, bg="white", height=100)
+        self.utilization_canvas = tk.Canvas(utilization_frame, bg="white", height=150)
         self.utilization_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Status information
@@ -192,43 +263,36 @@ class KitchenSimulation:
         self.staff_names = self.scenario["staff"]
         self.equipment_names = self.scenario["equipment"]
         
-        # Set up resources
-        available = self.scenario["available"].copy()
-        max_resources = [row[:] for row in self.scenario["max_needs"]]
-        allocated = [row[:] for row in self.scenario["allocated"]]
-        
-        # Initialize kitchen manager
-        self.kitchen_manager = KitchenResourceManager(
-            available,
-            max_resources,
-            allocated
+        # Initialize the simulation engine
+        self.stop_trace()
+        self.engine = KitchenSimulationEngine(
+            self.scenario,
+            mode=self.mode_var.get(),
+            task_policy=TASK_POLICIES[self.policy_var.get()]()
         )
-        
-        # Initialize staff tasks
-        self.staff_tasks = {}
-        self.task_progress = {}
-        
-        for i, staff in enumerate(self.staff_names):
-            # Assign random tasks from the staff's task list
-            if staff in FOOD_TASKS:
-                task = random.choice(FOOD_TASKS[staff])
-                self.staff_tasks[staff] = task
-                self.task_progress[staff] = 0
+        self.checkpoint = None
         
         # Reset simulation
-        self.current_step = 0
-        self.step_var.set(str(self.current_step))
+        self.step_var.set(str(self.engine.current_step))
         self.status_var.set("Ready")
-        self.deadlock_detected = False
         
         # Update UI
-        self.update_kitchen_display()
-        self.update_activity_display()
-        self.update_utilization_display()
+        if self.engine.compiled.num_staff > self.LARGE_KITCHEN_STAFF:
+            self.kitchen_renderer = self.aggregate_renderer
+        else:
+            self.kitchen_renderer = self.layout_renderer
+        self.kitchen_renderer.load(self.engine.compiled)
+        self.configure_activity_rows()
+        self.render()
+    
+    def change_task_policy(self):
+        """Use the selected task policy for tasks picked from now on"""
+        if self.engine:
+            self.engine.task_policy = TASK_POLICIES[self.policy_var.get()]()
     
     def start_simulation(self):
         """Start the kitchen simulation"""
-        if not self.kitchen_manager:
+        if not self.engine:
             messagebox.showwarning("No Scenario", "Please select a kitchen scenario first.")
             return
             
@@ -238,20 +302,26 @@ class KitchenSimulation:
         
         self.status_var.set("Running")
         
-        # Run the simulation
+        # Run the simulation and the capped render loop side by side
         self.simulate_step()
+        self.render_frame()
     
     def stop_simulation(self):
         """Stop the kitchen simulation"""
         self.running = False
+        self.cancel_jobs()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         
+        # Show the final state even if the last frame was coalesced
+        self.render()
+        
         self.status_var.set("Paused")
     
     def reset_simulation(self):
         """Reset the kitchen simulation to initial state"""
         self.running = False
+        self.cancel_jobs()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         
@@ -260,277 +330,266 @@ class KitchenSimulation:
         
         self.status_var.set("Reset")
     
-    def simulate_step(self):
-        """Simulate a single step in the kitchen workflow"""
-        if not self.running:
+    def save_checkpoint(self):
+        """Capture the current simulation state so it can be restored later"""
+        if not self.engine:
+            return
+        self.checkpoint = self.engine.checkpoint()
+        self.status_var.set(f"Checkpoint saved at step {self.checkpoint.step}")
+    
+    def restore_checkpoint(self):
+        """Return the simulation to the last saved checkpoint"""
+        if not self.checkpoint:
+            messagebox.showinfo("No Checkpoint", "Save a checkpoint first.")
             return
-            
-        # Increment step counter
-        self.current_step += 1
-        self.step_var.set(str(self.current_step))
-        
-        # Check for deadlock if not using Banker's prevention
-        if self.mode_var.get() != "Banker's Prevention":
-            if self.kitchen_manager.detect_deadlock():
-                self.deadlock_detected = True
-                self.status_var.set("Deadlock Detected!")
-                messagebox.showwarning(
-                    "Deadlock Detected",
-                    "A deadlock has occurred in the kitchen!\n\n"
-                    "Some staff members cannot complete their tasks because "
-                    "they're waiting for equipment that won't be released."
-                )
-                self.stop_simulation()
-                return
-        
-        # Process each staff member
-        for staff in self.staff_names:
-            # Skip if no task assigned
-            if staff not in self.staff_tasks:
-                continue
-                
-            current_task = self.staff_tasks[staff]
-            staff_idx = self.staff_names.index(staff)
-            
-            # If task is complete, assign a new one
-            if self.task_progress[staff] >= 100:
-                # Release all equipment
-                for j, equipment in enumerate(self.equipment_names):
-                    if self.kitchen_manager.allocated[staff_idx][j] > 0:
-                        release = [0] * len(self.equipment_names)
-                        release[j] = self.kitchen_manager.allocated[staff_idx][j]
-                        self.kitchen_manager.release_resources(staff_idx, release)
-                
-                # Assign new task
-                if staff in FOOD_TASKS:
-                    new_task = random.choice(FOOD_TASKS[staff])
-                    self.staff_tasks[staff] = new_task
-                    self.task_progress[staff] = 0
-            
-            # Otherwise, progress the current task if equipment is available
-            else:
-                # Check if all needed equipment is allocated
-                needed_equipment = TASK_EQUIPMENT_NEEDS.get(current_task, [])
-                has_all_equipment = True
-                
-                for equipment in needed_equipment:
-                    if equipment in self.equipment_names:
-                        equipment_idx = self.equipment_names.index(equipment)
-                        if self.kitchen_manager.allocated[staff_idx][equipment_idx] == 0:
-                            has_all_equipment = False
-                            break
-                
-                # If staff has all needed equipment, progress the task
-                if has_all_equipment:
-                    # Progress by random amount (5-15%)
-                    progress_increment = random.randint(5, 15)
-                    self.task_progress[staff] = min(100, self.task_progress[staff] + progress_increment)
-                # Otherwise, try to request needed equipment if using Banker's prevention
-                elif self.mode_var.get() == "Banker's Prevention":
-                    for equipment in needed_equipment:
-                        if equipment in self.equipment_names:
-                            equipment_idx = self.equipment_names.index(equipment)
-                            
-                            # Skip if already allocated
-                            if self.kitchen_manager.allocated[staff_idx][equipment_idx] > 0:
-                                continue
-                                
-                            # Request the equipment
-                            request = [0] * len(self.equipment_names)
-                            request[equipment_idx] = 1
-                            
-                            success, _ = self.kitchen_manager.request_resources(staff_idx, request)
-                            # If request granted, update UI and break
-                            if success:
-                                break
-        
-        # Update displays
-        self.update_kitchen_display()
-        self.update_activity_display()
-        self.update_utilization_display()
-        
-        # Schedule next step if still running
         if self.running:
-            delay = int(1000 / self.speed_var.get())  # Adjust delay based on speed
-            self.parent.after(delay, self.simulate_step)
+            self.stop_simulation()
+        
+        self.stop_trace()
+        self.engine.restore(self.checkpoint)
+        self.mode_var.set(self.engine.mode)
+        self.render()
+        self.status_var.set(f"Restored step {self.checkpoint.step}")
     
-    def update_kitchen_display(self):
-        """Update the kitchen layout display"""
-        # Clear canvas
-        self.kitchen_canvas.delete("all")
+    def show_metrics(self):
+        """Show throughput, wait and utilization metrics for the current run"""
+        if not self.engine:
+            return
         
-        # Set dimensions
-        canvas_width = self.kitchen_canvas.winfo_width()
-        canvas_height = self.kitchen_canvas.winfo_height()
+        metrics_window = tk.Toplevel(self.parent)
+        metrics_window.title(f"Simulation Metrics - Step {self.engine.current_step}")
+        metrics_window.geometry("600x450")
         
-        if canvas_width < 50 or canvas_height < 50:  # Canvas not yet properly sized
-            canvas_width = 400
-            canvas_height = 300
+        text = tk.Text(metrics_window, wrap=tk.NONE, font=("Courier", 10), padx=10, pady=10)
+        text.pack(fill=tk.BOTH, expand=True)
+        text.insert(tk.END, self.engine.metrics.format_summary(self.engine.current_step))
+        text.config(state=tk.DISABLED)
+    
+    def toggle_trace(self):
+        """Start streaming a Chrome trace of the simulation, or finish the current one"""
+        if not self.engine:
+            return
+        if self.engine.tracer is not None:
+            path = self.engine.tracer.writer.path
+            self.stop_trace()
+            self.status_var.set(f"Trace saved to {path}")
+            return
         
-        # Draw kitchen background
-        self.kitchen_canvas.create_rectangle(
-            10, 10, canvas_width-10, canvas_height-10,
-            fill="#F5F5F5", outline="#BDBDBD", width=2
+        path = filedialog.asksaveasfilename(
+            title="Save Simulation Trace",
+            defaultextension=".json",
+            filetypes=[("Chrome Trace", "*.json")]
         )
+        if not path:
+            return
+        try:
+            self.engine.attach_tracer(SimulationTracer(ChromeTraceWriter(path)))
+        except OSError as e:
+            messagebox.showerror("Trace", f"Failed to open trace file: {e}")
+            return
+        self.trace_button.config(text="Stop Trace")
+        self.status_var.set(f"Tracing to {path}")
+    
+    def stop_trace(self):
+        """Finish the trace file if the engine is being traced"""
+        if self.engine and self.engine.tracer is not None:
+            self.engine.detach_tracer()
+        self.trace_button.config(text="Trace")
+    
+    def cancel_jobs(self):
+        """Cancel any scheduled step or render callbacks"""
+        for job in (self.step_job, self.render_job):
+            if job is not None:
+                self.parent.after_cancel(job)
+        self.step_job = None
+        self.render_job = None
+    
+    def simulate_step(self):
+        """Advance the engine and schedule the next step, without drawing"""
+        self.step_job = None
+        if not self.running:
+            return
         
-        # Draw kitchen stations
-        equipment_positions = {}
-        y_offset = 40
-        x_step = canvas_width / (len(self.equipment_names) + 1)
+        self.engine.mode = self.mode_var.get()
         
-        for i, equipment in enumerate(self.equipment_names):
-            x_pos = (i + 1) * x_step
-            y_pos = y_offset
-            
-            # Store position for later reference
-            equipment_positions[equipment] = (x_pos, y_pos)
-            
-            # Draw equipment icon
-            icon = EQUIPMENT_ICONS.get(equipment, "🔧")
-            self.kitchen_canvas.create_text(
-                x_pos, y_pos,
-                text=icon,
-                font=("TkDefaultFont", 20)
-            )
-            
-            # Draw equipment name
-            self.kitchen_canvas.create_text(
-                x_pos, y_pos + 25,
-                text=equipment,
-                font=("Helvetica", 8)
-            )
-            
-            # Draw available count
-            available_count = self.kitchen_manager.available[i]
-            self.kitchen_canvas.create_text(
-                x_pos, y_pos + 40,
-                text=f"Available: {available_count}",
-                font=("Helvetica", 8)
-            )
+        if self.turbo_var.get():
+            # Run as many steps as fit in the budget, then yield to Tk
+            deadline = time.perf_counter() + self.TURBO_BUDGET_MS / 1000
+            while self.engine.step():
+                if time.perf_counter() >= deadline:
+                    break
+            delay = 1
+        else:
+            self.engine.step()
+            delay = max(1, int(1000 / self.speed_var.get()))  # Adjust delay based on speed
         
-        # Draw staff members
-        staff_positions = {}
-        y_offset = canvas_height - 60
-        x_step = canvas_width / (len(self.staff_names) + 1)
+        self.render_pending = True
         
-        for i, staff in enumerate(self.staff_names):
-            x_pos = (i + 1) * x_step
-            y_pos = y_offset
-            
-            # Store position for later reference
-            staff_positions[staff] = (x_pos, y_pos)
-            
-            # Draw staff icon
-            icon = STAFF_ICONS.get(staff, "👤")
-            self.kitchen_canvas.create_text(
-                x_pos, y_pos,
-                text=icon,
-                font=("TkDefaultFont", 20)
-            )
-            
-            # Draw staff name
-            self.kitchen_canvas.create_text(
-                x_pos, y_pos + 25,
-                text=staff,
-                font=("Helvetica", 8)
-            )
-            
-            # Draw staff task if assigned
-            if staff in self.staff_tasks:
-                task = self.staff_tasks[staff]
-                progress = self.task_progress[staff]
-                
-                # Draw task and progress
-                self.kitchen_canvas.create_text(
-                    x_pos, y_pos - 20,
-                    text=task,
-                    font=("Helvetica", 8)
-                )
-                
-                # Draw progress bar
-                bar_width = 60
-                self.kitchen_canvas.create_rectangle(
-                    x_pos - bar_width/2, y_pos - 10,
-                    x_pos + bar_width/2, y_pos - 5,
-                    fill="white", outline="black"
-                )
-                
-                progress_width = bar_width * (progress / 100)
-                self.kitchen_canvas.create_rectangle(
-                    x_pos - bar_width/2, y_pos - 10,
-                    x_pos - bar_width/2 + progress_width, y_pos - 5,
-                    fill="#4CAF50", outline=""
-                )
-                
-                # Draw lines to allocated equipment
-                for equipment in TASK_EQUIPMENT_NEEDS.get(task, []):
-                    if equipment in self.equipment_names:
-                        equipment_idx = self.equipment_names.index(equipment)
-                        staff_idx = self.staff_names.index(staff)
-                        
-                        if self.kitchen_manager.allocated[staff_idx][equipment_idx] > 0:
-                            # Draw connection line
-                            if equipment in equipment_positions:
-                                equip_x, equip_y = equipment_positions[equipment]
-                                
-                                self.kitchen_canvas.create_line(
-                                    x_pos, y_pos - 30,
-                                    equip_x, equip_y + 50,
-                                    fill="#673AB7", width=2,
-                                    dash=(4, 2)
-                                )
-        
-        # If deadlock detected, show warning
-        if self.deadlock_detected:
-            self.kitchen_canvas.create_rectangle(
-                canvas_width/2 - 100, canvas_height/2 - 30,
-                canvas_width/2 + 100, canvas_height/2 + 30,
-                fill="#F44336", outline="black", width=2
-            )
-            
-            self.kitchen_canvas.create_text(
-                canvas_width/2, canvas_height/2,
-                text="DEADLOCK DETECTED!",
-                font=("Helvetica", 14, "bold"),
-                fill="white"
-            )
+        if self.engine.deadlock_detected:
+            self.on_deadlock()
+            return
+        
+        # Schedule next step if still running
+        if self.running:
+            self.step_job = self.parent.after(delay, self.simulate_step)
+    
+    def on_deadlock(self):
+        """Stop the simulation and report a detected deadlock"""
+        self.stop_simulation()
+        self.status_var.set("Deadlock Detected!")
+        messagebox.showwarning(
+            "Deadlock Detected",
+            "A deadlock has occurred in the kitchen!\n\n"
+            "Some staff members cannot complete their tasks because "
+            "they're waiting for equipment that won't be released."
+        )
+    
+    def render_frame(self):
+        """Render the latest engine snapshot at a capped frame rate"""
+        self.render_job = None
+        if self.render_pending:
+            self.render()
+        
+        if self.running:
+            self.render_job = self.parent.after(int(1000 / self.FRAME_RATE), self.render_frame)
+    
+    def render(self):
+        """Draw the current engine state, coalescing any steps since the last frame"""
+        self.render_pending = False
+        self.step_var.set(str(self.engine.current_step))
+        recoveries = self.engine.metrics.recoveries
+        if self.running and recoveries:
+            self.status_var.set(f"Running ({recoveries} deadlocks recovered)")
+        self.update_kitchen_display()
+        self.update_activity_display()
+        self.update_utilization_display()
+    
+    def update_kitchen_display(self):
+        """Update the kitchen layout display"""
+        engine = self.engine
+        self.kitchen_renderer.update(
+            engine.kitchen_manager.available,
+            engine.staff_tasks,
+            engine.task_progress,
+            engine.kitchen_manager.held_masks,
+            engine.deadlock_detected,
+            engine.equipment_totals
+        )
+    
+    def on_kitchen_wheel(self, event):
+        """Scroll or zoom the aggregated kitchen view"""
+        if self.kitchen_renderer is not self.aggregate_renderer or not self.engine:
+            return
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        if event.state & 0x4:  # Control held
+            changed = self.aggregate_renderer.zoom_by(1.25 if up else 0.8)
+        else:
+            changed = self.aggregate_renderer.scroll(-3 if up else 3)
+        if changed:
+            self.update_kitchen_display()
+    
+    def configure_activity_rows(self):
+        """Create the activity tree rows for the loaded scenario"""
+        self.activity_tree.delete(*self.activity_tree.get_children())
+        
+        # With more staff than fit, keep a fixed pool of rows and scroll a window
+        num_staff = len(self.staff_names)
+        visible_rows = int(self.activity_tree.cget("height"))
+        self.activity_virtual = num_staff > visible_rows
+        num_rows = visible_rows if self.activity_virtual else num_staff
+        
+        for row in range(num_rows):
+            self.activity_tree.insert("", "end", iid=str(row))
+        
+        self.activity_rows = [None] * num_rows
+        self.activity_offset = 0
+        self.equipment_labels = {}
+        self.update_activity_scrollbar()
+    
+    def update_activity_scrollbar(self):
+        """Sync the scrollbar with the virtual row window"""
+        num_staff = len(self.staff_names)
+        if not self.activity_virtual:
+            self.activity_scrollbar.set(0.0, 1.0)
+            return
+        first = self.activity_offset / num_staff
+        last = (self.activity_offset + len(self.activity_rows)) / num_staff
+        self.activity_scrollbar.set(first, last)
+    
+    def scroll_activity(self, *args):
+        """Move the virtual row window in response to scrollbar or wheel events"""
+        if not self.activity_virtual:
+            return "break"
+        
+        num_staff = len(self.staff_names)
+        num_rows = len(self.activity_rows)
+        
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * num_staff)
+        else:
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= num_rows
+            offset = self.activity_offset + amount
+        offset = max(0, min(num_staff - num_rows, offset))
+        
+        if offset != self.activity_offset:
+            self.activity_offset = offset
+            self.update_activity_scrollbar()
+            self.update_activity_display()
+        return "break"
+    
+    def equipment_label(self, held_mask):
+        """Return the equipment-in-use text for a held mask, memoized per mask"""
+        label = self.equipment_labels.get(held_mask)
+        if label is None:
+            equipment_used = [
+                self.equipment_names[j]
+                for j in self.engine.compiled.indices_of(held_mask)
+            ]
+            label = ", ".join(equipment_used) if equipment_used else "None"
+            self.equipment_labels[held_mask] = label
+        return label
     
     def update_activity_display(self):
-        """Update the staff activity display"""
-        # Clear existing items
-        for item in self.activity_tree.get_children():
-            self.activity_tree.delete(item)
-            
-        # Add current activity for each staff
-        for staff in self.staff_names:
-            staff_idx = self.staff_names.index(staff)
-            
-            # Get current task
-            task = self.staff_tasks.get(staff, "Idle")
-            progress = self.task_progress.get(staff, 0)
-            
-            # Get equipment being used
-            equipment_used = []
-            for j, equipment in enumerate(self.equipment_names):
-                if self.kitchen_manager.allocated[staff_idx][j] > 0:
-                    equipment_used.append(equipment)
-            
-            equipment_str = ", ".join(equipment_used) if equipment_used else "None"
+        """Update the staff activity rows whose visible values changed"""
+        engine = self.engine
+        compiled = engine.compiled
+        held_masks = engine.kitchen_manager.held_masks
+        bucket_size = self.PROGRESS_BUCKET
+        
+        for row in range(len(self.activity_rows)):
+            staff_idx = self.activity_offset + row
+            task_id = engine.staff_tasks[staff_idx]
+            progress = engine.task_progress[staff_idx]
+            held = held_masks[staff_idx]
             
             # Determine status
             status = "Working"
             if progress >= 100:
                 status = "Completed"
-            elif not equipment_used and task != "Idle":
+            elif not held and task_id != CompiledScenario.NO_TASK:
                 status = "Waiting"
-            elif self.deadlock_detected:
+            elif engine.deadlock_detected:
                 status = "Deadlocked"
-                
-            # Add to tree
-            self.activity_tree.insert(
-                "", "end",
-                values=(staff, task, equipment_str, f"{progress}%", status)
-            )
+            
+            key = (staff_idx, task_id, progress // bucket_size, held, status)
+            if key == self.activity_rows[row]:
+                continue
+            self.activity_rows[row] = key
+            
+            if task_id == CompiledScenario.NO_TASK:
+                task = "Idle"
+            else:
+                task = compiled.task_names[task_id]
+            
+            self.activity_tree.item(str(row), values=(
+                self.staff_names[staff_idx],
+                task,
+                self.equipment_label(held),
+                f"{progress // bucket_size * bucket_size}%",
+                status
+            ))
     
     def update_utilization_display(self):
         """Update the resource utilization display"""
@@ -543,7 +602,7 @@ class KitchenSimulation:
         
         if canvas_width < 50 or canvas_height < 50:  # Canvas not yet properly sized
             canvas_width = 400
-            canvas_height = 100
+            canvas_height = 150
         
         # Draw title
         self.utilization_canvas.create_text(
@@ -556,17 +615,15 @@ class KitchenSimulation:
         bar_height = 20
         y_offset = 40
         x_step = canvas_width / (len(self.equipment_names) + 1)
+        engine = self.engine
         
         for i, equipment in enumerate(self.equipment_names):
             x_pos = (i + 1) * x_step
             
             # Calculate utilization percentage
-            total = self.kitchen_manager.available[i]
-            for staff_idx in range(len(self.staff_names)):
-                total += self.kitchen_manager.allocated[staff_idx][i]
-                
+            total = engine.equipment_totals[i]
             if total > 0:
-                utilized = total - self.kitchen_manager.available[i]
+                utilized = total - engine.kitchen_manager.available[i]
                 utilization_pct = (utilized / total) * 100
             else:
                 utilization_pct = 0
@@ -600,4 +657,14 @@ class KitchenSimulation:
                 text=f"{int(utilization_pct)}%",
                 font=("Helvetica", 8),
                 fill="black"
+            )
+            
+            # Draw utilization history below the bar
+            KitchenVisualization.draw_sparkline(
+                self.utilization_canvas,
+                x_pos - bar_width/2, y_offset + bar_height + 10,
+                bar_width, canvas_height - (y_offset + bar_height + 20),
+                engine.utilization.series[i].buckets(bar_width),
+                total,
+                engine.current_step
             ) 
\ No newline at end of file
@@ -11,6 +11,8 @@ import os
 # Add parent directory to path to import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from smart_kitchen.core.compiled_scenario import CompiledScenario
+from smart_kitchen.core.gantt import time_ticks
 from smart_kitchen.data.kitchen_data import STAFF_ICONS, EQUIPMENT_ICONS
 
 
@@ -443,6 +445,47 @@ class KitchenVisualization:
             anchor="w"
         )
     
+    @staticmethod
+    def draw_sparkline(canvas, left, top, width, height, buckets, total, last_step):
+        """
+        Draw a utilization sparkline from downsampled history buckets.
+        
+        The min/max band and the mean line each take one canvas item, and the
+        number of points is bounded by the bucket count, so the cost does not
+        depend on how long the simulation has run.
+        """
+        canvas.create_rectangle(
+            left, top, left + width, top + height,
+            fill="#FAFAFA", outline="#E0E0E0"
+        )
+        if not buckets or total <= 0:
+            return
+        
+        first_step = buckets[0][0]
+        span = max(1, last_step - first_step + 1)
+        bottom = top + height
+        
+        band_top = []
+        band_bottom = []
+        mean_line = []
+        for start_step, in_use_min, in_use_max, in_use_mean, _ in buckets:
+            x = left + (start_step - first_step) / span * width
+            band_top.extend((x, bottom - height * in_use_max / total))
+            band_bottom.extend((x, bottom - height * in_use_min / total))
+            mean_line.extend((x, bottom - height * in_use_mean / total))
+        
+        # Extend the last bucket to the current step
+        band_top.extend((left + width, band_top[-1]))
+        band_bottom.extend((left + width, band_bottom[-1]))
+        mean_line.extend((left + width, mean_line[-1]))
+        
+        # Band is the max edge forward, then the min edge back
+        band = band_top[:]
+        for k in range(len(band_bottom) - 2, -1, -2):
+            band.extend((band_bottom[k], band_bottom[k + 1]))
+        canvas.create_polygon(band, fill="#BBDEFB", outline="")
+        canvas.create_line(mean_line, fill=KitchenVisualization.NEUTRAL_COLOR, width=1)
+    
     @staticmethod
     def create_resource_matrix_detail_window(parent, staff_names, equipment_names, available, max_resources, allocated, need):
         """Create a detailed resource matrix window"""
@@ -738,6 +781,907 @@ class KitchenVisualization:
         ))
 
 
+class KitchenLayoutRenderer:
+    """
+    Retained-mode renderer for the simulation's kitchen layout.
+    
+    Canvas items are created once per scenario load (or canvas resize) and
+    their IDs are kept per staff member and equipment type. Each update
+    compares the new state with the last drawn values and only issues
+    ``coords``/``itemconfig`` calls for what actually changed.
+    """
+    
+    BAR_WIDTH = 60
+    LINK_COLOR = "#673AB7"
+    PROGRESS_COLOR = "#4CAF50"
+    
+    def __init__(self, canvas, default_size=(400, 300)):
+        """Initialize the renderer for the given canvas"""
+        self.canvas = canvas
+        self.default_size = default_size
+        self.compiled = None
+        self.size = None
+        
+        # Item IDs
+        self.available_items = []
+        self.task_items = []
+        self.bar_bg_items = []
+        self.bar_items = []
+        self.link_items = {}
+        self.deadlock_items = ()
+        
+        # Last drawn values
+        self.staff_positions = []
+        self.equipment_positions = []
+        self.drawn_available = []
+        self.drawn_tasks = []
+        self.drawn_progress = []
+        self.drawn_links = []
+        self.drawn_deadlock = False
+    
+    def _canvas_size(self):
+        """Return the usable canvas size, falling back before first layout"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width < 50 or height < 50:  # Canvas not yet properly sized
+            return self.default_size
+        return width, height
+    
+    def load(self, compiled):
+        """Create all canvas items for a newly loaded scenario"""
+        self.compiled = compiled
+        self._build(self._canvas_size())
+    
+    def _build(self, size):
+        """(Re)create every canvas item at the given canvas size"""
+        canvas = self.canvas
+        compiled = self.compiled
+        canvas.delete("all")
+        self.size = size
+        canvas_width, canvas_height = size
+        
+        # Kitchen background
+        canvas.create_rectangle(
+            10, 10, canvas_width-10, canvas_height-10,
+            fill="#F5F5F5", outline="#BDBDBD", width=2
+        )
+        
+        # Equipment stations
+        self.equipment_positions = []
+        self.available_items = []
+        y_pos = 40
+        x_step = canvas_width / (compiled.num_equipment + 1)
+        for j, equipment in enumerate(compiled.equipment_names):
+            x_pos = (j + 1) * x_step
+            self.equipment_positions.append((x_pos, y_pos))
+            canvas.create_text(
+                x_pos, y_pos,
+                text=EQUIPMENT_ICONS.get(equipment, "🔧"),
+                font=("TkDefaultFont", 20)
+            )
+            canvas.create_text(x_pos, y_pos + 25, text=equipment, font=("Helvetica", 8))
+            self.available_items.append(
+                canvas.create_text(x_pos, y_pos + 40, text="", font=("Helvetica", 8))
+            )
+        
+        # Staff members
+        self.staff_positions = []
+        self.task_items = []
+        self.bar_bg_items = []
+        self.bar_items = []
+        y_pos = canvas_height - 60
+        x_step = canvas_width / (compiled.num_staff + 1)
+        half_bar = self.BAR_WIDTH / 2
+        for i, staff in enumerate(compiled.staff_names):
+            x_pos = (i + 1) * x_step
+            self.staff_positions.append((x_pos, y_pos))
+            canvas.create_text(
+                x_pos, y_pos,
+                text=STAFF_ICONS.get(staff, "👤"),
+                font=("TkDefaultFont", 20)
+            )
+            canvas.create_text(x_pos, y_pos + 25, text=staff, font=("Helvetica", 8))
+            self.task_items.append(
+                canvas.create_text(x_pos, y_pos - 20, text="", font=("Helvetica", 8), state="hidden")
+            )
+            self.bar_bg_items.append(canvas.create_rectangle(
+                x_pos - half_bar, y_pos - 10,
+                x_pos + half_bar, y_pos - 5,
+                fill="white", outline="black", state="hidden"
+            ))
+            self.bar_items.append(canvas.create_rectangle(
+                x_pos - half_bar, y_pos - 10,
+                x_pos - half_bar, y_pos - 5,
+                fill=self.PROGRESS_COLOR, outline="", state="hidden"
+            ))
+        
+        # Links are created lazily the first time a staff/equipment pair is shown
+        self.link_items = {}
+        
+        # Deadlock banner, hidden until needed
+        self.deadlock_items = (
+            canvas.create_rectangle(
+                canvas_width/2 - 100, canvas_height/2 - 30,
+                canvas_width/2 + 100, canvas_height/2 + 30,
+                fill=KitchenVisualization.UNSAFE_COLOR, outline="black", width=2, state="hidden"
+            ),
+            canvas.create_text(
+                canvas_width/2, canvas_height/2,
+                text="DEADLOCK DETECTED!",
+                font=("Helvetica", 14, "bold"),
+                fill="white", state="hidden"
+            ),
+        )
+        
+        # Forget drawn values so the next update writes everything once
+        self.drawn_available = [None] * compiled.num_equipment
+        self.drawn_tasks = [None] * compiled.num_staff
+        self.drawn_progress = [None] * compiled.num_staff
+        self.drawn_links = [0] * compiled.num_staff
+        self.drawn_deadlock = False
+    
+    def _link_item(self, staff_idx, equipment_idx):
+        """Return the line item joining a staff member to an equipment station"""
+        key = (staff_idx, equipment_idx)
+        item = self.link_items.get(key)
+        if item is None:
+            x_pos, y_pos = self.staff_positions[staff_idx]
+            equip_x, equip_y = self.equipment_positions[equipment_idx]
+            item = self.canvas.create_line(
+                x_pos, y_pos - 30,
+                equip_x, equip_y + 50,
+                fill=self.LINK_COLOR, width=2,
+                dash=(4, 2), state="hidden"
+            )
+            self.link_items[key] = item
+        return item
+    
+    def update(self, available, staff_tasks, task_progress, held_masks, deadlock_detected,
+               equipment_totals=None):
+        """
+        Bring the canvas in line with the given simulation state.
+        
+        Only items whose underlying value changed since the previous call are
+        touched, so the cost scales with the number of changes.
+        ``equipment_totals`` is not drawn here; it is accepted so this
+        renderer and KitchenAggregateRenderer can be used interchangeably.
+        
+        Returns:
+            int: Number of canvas items updated
+        """
+        if self.compiled is None:
+            return 0
+        
+        size = self._canvas_size()
+        if size != self.size:
+            self._build(size)
+        
+        canvas = self.canvas
+        compiled = self.compiled
+        changes = 0
+        
+        for j, count in enumerate(available):
+            if self.drawn_available[j] != count:
+                canvas.itemconfigure(self.available_items[j], text=f"Available: {count}")
+                self.drawn_available[j] = count
+                changes += 1
+        
+        for i in range(compiled.num_staff):
+            task_id = staff_tasks[i]
+            
+            if self.drawn_tasks[i] != task_id:
+                if task_id == CompiledScenario.NO_TASK:
+                    canvas.itemconfigure(self.task_items[i], state="hidden")
+                    canvas.itemconfigure(self.bar_bg_items[i], state="hidden")
+                    canvas.itemconfigure(self.bar_items[i], state="hidden")
+                else:
+                    canvas.itemconfigure(
+                        self.task_items[i], text=compiled.task_names[task_id], state="normal"
+                    )
+                    canvas.itemconfigure(self.bar_bg_items[i], state="normal")
+                    canvas.itemconfigure(self.bar_items[i], state="normal")
+                self.drawn_tasks[i] = task_id
+                changes += 1
+            
+            if task_id == CompiledScenario.NO_TASK:
+                links = 0
+            else:
+                progress = task_progress[i]
+                if self.drawn_progress[i] != progress:
+                    x_pos, y_pos = self.staff_positions[i]
+                    left = x_pos - self.BAR_WIDTH / 2
+                    canvas.coords(
+                        self.bar_items[i],
+                        left, y_pos - 10,
+                        left + self.BAR_WIDTH * (progress / 100), y_pos - 5
+                    )
+                    self.drawn_progress[i] = progress
+                    changes += 1
+                links = compiled.task_need_masks[task_id] & held_masks[i]
+            
+            # Toggle only the links whose bit flipped
+            flipped = links ^ self.drawn_links[i]
+            if flipped:
+                for j in compiled.indices_of(flipped):
+                    state = "normal" if links >> j & 1 else "hidden"
+                    canvas.itemconfigure(self._link_item(i, j), state=state)
+                    changes += 1
+                self.drawn_links[i] = links
+        
+        if deadlock_detected != self.drawn_deadlock:
+            state = "normal" if deadlock_detected else "hidden"
+            for item in self.deadlock_items:
+                canvas.itemconfigure(item, state=state)
+                canvas.tag_raise(item)
+            self.drawn_deadlock = deadlock_detected
+            changes += 1
+        
+        return changes
+
+
+class KitchenAggregateRenderer:
+    """
+    Level-of-detail renderer for kitchens with many staff.
+    
+    Zoomed out, staff are drawn as one box per role with head counts and
+    average progress, and equipment stations are heat-coloured by the share
+    of units in use. From DETAIL_ZOOM upwards individual staff cells are
+    drawn, but only for the rows inside the viewport: a fixed pool of canvas
+    items is reassigned to staff as the view scrolls, so the number of items
+    depends on the canvas size rather than on the number of staff.
+    """
+    
+    MIN_ZOOM = 1.0
+    MAX_ZOOM = 8.0
+    DETAIL_ZOOM = 2.0
+    CELL_SIZE = 12          # Staff cell edge in pixels at zoom 1.0
+    LABEL_MIN_CELL = 32     # Smallest cell that still gets a text label
+    EQUIPMENT_HEIGHT = 70
+    GROUP_WIDTH = 160
+    GROUP_HEIGHT = 80
+    IDLE_COLOR = "#BDBDBD"
+    WAITING_COLOR = "#FF9800"
+    
+    # Staff cell states
+    IDLE, WORKING, WAITING = range(3)
+    
+    def __init__(self, canvas, default_size=(400, 300)):
+        """Initialize the renderer for the given canvas"""
+        self.canvas = canvas
+        self.default_size = default_size
+        self.compiled = None
+        self.size = None
+        self.zoom = self.MIN_ZOOM
+        self.first_row = 0
+        
+        # Role groups: (role, staff indices) and the group of each staff member
+        self.groups = []
+        self.staff_group = []
+        
+        # Item IDs
+        self.equipment_items = []
+        self.group_items = []
+        self.cell_items = []
+        self.hint_item = None
+        self.deadlock_items = ()
+        
+        # Last drawn values
+        self.drawn_equipment = []
+        self.drawn_groups = []
+        self.drawn_cells = []
+        self.drawn_hint = None
+        self.drawn_deadlock = False
+    
+    @property
+    def detail(self):
+        """True when individual staff cells are drawn"""
+        return self.zoom >= self.DETAIL_ZOOM
+    
+    @staticmethod
+    def heat_color(fraction):
+        """Map a utilization fraction to a green-yellow-red colour"""
+        fraction = min(1.0, max(0.0, fraction))
+        if fraction < 0.5:
+            red, green = int(510 * fraction), 200
+        else:
+            red, green = 255, int(200 * (2 - 2 * fraction))
+        return f"#{red:02x}{green:02x}50"
+    
+    def _canvas_size(self):
+        """Return the usable canvas size, falling back before first layout"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width < 50 or height < 50:  # Canvas not yet properly sized
+            return self.default_size
+        return width, height
+    
+    def load(self, compiled):
+        """Group the staff of a newly loaded scenario by role and draw the overview"""
+        self.compiled = compiled
+        group_index = {}
+        self.groups = []
+        self.staff_group = []
+        for i, role in enumerate(compiled.staff_names):
+            g = group_index.get(role)
+            if g is None:
+                g = group_index[role] = len(self.groups)
+                self.groups.append((role, []))
+            self.groups[g][1].append(i)
+            self.staff_group.append(g)
+        
+        self.zoom = self.MIN_ZOOM
+        self.first_row = 0
+        self._build(self._canvas_size())
+    
+    def _grid_shape(self, size=None):
+        """Return (cell size, columns, visible rows) of the detail grid"""
+        width, height = size or self.size
+        cell = self.CELL_SIZE * self.zoom
+        columns = max(1, int((width - 20) // cell))
+        rows = max(1, int((height - self.EQUIPMENT_HEIGHT - 50) // cell))
+        return cell, columns, rows
+    
+    def _max_first_row(self):
+        """Return the last row the viewport may start at"""
+        _, columns, rows = self._grid_shape()
+        total_rows = -(-self.compiled.num_staff // columns)
+        return max(0, total_rows - rows)
+    
+    def set_zoom(self, zoom):
+        """
+        Change the zoom level, keeping the first visible staff member in view.
+        
+        Returns:
+            bool: True if the zoom level changed
+        """
+        zoom = min(self.MAX_ZOOM, max(self.MIN_ZOOM, zoom))
+        if self.compiled is None or zoom == self.zoom:
+            return False
+        _, columns, _ = self._grid_shape()
+        first_staff = self.first_row * columns if self.detail else 0
+        self.zoom = zoom
+        _, columns, _ = self._grid_shape()
+        self.first_row = min(first_staff // columns, self._max_first_row())
+        self._build(self.size)
+        return True
+    
+    def zoom_by(self, factor):
+        """Multiply the zoom level by ``factor``"""
+        return self.set_zoom(self.zoom * factor)
+    
+    def scroll(self, rows):
+        """
+        Move the detail viewport by ``rows`` rows of staff cells.
+        
+        Returns:
+            bool: True if the viewport moved
+        """
+        if self.compiled is None or not self.detail:
+            return False
+        first_row = min(self._max_first_row(), max(0, self.first_row + rows))
+        if first_row == self.first_row:
+            return False
+        self.first_row = first_row
+        return True
+    
+    def _build(self, size):
+        """(Re)create the canvas items for the current size and zoom level"""
+        canvas = self.canvas
+        compiled = self.compiled
+        canvas.delete("all")
+        self.size = size
+        canvas_width, canvas_height = size
+        
+        # Kitchen background
+        canvas.create_rectangle(
+            10, 10, canvas_width-10, canvas_height-10,
+            fill="#F5F5F5", outline="#BDBDBD", width=2
+        )
+        
+        # Equipment strip, one heat-coloured station per equipment type
+        self.equipment_items = []
+        x_step = (canvas_width - 20) / max(1, compiled.num_equipment)
+        box_width = min(90, x_step - 6)
+        for j, equipment in enumerate(compiled.equipment_names):
+            x_pos = 10 + (j + 0.5) * x_step
+            box = canvas.create_rectangle(
+                x_pos - box_width / 2, 18, x_pos + box_width / 2, self.EQUIPMENT_HEIGHT,
+                fill=self.heat_color(0), outline="#757575"
+            )
+            canvas.create_text(x_pos, 30, text=equipment, font=("Helvetica", 8), width=box_width)
+            count = canvas.create_text(x_pos, 52, text="", font=("Helvetica", 9, "bold"))
+            self.equipment_items.append((box, count))
+        
+        staff_top = self.EQUIPMENT_HEIGHT + 15
+        self.group_items = []
+        self.cell_items = []
+        if self.detail:
+            # Pool of cells covering the viewport
+            cell, columns, rows = self._grid_shape(size)
+            show_labels = cell >= self.LABEL_MIN_CELL
+            for slot in range(columns * rows):
+                left = 10 + (slot % columns) * cell
+                top = staff_top + (slot // columns) * cell
+                rect = canvas.create_rectangle(
+                    left + 1, top + 1, left + cell - 1, top + cell - 1,
+                    fill=self.IDLE_COLOR, outline="white", state="hidden"
+                )
+                bar = canvas.create_rectangle(
+                    left + 2, top + cell - 4, left + 2, top + cell - 2,
+                    fill="#1B5E20", outline="", state="hidden"
+                )
+                label = None
+                if show_labels:
+                    label = canvas.create_text(
+                        left + cell / 2, top + cell / 2 - 2,
+                        text="", font=("Helvetica", 7), state="hidden"
+                    )
+                self.cell_items.append((rect, bar, label, left, top, cell))
+        else:
+            # One summary box per role
+            columns = max(1, min(len(self.groups), int((canvas_width - 20) // self.GROUP_WIDTH)))
+            box_width = (canvas_width - 20) / columns
+            for g, (role, members) in enumerate(self.groups):
+                left = 10 + (g % columns) * box_width + 5
+                top = staff_top + (g // columns) * (self.GROUP_HEIGHT + 5)
+                right = left + box_width - 10
+                canvas.create_rectangle(left, top, right, top + self.GROUP_HEIGHT,
+                                        fill="white", outline="#9E9E9E")
+                canvas.create_text(left + 20, top + 22, text=STAFF_ICONS.get(role, "👤"),
+                                   font=("TkDefaultFont", 18))
+                canvas.create_text(left + 40, top + 14, text=f"{role} ×{len(members)}",
+                                   font=("Helvetica", 9, "bold"), anchor="w")
+                stats = canvas.create_text(left + 40, top + 32, text="",
+                                           font=("Helvetica", 8), anchor="w")
+                canvas.create_rectangle(left + 8, top + 52, right - 8, top + 60,
+                                        fill="white", outline="black")
+                bar = canvas.create_rectangle(left + 8, top + 52, left + 8, top + 60,
+                                              fill=KitchenLayoutRenderer.PROGRESS_COLOR, outline="")
+                self.group_items.append((stats, bar, left + 8, right - 8, top))
+        
+        self.hint_item = canvas.create_text(
+            canvas_width - 16, canvas_height - 16, text="",
+            font=("Helvetica", 8), fill="#616161", anchor="e"
+        )
+        
+        # Deadlock banner, hidden until needed
+        self.deadlock_items = (
+            canvas.create_rectangle(
+                canvas_width/2 - 100, canvas_height/2 - 30,
+                canvas_width/2 + 100, canvas_height/2 + 30,
+                fill=KitchenVisualization.UNSAFE_COLOR, outline="black", width=2, state="hidden"
+            ),
+            canvas.create_text(
+                canvas_width/2, canvas_height/2,
+                text="DEADLOCK DETECTED!",
+                font=("Helvetica", 14, "bold"),
+                fill="white", state="hidden"
+            ),
+        )
+        
+        # Forget drawn values so the next update writes everything once
+        self.drawn_equipment = [None] * compiled.num_equipment
+        self.drawn_groups = [None] * len(self.group_items)
+        self.drawn_cells = [None] * len(self.cell_items)
+        self.drawn_hint = None
+        self.drawn_deadlock = False
+    
+    def _staff_state(self, staff_idx, staff_tasks, held_masks):
+        """Classify a staff member as idle, working or waiting for equipment"""
+        task_id = staff_tasks[staff_idx]
+        if task_id == CompiledScenario.NO_TASK:
+            return self.IDLE
+        if self.compiled.task_need_masks[task_id] & ~held_masks[staff_idx]:
+            return self.WAITING
+        return self.WORKING
+    
+    def update(self, available, staff_tasks, task_progress, held_masks, deadlock_detected,
+               equipment_totals=None):
+        """
+        Bring the canvas in line with the given simulation state.
+        
+        Zoomed out this is one pass over the staff to aggregate the role
+        groups; zoomed in only the staff inside the viewport are visited.
+        Canvas items are only touched when their drawn value changed.
+        
+        Returns:
+            int: Number of canvas items updated
+        """
+        if self.compiled is None:
+            return 0
+        
+        size = self._canvas_size()
+        if size != self.size:
+            self._build(size)
+            self.first_row = min(self.first_row, self._max_first_row())
+        
+        canvas = self.canvas
+        compiled = self.compiled
+        num_staff = compiled.num_staff
+        changes = 0
+        
+        for j, free in enumerate(available):
+            total = equipment_totals[j] if equipment_totals else free
+            key = (free, total)
+            if self.drawn_equipment[j] != key:
+                in_use = total - free
+                box, count = self.equipment_items[j]
+                canvas.itemconfigure(box, fill=self.heat_color(in_use / total if total else 0))
+                canvas.itemconfigure(count, text=f"{in_use}/{total}")
+                self.drawn_equipment[j] = key
+                changes += 1
+        
+        if self.detail:
+            _, columns, _ = self._grid_shape()
+            first = self.first_row * columns
+            for slot, (rect, bar, label, left, top, cell) in enumerate(self.cell_items):
+                i = first + slot
+                if i >= num_staff:
+                    key = None
+                else:
+                    state = self._staff_state(i, staff_tasks, held_masks)
+                    key = (i, state, task_progress[i] if state != self.IDLE else 0)
+                if self.drawn_cells[slot] == key:
+                    continue
+                if key is None:
+                    for item in (rect, bar, label):
+                        if item is not None:
+                            canvas.itemconfigure(item, state="hidden")
+                else:
+                    _, state, progress = key
+                    fill = (self.IDLE_COLOR, KitchenLayoutRenderer.PROGRESS_COLOR,
+                            self.WAITING_COLOR)[state]
+                    canvas.itemconfigure(rect, fill=fill, state="normal")
+                    canvas.coords(bar, left + 2, top + cell - 4,
+                                  left + 2 + (cell - 4) * progress / 100, top + cell - 2)
+                    canvas.itemconfigure(bar, state="normal")
+                    if label is not None:
+                        canvas.itemconfigure(label, text=f"{compiled.staff_names[i][:2]}{i + 1}",
+                                             state="normal")
+                self.drawn_cells[slot] = key
+                changes += 1
+            last = min(num_staff, first + len(self.cell_items))
+            hint = f"Staff {first + 1}-{last} of {num_staff}  ·  zoom {self.zoom:.1f}x"
+        else:
+            active = [0] * len(self.groups)
+            waiting = [0] * len(self.groups)
+            progress_sum = [0] * len(self.groups)
+            need_masks = compiled.task_need_masks
+            staff_group = self.staff_group
+            for i in range(num_staff):
+                task_id = staff_tasks[i]
+                if task_id == CompiledScenario.NO_TASK:
+                    continue
+                g = staff_group[i]
+                active[g] += 1
+                progress_sum[g] += task_progress[i]
+                if need_masks[task_id] & ~held_masks[i]:
+                    waiting[g] += 1
+            
+            for g, (stats, bar, left, right, top) in enumerate(self.group_items):
+                average = progress_sum[g] // active[g] if active[g] else 0
+                key = (active[g], waiting[g], average)
+                if self.drawn_groups[g] == key:
+                    continue
+                canvas.itemconfigure(stats, text=f"{active[g]} active · {waiting[g]} waiting · {average}% avg")
+                canvas.coords(bar, left, top + 52, left + (right - left) * average / 100, top + 60)
+                self.drawn_groups[g] = key
+                changes += 1
+            hint = f"{num_staff} staff in {len(self.groups)} roles  ·  Ctrl+wheel to zoom in"
+        
+        if hint != self.drawn_hint:
+            canvas.itemconfigure(self.hint_item, text=hint)
+            self.drawn_hint = hint
+            changes += 1
+        
+        if deadlock_detected != self.drawn_deadlock:
+            state = "normal" if deadlock_detected else "hidden"
+            for item in self.deadlock_items:
+                canvas.itemconfigure(item, state=state)
+                canvas.tag_raise(item)
+            self.drawn_deadlock = deadlock_detected
+            changes += 1
+        
+        return changes
+
+
+class GanttChartRenderer:
+    """
+    Zoomable, scrollable Gantt chart for schedules of any size.
+    
+    The chart starts fitted to the canvas width with tick spacing chosen
+    from the 1-2-5 series. Only the rows inside the viewport are drawn, and
+    within a row only the slices inside the visible time window; runs of
+    slices narrower than MIN_SEGMENT pixels are merged into one block, so a
+    redraw creates at most a few items per pixel column whatever the number
+    of jobs.
+    """
+    
+    MAX_SCALE = 200.0       # Pixels per time unit at full zoom
+    MIN_SEGMENT = 2.0       # Narrowest slice in pixels drawn on its own
+    LABEL_WIDTH = 90
+    AXIS_HEIGHT = 40
+    ROW_HEIGHT = 26
+    BAR_HEIGHT = 18
+    MERGED_COLOR = "#78909C"
+    PALETTE = ["#FF9999", "#99FF99", "#9999FF", "#FFFF99", "#FF99FF",
+               "#99FFFF", "#FFCC80", "#CE93D8", "#A5D6A7", "#90CAF9"]
+    
+    def __init__(self, canvas, default_size=(700, 300)):
+        """Initialize the renderer for the given canvas"""
+        self.canvas = canvas
+        self.default_size = default_size
+        self.timeline = None
+        self.size = default_size
+        self.scale = 1.0
+        self.view_start = 0
+        self.first_row = 0
+        self.drag_x = None
+        
+        # Optional ttk.Scrollbar widgets kept in line with the viewport
+        self.xscrollbar = None
+        self.yscrollbar = None
+    
+    def _canvas_size(self):
+        """Return the usable canvas size, falling back before first layout"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width < 50 or height < 50:  # Canvas not yet properly sized
+            return self.default_size
+        return width, height
+    
+    def _plot_width(self):
+        return max(1, self.size[0] - self.LABEL_WIDTH - 15)
+    
+    def _visible_rows(self):
+        return max(1, int((self.size[1] - self.AXIS_HEIGHT - 10) // self.ROW_HEIGHT))
+    
+    def _span(self):
+        return max(self.timeline.end - self.timeline.start, 1e-9)
+    
+    def _fit_scale(self):
+        """Return the scale at which the whole schedule fits the plot width"""
+        return self._plot_width() / self._span()
+    
+    def load(self, timeline):
+        """Show a GanttTimeline, fitted to the canvas width"""
+        self.timeline = timeline
+        self.size = self._canvas_size()
+        self.first_row = 0
+        self.fit()
+    
+    def fit(self):
+        """Zoom out to show the whole schedule"""
+        if self.timeline is None:
+            return 0
+        self.scale = self._fit_scale()
+        self.view_start = self.timeline.start
+        return self.redraw()
+    
+    def _clamp_view(self):
+        """Keep the time window and first row inside the schedule"""
+        latest = self.timeline.end - self._plot_width() / self.scale
+        self.view_start = max(self.timeline.start, min(self.view_start, latest))
+        last_row = max(0, len(self.timeline.rows) - self._visible_rows())
+        self.first_row = max(0, min(self.first_row, last_row))
+    
+    def set_scale(self, scale, anchor_x=None):
+        """
+        Change the zoom level, keeping the time under ``anchor_x`` in place.
+        
+        Args:
+            scale: Pixels per time unit
+            anchor_x: Canvas x coordinate to zoom around (default: plot centre)
+        
+        Returns:
+            bool: True if the zoom level changed
+        """
+        if self.timeline is None:
+            return False
+        low = self._fit_scale()
+        scale = min(max(low, self.MAX_SCALE), max(low, scale))
+        if scale == self.scale:
+            return False
+        if anchor_x is None:
+            anchor_x = self.LABEL_WIDTH + self._plot_width() / 2
+        offset = min(max(0, anchor_x - self.LABEL_WIDTH), self._plot_width())
+        anchor_time = self.view_start + offset / self.scale
+        self.scale = scale
+        self.view_start = anchor_time - offset / scale
+        self.redraw()
+        return True
+    
+    def zoom_by(self, factor, anchor_x=None):
+        """Multiply the zoom level by ``factor``"""
+        return self.set_scale(self.scale * factor, anchor_x)
+    
+    def pan(self, pixels):
+        """
+        Move the time window right by ``pixels`` (left if negative).
+        
+        Returns:
+            bool: True if the viewport moved
+        """
+        if self.timeline is None:
+            return False
+        view_start = self.view_start
+        self.view_start += pixels / self.scale
+        self._clamp_view()
+        if self.view_start == view_start:
+            return False
+        self.redraw()
+        return True
+    
+    def scroll(self, rows):
+        """
+        Move the viewport down by ``rows`` rows (up if negative).
+        
+        Returns:
+            bool: True if the viewport moved
+        """
+        if self.timeline is None:
+            return False
+        first_row = self.first_row
+        self.first_row += rows
+        self._clamp_view()
+        if self.first_row == first_row:
+            return False
+        self.redraw()
+        return True
+    
+    def xview(self, *args):
+        """Scrollbar command for the time axis"""
+        if self.timeline is None:
+            return "break"
+        if args[0] == "moveto":
+            self.view_start = self.timeline.start + float(args[1]) * self._span()
+            self._clamp_view()
+            self.redraw()
+        else:
+            amount = int(args[1]) * (self._plot_width() if args[2] == "pages" else 40)
+            self.pan(amount)
+        return "break"
+    
+    def yview(self, *args):
+        """Scrollbar command for the rows"""
+        if self.timeline is None:
+            return "break"
+        if args[0] == "moveto":
+            self.first_row = int(float(args[1]) * len(self.timeline.rows))
+            self._clamp_view()
+            self.redraw()
+        else:
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._visible_rows()
+            self.scroll(amount)
+        return "break"
+    
+    def bind_navigation(self):
+        """
+        Bind mouse navigation on the canvas.
+        
+        The wheel scrolls rows, Shift+wheel pans the time axis, Ctrl+wheel
+        zooms around the pointer, dragging pans and double-click fits the
+        whole schedule again.
+        """
+        canvas = self.canvas
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(sequence, self.on_wheel)
+        canvas.bind("<ButtonPress-1>", self.on_press)
+        canvas.bind("<B1-Motion>", self.on_drag)
+        canvas.bind("<Double-Button-1>", lambda _: self.fit())
+        canvas.bind("<Configure>", lambda _: self.redraw())
+    
+    def on_wheel(self, event):
+        """Scroll, pan or zoom in response to the mouse wheel"""
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        if event.state & 0x4:  # Control held
+            self.zoom_by(1.25 if up else 0.8, event.x)
+        elif event.state & 0x1:  # Shift held
+            self.pan(-60 if up else 60)
+        else:
+            self.scroll(-3 if up else 3)
+        return "break"
+    
+    def on_press(self, event):
+        self.drag_x = event.x
+    
+    def on_drag(self, event):
+        if self.drag_x is not None:
+            self.pan(self.drag_x - event.x)
+            self.drag_x = event.x
+    
+    def redraw(self):
+        """
+        Draw the visible part of the chart.
+        
+        Returns:
+            int: Number of segments drawn
+        """
+        if self.timeline is None:
+            return 0
+        canvas = self.canvas
+        size = self._canvas_size()
+        if size != self.size:
+            fitted = self.scale <= self._fit_scale()
+            self.size = size
+            if fitted:
+                self.scale = self._fit_scale()
+        self.scale = max(self.scale, self._fit_scale())
+        self._clamp_view()
+        canvas.delete("all")
+        
+        timeline = self.timeline
+        width, height = self.size
+        left = self.LABEL_WIDTH
+        right = left + self._plot_width()
+        axis_y = height - self.AXIS_HEIGHT
+        scale = self.scale
+        view_start = self.view_start
+        view_end = view_start + self._plot_width() / scale
+        
+        # Time axis with grid lines at 1-2-5 tick spacing
+        step, ticks = time_ticks(view_start, view_end, scale)
+        canvas.create_line(left, axis_y, right, axis_y, width=2)
+        for t in ticks:
+            x = left + (t - view_start) * scale
+            canvas.create_line(x, 10, x, axis_y, fill="#EEEEEE")
+            canvas.create_line(x, axis_y - 4, x, axis_y + 4, width=2)
+            canvas.create_text(x, axis_y + 12, text=f"{t:g}", font=("Helvetica", 8))
+        
+        # Visible rows only
+        drawn = 0
+        merged_slices = 0
+        first = self.first_row
+        last = min(len(timeline.rows), first + self._visible_rows())
+        bar_pad = (self.ROW_HEIGHT - self.BAR_HEIGHT) / 2
+        for slot, row in enumerate(range(first, last)):
+            top = 10 + slot * self.ROW_HEIGHT + bar_pad
+            bottom = top + self.BAR_HEIGHT
+            canvas.create_text(left - 8, (top + bottom) / 2, text=str(timeline.rows[row]),
+                               anchor="e", font=("Helvetica", 9))
+            for start, end, slice_id, count in timeline.visible(
+                row, view_start, view_end, scale, self.MIN_SEGMENT
+            ):
+                x1 = left + (max(start, view_start) - view_start) * scale
+                x2 = left + (min(end, view_end) - view_start) * scale
+                drawn += 1
+                if count > 1:
+                    merged_slices += count
+                    canvas.create_rectangle(x1, top, max(x2, x1 + 1), bottom,
+                                            fill=self.MERGED_COLOR, outline="")
+                    continue
+                canvas.create_rectangle(x1, top, max(x2, x1 + 1), bottom,
+                                        fill=self.PALETTE[slice_id % len(self.PALETTE)],
+                                        outline="black" if x2 - x1 >= 6 else "")
+                label = str(timeline.labels[slice_id])
+                if x2 - x1 >= 7 * len(label) + 6:
+                    canvas.create_text((x1 + x2) / 2, (top + bottom) / 2, text=label,
+                                       font=("Helvetica", 8))
+                marker = timeline.markers[slice_id]
+                if marker is not None and view_start <= marker < start:
+                    x = left + (marker - view_start) * scale
+                    canvas.create_line(x, top - bar_pad, x, bottom + bar_pad, dash=(4, 2))
+        
+        # Labels and status line
+        canvas.create_text(right, axis_y + 28, text="Time (ms)", anchor="e", font=("Helvetica", 8))
+        hint = (f"Rows {first + 1}-{last} of {len(timeline.rows)}  ·  "
+                f"{view_start:g}-{view_end:g} ms  ·  tick {step:g}  ·  {drawn} bars")
+        if merged_slices:
+            hint += f" ({merged_slices} jobs merged)"
+        canvas.create_text(left, axis_y + 28, text=hint, anchor="w",
+                           font=("Helvetica", 8), fill="#616161")
+        
+        if self.xscrollbar is not None:
+            span = self._span()
+            self.xscrollbar.set((view_start - timeline.start) / span,
+                                (view_end - timeline.start) / span)
+        if self.yscrollbar is not None and timeline.rows:
+            self.yscrollbar.set(first / len(timeline.rows), last / len(timeline.rows))
+        return drawn
+
+
 def create_resource_allocation_canvas(parent):
     """Create a canvas for resource allocation matrix display"""
     canvas = tk.Canvas(parent, bg="white", height=200)